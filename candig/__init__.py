@@ -1,5 +0,0 @@
-"""
-CanDIG stand alone metadata service
-"""
-
-__import__('pkg_resources').declare_namespace(__name__)
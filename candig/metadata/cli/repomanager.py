@@ -1217,491 +1217,284 @@ class RepoManager(object):
             "-t", "--transcript", action="store_true", default=False,
             help="sets the quantification type to transcript")
 
-    @classmethod
-    def getParser(cls):
+    # The subcommands, each with its help text, runner and the
+    # classmethods that add its arguments (with any extra arguments
+    # those take)
+    _subcommands = (
+        ("init", "Initialize a data repository",
+         "init", ("addRepoArgument", "addForceOption")),
+        ("verify", "Verifies the repository by examing all data files",
+         "verify", ("addRepoArgument",)),
+        ("list", "List the contents of the repo",
+         "list", ("addRepoArgument",)),
+        ("list-announcements",
+         "List the announcements in"
+         "the repo.",
+         "listAnnouncements", ("addRepoArgument",)),
+        ("clear-announcements",
+         "List the announcements in"
+         "the repo.",
+         "clearAnnouncements", ("addRepoArgument",)),
+        ("add-dataset", "Add a dataset to the data repo",
+         "addDataset",
+         ("addRepoArgument", "addDatasetNameArgument", "addAttributesArgument",
+          ("addDescriptionOption", "dataset"))),
+        ("remove-dataset", "Remove a dataset from the data repo",
+         "removeDataset",
+         ("addRepoArgument", "addDatasetNameArgument", "addForceOption")),
+        ("add-dataset-duo", "Add DUO info to a dataset",
+         "addDatasetDuo",
+         ("addRepoArgument", "addDatasetNameArgument", "addDuoArgument")),
+        ("remove-dataset-duo", "Remove DUO info from a dataset",
+         "removeDatasetDuo",
+         ("addRepoArgument", "addDatasetNameArgument", "addForceOption")),
+        ("add-ontology",
+         "Adds an ontology in OBO format to the repo. Currently, "
+         "a sequence ontology (SO) instance is required to translate "
+         "ontology term names held in annotations to ontology IDs. "
+         "Sequence ontology files can be found at "
+         "https://github.com/The-Sequence-Ontology/SO-Ontologies",
+         "addOntology",
+         ("addRepoArgument",
+          ("addFilePathArgument",
+           "The path of the OBO file defining this ontology."),
+          "addRelativePathOption", ("addNameOption", "ontology"))),
+        ("remove-ontology", "Remove an ontology from the repo",
+         "removeOntology",
+         ("addRepoArgument", "addOntologyNameArgument", "addForceOption")),
+        ("add-patient", "Add an Patient to the dataset",
+         "addPatient",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addPatientNameArgument", "addPatientArgument")),
+        ("remove-patient", "Remove an Patient from the repo",
+         "removePatient",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addPatientNameArgument", "addForceOption")),
+        ("add-enrollment", "Add an Enrollment to the dataset",
+         "addEnrollment",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addEnrollmentNameArgument", "addEnrollmentArgument")),
+        ("remove-enrollment", "Remove an Enrollment from the repo",
+         "removeEnrollment",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addEnrollmentNameArgument", "addForceOption")),
+        ("add-consent", "Add an Consent to the dataset",
+         "addConsent",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addConsentNameArgument", "addConsentArgument")),
+        ("remove-consent", "Remove an Consent from the repo",
+         "removeConsent",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addConsentNameArgument", "addForceOption")),
+        ("add-diagnosis", "Add an Diagnosis to the dataset",
+         "addDiagnosis",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addDiagnosisNameArgument", "addDiagnosisArgument")),
+        ("remove-diagnosis", "Remove an Diagnosis from the repo",
+         "removeDiagnosis",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addDiagnosisNameArgument", "addForceOption")),
+        ("add-sample", "Add an Sample to the dataset",
+         "addSample",
+         ("addRepoArgument", "addDatasetNameArgument", "addSampleNameArgument",
+          "addSampleArgument")),
+        ("remove-sample", "Remove an Sample from the repo",
+         "removeSample",
+         ("addRepoArgument", "addDatasetNameArgument", "addSampleNameArgument",
+          "addForceOption")),
+        ("add-treatment", "Add an Treatment to the dataset",
+         "addTreatment",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addTreatmentNameArgument", "addTreatmentArgument")),
+        ("remove-treatment", "Remove an Treatment from the repo",
+         "removeTreatment",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addTreatmentNameArgument", "addForceOption")),
+        ("add-outcome", "Add an Outcome to the dataset",
+         "addOutcome",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addOutcomeNameArgument", "addOutcomeArgument")),
+        ("remove-outcome", "Remove an Outcome from the repo",
+         "removeOutcome",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addOutcomeNameArgument", "addForceOption")),
+        ("add-complication", "Add an Complication to the dataset",
+         "addComplication",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addComplicationNameArgument", "addComplicationArgument")),
+        ("remove-complication", "Remove an Complication from the repo",
+         "removeComplication",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addComplicationNameArgument", "addForceOption")),
+        ("add-tumourboard", "Add an Tumourboard to the dataset",
+         "addTumourboard",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addTumourboardNameArgument", "addTumourboardArgument")),
+        ("remove-tumourboard", "Remove an Tumourboard from the repo",
+         "removeTumourboard",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addTumourboardNameArgument", "addForceOption")),
+        ("add-chemotherapy", "Add an Chemotherapy to the dataset",
+         "addChemotherapy",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addChemotherapyNameArgument", "addChemotherapyArgument")),
+        ("remove-chemotherapy", "Remove an Chemotherapy from the repo",
+         "removeChemotherapy",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addChemotherapyNameArgument", "addForceOption")),
+        ("add-radiotherapy", "Add an Radiotherapy to the dataset",
+         "addRadiotherapy",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addRadiotherapyNameArgument", "addRadiotherapyArgument")),
+        ("remove-radiotherapy", "Remove an Radiotherapy from the repo",
+         "removeRadiotherapy",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addRadiotherapyNameArgument", "addForceOption")),
+        ("add-surgery", "Add an Surgery to the dataset",
+         "addSurgery",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addSurgeryNameArgument", "addSurgeryArgument")),
+        ("remove-surgery", "Remove an Surgery from the repo",
+         "removeSurgery",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addSurgeryNameArgument", "addForceOption")),
+        ("add-immunotherapy", "Add an Immunotherapy to the dataset",
+         "addImmunotherapy",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addImmunotherapyNameArgument", "addImmunotherapyArgument")),
+        ("remove-immunotherapy", "Remove an Immunotherapy from the repo",
+         "removeImmunotherapy",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addImmunotherapyNameArgument", "addForceOption")),
+        ("add-celltransplant", "Add an Celltransplant to the dataset",
+         "addCelltransplant",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addCelltransplantNameArgument", "addCelltransplantArgument")),
+        ("remove-celltransplant", "Remove an Celltransplant from the repo",
+         "removeCelltransplant",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addCelltransplantNameArgument", "addForceOption")),
+        ("add-slide", "Add an Slide to the dataset",
+         "addSlide",
+         ("addRepoArgument", "addDatasetNameArgument", "addSlideNameArgument",
+          "addSlideArgument")),
+        ("remove-slide", "Remove an Slide from the repo",
+         "removeSlide",
+         ("addRepoArgument", "addDatasetNameArgument", "addSlideNameArgument",
+          "addForceOption")),
+        ("add-study", "Add an Study to the dataset",
+         "addStudy",
+         ("addRepoArgument", "addDatasetNameArgument", "addStudyNameArgument",
+          "addStudyArgument")),
+        ("remove-study", "Remove an Study from the repo",
+         "removeStudy",
+         ("addRepoArgument", "addDatasetNameArgument", "addStudyNameArgument",
+          "addForceOption")),
+        ("add-labtest", "Add an Labtest to the dataset",
+         "addLabtest",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addLabtestNameArgument", "addLabtestArgument")),
+        ("remove-labtest", "Remove an Labtest from the repo",
+         "removeLabtest",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addLabtestNameArgument", "addForceOption")),
+        ("add-extraction", "Add a Extraction to the dataset",
+         "addExtraction",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addExtractionNameArgument", "addExtractionArgument")),
+        ("remove-extraction", "Remove an Extraction from the repo",
+         "removeExtraction",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addExtractionNameArgument", "addForceOption")),
+        ("add-sequencing", "Add a Sequencing to the dataset",
+         "addSequencing",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addSequencingNameArgument", "addSequencingArgument")),
+        ("remove-sequencing", "Remove an Sequencing from the repo",
+         "removeSequencing",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addSequencingNameArgument", "addForceOption")),
+        ("add-alignment", "Add a Alignment to the dataset",
+         "addAlignment",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addAlignmentNameArgument", "addAlignmentArgument")),
+        ("remove-alignment", "Remove an Alignment from the repo",
+         "removeAlignment",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addAlignmentNameArgument", "addForceOption")),
+        ("add-variantcalling", "Add a VariantCalling to the dataset",
+         "addVariantCalling",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addVariantCallingNameArgument", "addVariantCallingArgument")),
+        ("remove-variantcalling", "Remove an VariantCalling from the repo",
+         "removeVariantCalling",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addVariantCallingNameArgument", "addForceOption")),
+        ("add-fusiondetection", "Add a FusionDetection to the dataset",
+         "addFusionDetection",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addFusionDetectionNameArgument", "addFusionDetectionArgument")),
+        ("remove-fusiondetection", "Remove an FusionDetection from the repo",
+         "removeFusionDetection",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addFusionDetectionNameArgument", "addForceOption")),
+        ("add-expressionanalysis", "Add a ExpressionAnalysis to the dataset",
+         "addExpressionAnalysis",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addExpressionAnalysisNameArgument",
+          "addExpressionAnalysisArgument")),
+        ("remove-expressionanalysis",
+         "Remove an ExpressionAnalysis from the repo",
+         "removeExpressionAnalysis",
+         ("addRepoArgument", "addDatasetNameArgument",
+          "addExpressionAnalysisNameArgument", "addForceOption")),
+    )
+
+    @classmethod
+    def _getSubcommandName(cls, args):
+        """
+        Returns the subcommand named in the specified arguments, or None
+        if there isn't one (e.g. for --help or a mistyped subcommand).
+        """
+        for arg in args:
+            if not arg.startswith("-"):
+                names = [name for name, _, _, _ in cls._subcommands]
+                return arg if arg in names else None
+        return None
+
+    @classmethod
+    def getParser(cls, args=None):
+        """
+        Returns the argument parser. When args is given, only the
+        subparser of the subcommand it names is built, as that is all
+        that is needed to parse it; otherwise, all of them are.
+        """
         parser = common_cli.createArgumentParser(
             "CanDIG data repository management tool")
         subparsers = parser.add_subparsers(title='subcommands',)
         cli.addVersionArgument(parser)
 
-        initParser = common_cli.addSubparser(
-            subparsers, "init", "Initialize a data repository")
-        initParser.set_defaults(runner="init")
-        cls.addRepoArgument(initParser)
-        cls.addForceOption(initParser)
-
-        verifyParser = common_cli.addSubparser(
-            subparsers, "verify",
-            "Verifies the repository by examing all data files")
-        verifyParser.set_defaults(runner="verify")
-        cls.addRepoArgument(verifyParser)
-
-        listParser = common_cli.addSubparser(
-            subparsers, "list", "List the contents of the repo")
-        listParser.set_defaults(runner="list")
-        cls.addRepoArgument(listParser)
-
-        listAnnouncementsParser = common_cli.addSubparser(
-            subparsers, "list-announcements", "List the announcements in"
-                                              "the repo.")
-        listAnnouncementsParser.set_defaults(runner="listAnnouncements")
-        cls.addRepoArgument(listAnnouncementsParser)
-
-        clearAnnouncementsParser = common_cli.addSubparser(
-            subparsers, "clear-announcements", "List the announcements in"
-                                               "the repo.")
-        clearAnnouncementsParser.set_defaults(runner="clearAnnouncements")
-        cls.addRepoArgument(clearAnnouncementsParser)
-
-        addDatasetParser = common_cli.addSubparser(
-            subparsers, "add-dataset", "Add a dataset to the data repo")
-        addDatasetParser.set_defaults(runner="addDataset")
-        cls.addRepoArgument(addDatasetParser)
-        cls.addDatasetNameArgument(addDatasetParser)
-        cls.addAttributesArgument(addDatasetParser)
-        cls.addDescriptionOption(addDatasetParser, "dataset")
-
-        removeDatasetParser = common_cli.addSubparser(
-            subparsers, "remove-dataset",
-            "Remove a dataset from the data repo")
-        removeDatasetParser.set_defaults(runner="removeDataset")
-        cls.addRepoArgument(removeDatasetParser)
-        cls.addDatasetNameArgument(removeDatasetParser)
-        cls.addForceOption(removeDatasetParser)
-
-        addDatasetDuoParser = common_cli.addSubparser(
-            subparsers, "add-dataset-duo", "Add DUO info to a dataset")
-        addDatasetDuoParser.set_defaults(runner="addDatasetDuo")
-        cls.addRepoArgument(addDatasetDuoParser)
-        cls.addDatasetNameArgument(addDatasetDuoParser)
-        cls.addDuoArgument(addDatasetDuoParser)
-
-        removeDatasetDuoParser = common_cli.addSubparser(
-            subparsers, "remove-dataset-duo", "Remove DUO info from a dataset")
-        removeDatasetDuoParser.set_defaults(runner="removeDatasetDuo")
-        cls.addRepoArgument(removeDatasetDuoParser)
-        cls.addDatasetNameArgument(removeDatasetDuoParser)
-        cls.addForceOption(removeDatasetDuoParser)
-
-        addOntologyParser = common_cli.addSubparser(
-            subparsers, "add-ontology",
-            "Adds an ontology in OBO format to the repo. Currently, "
-            "a sequence ontology (SO) instance is required to translate "
-            "ontology term names held in annotations to ontology IDs. "
-            "Sequence ontology files can be found at "
-            "https://github.com/The-Sequence-Ontology/SO-Ontologies")
-        addOntologyParser.set_defaults(runner="addOntology")
-        cls.addRepoArgument(addOntologyParser)
-        cls.addFilePathArgument(
-            addOntologyParser,
-            "The path of the OBO file defining this ontology.")
-        cls.addRelativePathOption(addOntologyParser)
-        cls.addNameOption(addOntologyParser, "ontology")
-
-        removeOntologyParser = common_cli.addSubparser(
-            subparsers, "remove-ontology",
-            "Remove an ontology from the repo")
-        removeOntologyParser.set_defaults(runner="removeOntology")
-        cls.addRepoArgument(removeOntologyParser)
-        cls.addOntologyNameArgument(removeOntologyParser)
-        cls.addForceOption(removeOntologyParser)
-
-        addPatientParser = common_cli.addSubparser(
-            subparsers, "add-patient", "Add an Patient to the dataset")
-        addPatientParser.set_defaults(runner="addPatient")
-        cls.addRepoArgument(addPatientParser)
-        cls.addDatasetNameArgument(addPatientParser)
-        cls.addPatientNameArgument(addPatientParser)
-        cls.addPatientArgument(addPatientParser)
-
-        removePatientParser = common_cli.addSubparser(
-            subparsers, "remove-patient",
-            "Remove an Patient from the repo")
-        removePatientParser.set_defaults(runner="removePatient")
-        cls.addRepoArgument(removePatientParser)
-        cls.addDatasetNameArgument(removePatientParser)
-        cls.addPatientNameArgument(removePatientParser)
-        cls.addForceOption(removePatientParser)
-
-        addEnrollmentParser = common_cli.addSubparser(
-            subparsers, "add-enrollment", "Add an Enrollment to the dataset")
-        addEnrollmentParser.set_defaults(runner="addEnrollment")
-        cls.addRepoArgument(addEnrollmentParser)
-        cls.addDatasetNameArgument(addEnrollmentParser)
-        cls.addEnrollmentNameArgument(addEnrollmentParser)
-        cls.addEnrollmentArgument(addEnrollmentParser)
-
-        removeEnrollmentParser = common_cli.addSubparser(
-            subparsers, "remove-enrollment",
-            "Remove an Enrollment from the repo")
-        removeEnrollmentParser.set_defaults(runner="removeEnrollment")
-        cls.addRepoArgument(removeEnrollmentParser)
-        cls.addDatasetNameArgument(removeEnrollmentParser)
-        cls.addEnrollmentNameArgument(removeEnrollmentParser)
-        cls.addForceOption(removeEnrollmentParser)
-
-        addConsentParser = common_cli.addSubparser(
-            subparsers, "add-consent", "Add an Consent to the dataset")
-        addConsentParser.set_defaults(runner="addConsent")
-        cls.addRepoArgument(addConsentParser)
-        cls.addDatasetNameArgument(addConsentParser)
-        cls.addConsentNameArgument(addConsentParser)
-        cls.addConsentArgument(addConsentParser)
-
-        removeConsentParser = common_cli.addSubparser(
-            subparsers, "remove-consent",
-            "Remove an Consent from the repo")
-        removeConsentParser.set_defaults(runner="removeConsent")
-        cls.addRepoArgument(removeConsentParser)
-        cls.addDatasetNameArgument(removeConsentParser)
-        cls.addConsentNameArgument(removeConsentParser)
-        cls.addForceOption(removeConsentParser)
-
-        addDiagnosisParser = common_cli.addSubparser(
-            subparsers, "add-diagnosis", "Add an Diagnosis to the dataset")
-        addDiagnosisParser.set_defaults(runner="addDiagnosis")
-        cls.addRepoArgument(addDiagnosisParser)
-        cls.addDatasetNameArgument(addDiagnosisParser)
-        cls.addDiagnosisNameArgument(addDiagnosisParser)
-        cls.addDiagnosisArgument(addDiagnosisParser)
-
-        removeDiagnosisParser = common_cli.addSubparser(
-            subparsers, "remove-diagnosis",
-            "Remove an Diagnosis from the repo")
-        removeDiagnosisParser.set_defaults(runner="removeDiagnosis")
-        cls.addRepoArgument(removeDiagnosisParser)
-        cls.addDatasetNameArgument(removeDiagnosisParser)
-        cls.addDiagnosisNameArgument(removeDiagnosisParser)
-        cls.addForceOption(removeDiagnosisParser)
-
-        addSampleParser = common_cli.addSubparser(
-            subparsers, "add-sample", "Add an Sample to the dataset")
-        addSampleParser.set_defaults(runner="addSample")
-        cls.addRepoArgument(addSampleParser)
-        cls.addDatasetNameArgument(addSampleParser)
-        cls.addSampleNameArgument(addSampleParser)
-        cls.addSampleArgument(addSampleParser)
-
-        removeSampleParser = common_cli.addSubparser(
-            subparsers, "remove-sample",
-            "Remove an Sample from the repo")
-        removeSampleParser.set_defaults(runner="removeSample")
-        cls.addRepoArgument(removeSampleParser)
-        cls.addDatasetNameArgument(removeSampleParser)
-        cls.addSampleNameArgument(removeSampleParser)
-        cls.addForceOption(removeSampleParser)
-
-        addTreatmentParser = common_cli.addSubparser(
-            subparsers, "add-treatment", "Add an Treatment to the dataset")
-        addTreatmentParser.set_defaults(runner="addTreatment")
-        cls.addRepoArgument(addTreatmentParser)
-        cls.addDatasetNameArgument(addTreatmentParser)
-        cls.addTreatmentNameArgument(addTreatmentParser)
-        cls.addTreatmentArgument(addTreatmentParser)
-
-        removeTreatmentParser = common_cli.addSubparser(
-            subparsers, "remove-treatment",
-            "Remove an Treatment from the repo")
-        removeTreatmentParser.set_defaults(runner="removeTreatment")
-        cls.addRepoArgument(removeTreatmentParser)
-        cls.addDatasetNameArgument(removeTreatmentParser)
-        cls.addTreatmentNameArgument(removeTreatmentParser)
-        cls.addForceOption(removeTreatmentParser)
-
-        addOutcomeParser = common_cli.addSubparser(
-            subparsers, "add-outcome", "Add an Outcome to the dataset")
-        addOutcomeParser.set_defaults(runner="addOutcome")
-        cls.addRepoArgument(addOutcomeParser)
-        cls.addDatasetNameArgument(addOutcomeParser)
-        cls.addOutcomeNameArgument(addOutcomeParser)
-        cls.addOutcomeArgument(addOutcomeParser)
-
-        removeOutcomeParser = common_cli.addSubparser(
-            subparsers, "remove-outcome",
-            "Remove an Outcome from the repo")
-        removeOutcomeParser.set_defaults(runner="removeOutcome")
-        cls.addRepoArgument(removeOutcomeParser)
-        cls.addDatasetNameArgument(removeOutcomeParser)
-        cls.addOutcomeNameArgument(removeOutcomeParser)
-        cls.addForceOption(removeOutcomeParser)
-
-        addComplicationParser = common_cli.addSubparser(
-            subparsers, "add-complication", "Add an Complication to the dataset")
-        addComplicationParser.set_defaults(runner="addComplication")
-        cls.addRepoArgument(addComplicationParser)
-        cls.addDatasetNameArgument(addComplicationParser)
-        cls.addComplicationNameArgument(addComplicationParser)
-        cls.addComplicationArgument(addComplicationParser)
-
-        removeComplicationParser = common_cli.addSubparser(
-            subparsers, "remove-complication",
-            "Remove an Complication from the repo")
-        removeComplicationParser.set_defaults(runner="removeComplication")
-        cls.addRepoArgument(removeComplicationParser)
-        cls.addDatasetNameArgument(removeComplicationParser)
-        cls.addComplicationNameArgument(removeComplicationParser)
-        cls.addForceOption(removeComplicationParser)
-
-        addTumourboardParser = common_cli.addSubparser(
-            subparsers, "add-tumourboard", "Add an Tumourboard to the dataset")
-        addTumourboardParser.set_defaults(runner="addTumourboard")
-        cls.addRepoArgument(addTumourboardParser)
-        cls.addDatasetNameArgument(addTumourboardParser)
-        cls.addTumourboardNameArgument(addTumourboardParser)
-        cls.addTumourboardArgument(addTumourboardParser)
-
-        removeTumourboardParser = common_cli.addSubparser(
-            subparsers, "remove-tumourboard",
-            "Remove an Tumourboard from the repo")
-        removeTumourboardParser.set_defaults(runner="removeTumourboard")
-        cls.addRepoArgument(removeTumourboardParser)
-        cls.addDatasetNameArgument(removeTumourboardParser)
-        cls.addTumourboardNameArgument(removeTumourboardParser)
-        cls.addForceOption(removeTumourboardParser)
-
-        addChemotherapyParser = common_cli.addSubparser(
-            subparsers, "add-chemotherapy", "Add an Chemotherapy to the dataset")
-        addChemotherapyParser.set_defaults(runner="addChemotherapy")
-        cls.addRepoArgument(addChemotherapyParser)
-        cls.addDatasetNameArgument(addChemotherapyParser)
-        cls.addChemotherapyNameArgument(addChemotherapyParser)
-        cls.addChemotherapyArgument(addChemotherapyParser)
-
-        removeChemotherapyParser = common_cli.addSubparser(
-            subparsers, "remove-chemotherapy",
-            "Remove an Chemotherapy from the repo")
-        removeChemotherapyParser.set_defaults(runner="removeChemotherapy")
-        cls.addRepoArgument(removeChemotherapyParser)
-        cls.addDatasetNameArgument(removeChemotherapyParser)
-        cls.addChemotherapyNameArgument(removeChemotherapyParser)
-        cls.addForceOption(removeChemotherapyParser)
-
-        addRadiotherapyParser = common_cli.addSubparser(
-            subparsers, "add-radiotherapy", "Add an Radiotherapy to the dataset")
-        addRadiotherapyParser.set_defaults(runner="addRadiotherapy")
-        cls.addRepoArgument(addRadiotherapyParser)
-        cls.addDatasetNameArgument(addRadiotherapyParser)
-        cls.addRadiotherapyNameArgument(addRadiotherapyParser)
-        cls.addRadiotherapyArgument(addRadiotherapyParser)
-
-        removeRadiotherapyParser = common_cli.addSubparser(
-            subparsers, "remove-radiotherapy",
-            "Remove an Radiotherapy from the repo")
-        removeRadiotherapyParser.set_defaults(runner="removeRadiotherapy")
-        cls.addRepoArgument(removeRadiotherapyParser)
-        cls.addDatasetNameArgument(removeRadiotherapyParser)
-        cls.addRadiotherapyNameArgument(removeRadiotherapyParser)
-        cls.addForceOption(removeRadiotherapyParser)
-
-        addSurgeryParser = common_cli.addSubparser(
-            subparsers, "add-surgery", "Add an Surgery to the dataset")
-        addSurgeryParser.set_defaults(runner="addSurgery")
-        cls.addRepoArgument(addSurgeryParser)
-        cls.addDatasetNameArgument(addSurgeryParser)
-        cls.addSurgeryNameArgument(addSurgeryParser)
-        cls.addSurgeryArgument(addSurgeryParser)
-
-        removeSurgeryParser = common_cli.addSubparser(
-            subparsers, "remove-surgery",
-            "Remove an Surgery from the repo")
-        removeSurgeryParser.set_defaults(runner="removeSurgery")
-        cls.addRepoArgument(removeSurgeryParser)
-        cls.addDatasetNameArgument(removeSurgeryParser)
-        cls.addSurgeryNameArgument(removeSurgeryParser)
-        cls.addForceOption(removeSurgeryParser)
-
-        addImmunotherapyParser = common_cli.addSubparser(
-            subparsers, "add-immunotherapy", "Add an Immunotherapy to the dataset")
-        addImmunotherapyParser.set_defaults(runner="addImmunotherapy")
-        cls.addRepoArgument(addImmunotherapyParser)
-        cls.addDatasetNameArgument(addImmunotherapyParser)
-        cls.addImmunotherapyNameArgument(addImmunotherapyParser)
-        cls.addImmunotherapyArgument(addImmunotherapyParser)
-
-        removeImmunotherapyParser = common_cli.addSubparser(
-            subparsers, "remove-immunotherapy",
-            "Remove an Immunotherapy from the repo")
-        removeImmunotherapyParser.set_defaults(runner="removeImmunotherapy")
-        cls.addRepoArgument(removeImmunotherapyParser)
-        cls.addDatasetNameArgument(removeImmunotherapyParser)
-        cls.addImmunotherapyNameArgument(removeImmunotherapyParser)
-        cls.addForceOption(removeImmunotherapyParser)
-
-        addCelltransplantParser = common_cli.addSubparser(
-            subparsers, "add-celltransplant", "Add an Celltransplant to the dataset")
-        addCelltransplantParser.set_defaults(runner="addCelltransplant")
-        cls.addRepoArgument(addCelltransplantParser)
-        cls.addDatasetNameArgument(addCelltransplantParser)
-        cls.addCelltransplantNameArgument(addCelltransplantParser)
-        cls.addCelltransplantArgument(addCelltransplantParser)
-
-        removeCelltransplantParser = common_cli.addSubparser(
-            subparsers, "remove-celltransplant",
-            "Remove an Celltransplant from the repo")
-        removeCelltransplantParser.set_defaults(runner="removeCelltransplant")
-        cls.addRepoArgument(removeCelltransplantParser)
-        cls.addDatasetNameArgument(removeCelltransplantParser)
-        cls.addCelltransplantNameArgument(removeCelltransplantParser)
-        cls.addForceOption(removeCelltransplantParser)
-
-        addSlideParser = common_cli.addSubparser(
-            subparsers, "add-slide", "Add an Slide to the dataset")
-        addSlideParser.set_defaults(runner="addSlide")
-        cls.addRepoArgument(addSlideParser)
-        cls.addDatasetNameArgument(addSlideParser)
-        cls.addSlideNameArgument(addSlideParser)
-        cls.addSlideArgument(addSlideParser)
-
-        removeSlideParser = common_cli.addSubparser(
-            subparsers, "remove-slide",
-            "Remove an Slide from the repo")
-        removeSlideParser.set_defaults(runner="removeSlide")
-        cls.addRepoArgument(removeSlideParser)
-        cls.addDatasetNameArgument(removeSlideParser)
-        cls.addSlideNameArgument(removeSlideParser)
-        cls.addForceOption(removeSlideParser)
-
-        addStudyParser = common_cli.addSubparser(
-            subparsers, "add-study", "Add an Study to the dataset")
-        addStudyParser.set_defaults(runner="addStudy")
-        cls.addRepoArgument(addStudyParser)
-        cls.addDatasetNameArgument(addStudyParser)
-        cls.addStudyNameArgument(addStudyParser)
-        cls.addStudyArgument(addStudyParser)
-
-        removeStudyParser = common_cli.addSubparser(
-            subparsers, "remove-study",
-            "Remove an Study from the repo")
-        removeStudyParser.set_defaults(runner="removeStudy")
-        cls.addRepoArgument(removeStudyParser)
-        cls.addDatasetNameArgument(removeStudyParser)
-        cls.addStudyNameArgument(removeStudyParser)
-        cls.addForceOption(removeStudyParser)
-
-        addLabtestParser = common_cli.addSubparser(
-            subparsers, "add-labtest", "Add an Labtest to the dataset")
-        addLabtestParser.set_defaults(runner="addLabtest")
-        cls.addRepoArgument(addLabtestParser)
-        cls.addDatasetNameArgument(addLabtestParser)
-        cls.addLabtestNameArgument(addLabtestParser)
-        cls.addLabtestArgument(addLabtestParser)
-
-        removeLabtestParser = common_cli.addSubparser(
-            subparsers, "remove-labtest",
-            "Remove an Labtest from the repo")
-        removeLabtestParser.set_defaults(runner="removeLabtest")
-        cls.addRepoArgument(removeLabtestParser)
-        cls.addDatasetNameArgument(removeLabtestParser)
-        cls.addLabtestNameArgument(removeLabtestParser)
-        cls.addForceOption(removeLabtestParser)
-
-        addExtractionParser = common_cli.addSubparser(
-            subparsers, "add-extraction", "Add a Extraction to the dataset")
-        addExtractionParser.set_defaults(runner="addExtraction")
-        cls.addRepoArgument(addExtractionParser)
-        cls.addDatasetNameArgument(addExtractionParser)
-        cls.addExtractionNameArgument(addExtractionParser)
-        cls.addExtractionArgument(addExtractionParser)
-
-        removeExtractionParser = common_cli.addSubparser(
-            subparsers, "remove-extraction",
-            "Remove an Extraction from the repo")
-        removeExtractionParser.set_defaults(runner="removeExtraction")
-        cls.addRepoArgument(removeExtractionParser)
-        cls.addDatasetNameArgument(removeExtractionParser)
-        cls.addExtractionNameArgument(removeExtractionParser)
-        cls.addForceOption(removeExtractionParser)
-
-        addSequencingParser = common_cli.addSubparser(
-            subparsers, "add-sequencing", "Add a Sequencing to the dataset")
-        addSequencingParser.set_defaults(runner="addSequencing")
-        cls.addRepoArgument(addSequencingParser)
-        cls.addDatasetNameArgument(addSequencingParser)
-        cls.addSequencingNameArgument(addSequencingParser)
-        cls.addSequencingArgument(addSequencingParser)
-
-        removeSequencingParser = common_cli.addSubparser(
-            subparsers, "remove-sequencing",
-            "Remove an Sequencing from the repo")
-        removeSequencingParser.set_defaults(runner="removeSequencing")
-        cls.addRepoArgument(removeSequencingParser)
-        cls.addDatasetNameArgument(removeSequencingParser)
-        cls.addSequencingNameArgument(removeSequencingParser)
-        cls.addForceOption(removeSequencingParser)
-
-        addAlignmentParser = common_cli.addSubparser(
-            subparsers, "add-alignment", "Add a Alignment to the dataset")
-        addAlignmentParser.set_defaults(runner="addAlignment")
-        cls.addRepoArgument(addAlignmentParser)
-        cls.addDatasetNameArgument(addAlignmentParser)
-        cls.addAlignmentNameArgument(addAlignmentParser)
-        cls.addAlignmentArgument(addAlignmentParser)
-
-        removeAlignmentParser = common_cli.addSubparser(
-            subparsers, "remove-alignment",
-            "Remove an Alignment from the repo")
-        removeAlignmentParser.set_defaults(runner="removeAlignment")
-        cls.addRepoArgument(removeAlignmentParser)
-        cls.addDatasetNameArgument(removeAlignmentParser)
-        cls.addAlignmentNameArgument(removeAlignmentParser)
-        cls.addForceOption(removeAlignmentParser)
-
-        addVariantCallingParser = common_cli.addSubparser(
-            subparsers, "add-variantcalling", "Add a VariantCalling to the dataset")
-        addVariantCallingParser.set_defaults(runner="addVariantCalling")
-        cls.addRepoArgument(addVariantCallingParser)
-        cls.addDatasetNameArgument(addVariantCallingParser)
-        cls.addVariantCallingNameArgument(addVariantCallingParser)
-        cls.addVariantCallingArgument(addVariantCallingParser)
-
-        removeVariantCallingParser = common_cli.addSubparser(
-            subparsers, "remove-variantcalling",
-            "Remove an VariantCalling from the repo")
-        removeVariantCallingParser.set_defaults(runner="removeVariantCalling")
-        cls.addRepoArgument(removeVariantCallingParser)
-        cls.addDatasetNameArgument(removeVariantCallingParser)
-        cls.addVariantCallingNameArgument(removeVariantCallingParser)
-        cls.addForceOption(removeVariantCallingParser)
-
-        addFusionDetectionParser = common_cli.addSubparser(
-            subparsers, "add-fusiondetection", "Add a FusionDetection to the dataset")
-        addFusionDetectionParser.set_defaults(runner="addFusionDetection")
-        cls.addRepoArgument(addFusionDetectionParser)
-        cls.addDatasetNameArgument(addFusionDetectionParser)
-        cls.addFusionDetectionNameArgument(addFusionDetectionParser)
-        cls.addFusionDetectionArgument(addFusionDetectionParser)
-
-        removeFusionDetectionParser = common_cli.addSubparser(
-            subparsers, "remove-fusiondetection",
-            "Remove an FusionDetection from the repo")
-        removeFusionDetectionParser.set_defaults(runner="removeFusionDetection")
-        cls.addRepoArgument(removeFusionDetectionParser)
-        cls.addDatasetNameArgument(removeFusionDetectionParser)
-        cls.addFusionDetectionNameArgument(removeFusionDetectionParser)
-        cls.addForceOption(removeFusionDetectionParser)
-
-        addExpressionAnalysisParser = common_cli.addSubparser(
-            subparsers, "add-expressionanalysis", "Add a ExpressionAnalysis to the dataset")
-        addExpressionAnalysisParser.set_defaults(runner="addExpressionAnalysis")
-        cls.addRepoArgument(addExpressionAnalysisParser)
-        cls.addDatasetNameArgument(addExpressionAnalysisParser)
-        cls.addExpressionAnalysisNameArgument(addExpressionAnalysisParser)
-        cls.addExpressionAnalysisArgument(addExpressionAnalysisParser)
-
-        removeExpressionAnalysisParser = common_cli.addSubparser(
-            subparsers, "remove-expressionanalysis",
-            "Remove an ExpressionAnalysis from the repo")
-        removeExpressionAnalysisParser.set_defaults(runner="removeExpressionAnalysis")
-        cls.addRepoArgument(removeExpressionAnalysisParser)
-        cls.addDatasetNameArgument(removeExpressionAnalysisParser)
-        cls.addExpressionAnalysisNameArgument(removeExpressionAnalysisParser)
-        cls.addForceOption(removeExpressionAnalysisParser)
+        subcommandName = None
+        if args is not None:
+            subcommandName = cls._getSubcommandName(args)
+        for name, helpText, runner, adders in cls._subcommands:
+            if subcommandName is not None and name != subcommandName:
+                continue
+            subparser = common_cli.addSubparser(subparsers, name, helpText)
+            subparser.set_defaults(runner=runner)
+            for adder in adders:
+                if isinstance(adder, str):
+                    adder = (adder,)
+                addMethod, adderArgs = adder[0], adder[1:]
+                getattr(cls, addMethod)(subparser, *adderArgs)
 
         return parser
 
     @classmethod
     def runCommand(cls, args):
-        parser = cls.getParser()
+        if args is None:
+            args = sys.argv[1:]
+        parser = cls.getParser(args)
         parsedArgs = parser.parse_args(args)
         if "runner" not in parsedArgs:
             parser.print_help()
@@ -464,6 +464,8 @@ class DatamodelObject(object):
         if parentContainer is not None:
             parentId = parentContainer.getCompoundId()
         self._compoundId = self.compoundIdClass(parentId, localId)
+        # The string form of the compoundId, built on first use
+        self._id = None
         self._attributes = {}
         self._objectAttr = {}
 
@@ -472,7 +474,9 @@ class DatamodelObject(object):
         Returns the string identifying this DatamodelObject within the
         server.
         """
-        return str(self._compoundId)
+        if self._id is None:
+            self._id = str(self._compoundId)
+        return self._id
 
     def getCompoundId(self):
         """
@@ -381,6 +381,156 @@ class Dataset(datamodel.DatamodelObject):
         self._expressionAnalysisNameMap[
             expressionAnalysis.getName()] = expressionAnalysis
 
+    @staticmethod
+    def _addMany(objects, batchIds, ids, idMap, nameMap):
+        """
+        Add a batch of objects to the specified id list and lookup maps in
+        a single pass, as the per-object add methods do one at a time.
+        batchIds are the ids of the objects, if the caller already has
+        them.
+        """
+        if batchIds is None:
+            batchIds = [obj.getId() for obj in objects]
+        idMap.update(zip(batchIds, objects))
+        ids.extend(batchIds)
+        nameMap.update((obj.getName(), obj) for obj in objects)
+
+    def addPatientMany(self, patients, ids=None):
+        """Add the specified patients to this dataset."""
+        self._addMany(
+            patients, ids, self._patientIds, self._patientIdMap,
+            self._patientNameMap)
+
+    def addEnrollmentMany(self, enrollments, ids=None):
+        """Add the specified enrollments to this dataset."""
+        self._addMany(
+            enrollments, ids, self._enrollmentIds, self._enrollmentIdMap,
+            self._enrollmentNameMap)
+
+    def addConsentMany(self, consents, ids=None):
+        """Add the specified consents to this dataset."""
+        self._addMany(
+            consents, ids, self._consentIds, self._consentIdMap,
+            self._consentNameMap)
+
+    def addDiagnosisMany(self, diagnoses, ids=None):
+        """Add the specified diagnoses to this dataset."""
+        self._addMany(
+            diagnoses, ids, self._diagnosisIds, self._diagnosisIdMap,
+            self._diagnosisNameMap)
+
+    def addSampleMany(self, samples, ids=None):
+        """Add the specified samples to this dataset."""
+        self._addMany(
+            samples, ids, self._sampleIds, self._sampleIdMap,
+            self._sampleNameMap)
+
+    def addTreatmentMany(self, treatments, ids=None):
+        """Add the specified treatments to this dataset."""
+        self._addMany(
+            treatments, ids, self._treatmentIds, self._treatmentIdMap,
+            self._treatmentNameMap)
+
+    def addOutcomeMany(self, outcomes, ids=None):
+        """Add the specified outcomes to this dataset."""
+        self._addMany(
+            outcomes, ids, self._outcomeIds, self._outcomeIdMap,
+            self._outcomeNameMap)
+
+    def addComplicationMany(self, complications, ids=None):
+        """Add the specified complications to this dataset."""
+        self._addMany(
+            complications, ids, self._complicationIds, self._complicationIdMap,
+            self._complicationNameMap)
+
+    def addTumourboardMany(self, tumourboards, ids=None):
+        """Add the specified tumourboards to this dataset."""
+        self._addMany(
+            tumourboards, ids, self._tumourboardIds, self._tumourboardIdMap,
+            self._tumourboardNameMap)
+
+    def addChemotherapyMany(self, chemotherapies, ids=None):
+        """Add the specified chemotherapies to this dataset."""
+        self._addMany(
+            chemotherapies, ids, self._chemotherapyIds,
+            self._chemotherapyIdMap, self._chemotherapyNameMap)
+
+    def addRadiotherapyMany(self, radiotherapies, ids=None):
+        """Add the specified radiotherapies to this dataset."""
+        self._addMany(
+            radiotherapies, ids, self._radiotherapyIds,
+            self._radiotherapyIdMap, self._radiotherapyNameMap)
+
+    def addSurgeryMany(self, surgeries, ids=None):
+        """Add the specified surgeries to this dataset."""
+        self._addMany(
+            surgeries, ids, self._surgeryIds, self._surgeryIdMap,
+            self._surgeryNameMap)
+
+    def addImmunotherapyMany(self, immunotherapies, ids=None):
+        """Add the specified immunotherapies to this dataset."""
+        self._addMany(
+            immunotherapies, ids, self._immunotherapyIds,
+            self._immunotherapyIdMap, self._immunotherapyNameMap)
+
+    def addCelltransplantMany(self, celltransplants, ids=None):
+        """Add the specified celltransplants to this dataset."""
+        self._addMany(
+            celltransplants, ids, self._celltransplantIds,
+            self._celltransplantIdMap, self._celltransplantNameMap)
+
+    def addSlideMany(self, slides, ids=None):
+        """Add the specified slides to this dataset."""
+        self._addMany(
+            slides, ids, self._slideIds, self._slideIdMap, self._slideNameMap)
+
+    def addStudyMany(self, studies, ids=None):
+        """Add the specified studies to this dataset."""
+        self._addMany(
+            studies, ids, self._studyIds, self._studyIdMap, self._studyNameMap)
+
+    def addLabtestMany(self, labtests, ids=None):
+        """Add the specified labtests to this dataset."""
+        self._addMany(
+            labtests, ids, self._labtestIds, self._labtestIdMap,
+            self._labtestNameMap)
+
+    def addExtractionMany(self, extractions, ids=None):
+        """Add the specified extractions to this dataset."""
+        self._addMany(
+            extractions, ids, self._extractionIds, self._extractionIdMap,
+            self._extractionNameMap)
+
+    def addSequencingMany(self, sequencings, ids=None):
+        """Add the specified sequencings to this dataset."""
+        self._addMany(
+            sequencings, ids, self._sequencingIds, self._sequencingIdMap,
+            self._sequencingNameMap)
+
+    def addAlignmentMany(self, alignments, ids=None):
+        """Add the specified alignments to this dataset."""
+        self._addMany(
+            alignments, ids, self._alignmentIds, self._alignmentIdMap,
+            self._alignmentNameMap)
+
+    def addVariantCallingMany(self, variantCallings, ids=None):
+        """Add the specified variantCallings to this dataset."""
+        self._addMany(
+            variantCallings, ids, self._variantCallingIds,
+            self._variantCallingIdMap, self._variantCallingNameMap)
+
+    def addFusionDetectionMany(self, fusionDetections, ids=None):
+        """Add the specified fusionDetections to this dataset."""
+        self._addMany(
+            fusionDetections, ids, self._fusionDetectionIds,
+            self._fusionDetectionIdMap, self._fusionDetectionNameMap)
+
+    def addExpressionAnalysisMany(self, expressionAnalyses, ids=None):
+        """Add the specified expressionAnalyses to this dataset."""
+        self._addMany(
+            expressionAnalyses, ids, self._expressionAnalysisIds,
+            self._expressionAnalysisIdMap, self._expressionAnalysisNameMap)
+
     def toProtocolElement(self, tier=0):
         """
         Populate dataset.
@@ -2,8 +2,11 @@
 The backing data store for the GA4GH server
 """
 
+import collections
+import functools
 import json
 import os
+import sqlite3
 import datetime
 
 import candig.metadata.datamodel as datamodel
@@ -17,9 +20,585 @@ import candig.metadata.protocol as protocol
 
 import peewee
 
+try:
+    # orjson is an optional, considerably faster drop-in for encoding the
+    # attributes column; the standard library is used when it is absent.
+    import orjson
+except ImportError:
+    _dumpJson = json.dumps
+else:
+    def _dumpJson(obj):
+        return orjson.dumps(obj).decode()
+
 MODE_READ = 'r'
 MODE_WRITE = 'w'
 
+# Number of rows fetched from the cursor at a time when loading the
+# clinical and pipeline tables into memory.
+_READ_BATCH_SIZE = 10000
+
+# Applied to every connection: sync to disk less often than the default
+# FULL mode, keep temporary tables and indices in memory and give the
+# page cache 64MiB (a negative cache_size is in KiB).
+_SQLITE_PRAGMAS = (
+    ('synchronous', 'normal'),
+    ('temp_store', 'memory'),
+    ('cache_size', -65536),
+)
+
+# Number of clinical or pipeline records built, checked for duplicates
+# and written at a time. Each batch's ids are looked up in one query, so
+# this stays under SQLite's default limit of 999 bound variables.
+_INSERT_BATCH_SIZE = 500
+
+# Most records carry no free-form attributes; this is what json.dumps
+# produces for them, so there is no need to run the encoder.
+_EMPTY_ATTRIBUTES = '{}'
+
+
+def _encodeAttributes(obj):
+    """
+    Returns the JSON encoding of the attributes of the specified
+    datamodel object, as stored in the attributes column.
+    """
+    attributes = obj.getAttributes()
+    if not attributes:
+        return _EMPTY_ATTRIBUTES
+    return _dumpJson(attributes)
+
+
+def _duplicateNameException(obj):
+    """
+    Returns the DuplicateNameException for the specified datamodel object.
+    The names are only looked up here, once an insert has been rejected.
+    """
+    return exceptions.DuplicateNameException(
+        obj.getLocalId(), obj.getParentContainer().getLocalId())
+
+
+def _getters(*columns):
+    """
+    Returns (column, expression) pairs for the specified columns, each of
+    which is read through the datamodel getter of the same name, e.g.
+    obj.getPatientId() for patientId.
+    """
+    return tuple(
+        (column, 'obj.get{}{}()'.format(column[0].upper(), column[1:]))
+        for column in columns)
+
+
+# The columns written for every clinical and pipeline record, paired with
+# the expressions that read them from the datamodel object, obj. Parent
+# ids come from parentIds, a _ParentIds shared across the batch.
+_COMMON_FIELDS = (
+    ('id', 'obj.getId()'),
+    ('datasetId', 'parentIds[obj.getParentContainer()]'),
+    ('created', 'obj.getCreated()'),
+    ('updated', 'obj.getUpdated()'),
+    ('name', 'obj.getLocalId()'),
+    ('description', 'obj.getDescription()'),
+    ('attributes', '_encodeAttributes(obj)'),
+)
+
+# The columns written by insertX for each clinical and pipeline table.
+_CLIN_PIPE_FIELDS = {
+    models.Patient: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'otherIds', 'otherIdsTier',
+        'dateOfBirth', 'dateOfBirthTier',
+        'gender', 'genderTier',
+        'ethnicity', 'ethnicityTier',
+        'race', 'raceTier',
+        'provinceOfResidence', 'provinceOfResidenceTier',
+        'dateOfDeath', 'dateOfDeathTier',
+        'causeOfDeath', 'causeOfDeathTier',
+        'autopsyTissueForResearch', 'autopsyTissueForResearchTier',
+        'priorMalignancy', 'priorMalignancyTier',
+        'dateOfPriorMalignancy', 'dateOfPriorMalignancyTier',
+        'familyHistoryAndRiskFactors', 'familyHistoryAndRiskFactorsTier',
+        'familyHistoryOfPredispositionSyndrome',
+        'familyHistoryOfPredispositionSyndromeTier',
+        'detailsOfPredispositionSyndrome',
+        'detailsOfPredispositionSyndromeTier',
+        'geneticCancerSyndrome', 'geneticCancerSyndromeTier',
+        'otherGeneticConditionOrSignificantComorbidity',
+        'otherGeneticConditionOrSignificantComorbidityTier',
+        'occupationalOrEnvironmentalExposure',
+        'occupationalOrEnvironmentalExposureTier',
+    ),
+    models.Enrollment: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'enrollmentInstitution', 'enrollmentInstitutionTier',
+        'enrollmentApprovalDate', 'enrollmentApprovalDateTier',
+        'crossEnrollment', 'crossEnrollmentTier',
+        'otherPersonalizedMedicineStudyName',
+        'otherPersonalizedMedicineStudyNameTier',
+        'otherPersonalizedMedicineStudyId',
+        'otherPersonalizedMedicineStudyIdTier',
+        'ageAtEnrollment', 'ageAtEnrollmentTier',
+        'eligibilityCategory', 'eligibilityCategoryTier',
+        'statusAtEnrollment', 'statusAtEnrollmentTier',
+        'primaryOncologistName', 'primaryOncologistNameTier',
+        'primaryOncologistContact', 'primaryOncologistContactTier',
+        'referringPhysicianName', 'referringPhysicianNameTier',
+        'referringPhysicianContact', 'referringPhysicianContactTier',
+        'summaryOfIdRequest', 'summaryOfIdRequestTier',
+        'treatingCentreName', 'treatingCentreNameTier',
+        'treatingCentreProvince', 'treatingCentreProvinceTier',
+    ),
+    models.Consent: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'consentId', 'consentIdTier',
+        'consentDate', 'consentDateTier',
+        'consentVersion', 'consentVersionTier',
+        'patientConsentedTo', 'patientConsentedToTier',
+        'reasonForRejection', 'reasonForRejectionTier',
+        'wasAssentObtained', 'wasAssentObtainedTier',
+        'dateOfAssent', 'dateOfAssentTier',
+        'assentFormVersion', 'assentFormVersionTier',
+        'ifAssentNotObtainedWhyNot', 'ifAssentNotObtainedWhyNotTier',
+        'reconsentDate', 'reconsentDateTier',
+        'reconsentVersion', 'reconsentVersionTier',
+        'consentingCoordinatorName', 'consentingCoordinatorNameTier',
+        'previouslyConsented', 'previouslyConsentedTier',
+        'nameOfOtherBiobank', 'nameOfOtherBiobankTier',
+        'hasConsentBeenWithdrawn', 'hasConsentBeenWithdrawnTier',
+        'dateOfConsentWithdrawal', 'dateOfConsentWithdrawalTier',
+        'typeOfConsentWithdrawal', 'typeOfConsentWithdrawalTier',
+        'reasonForConsentWithdrawal', 'reasonForConsentWithdrawalTier',
+        'consentFormComplete', 'consentFormCompleteTier',
+    ),
+    models.Diagnosis: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'diagnosisId', 'diagnosisIdTier',
+        'diagnosisDate', 'diagnosisDateTier',
+        'ageAtDiagnosis', 'ageAtDiagnosisTier',
+        'cancerType', 'cancerTypeTier',
+        'classification', 'classificationTier',
+        'cancerSite', 'cancerSiteTier',
+        'histology', 'histologyTier',
+        'methodOfDefinitiveDiagnosis', 'methodOfDefinitiveDiagnosisTier',
+        'sampleType', 'sampleTypeTier',
+        'sampleSite', 'sampleSiteTier',
+        'tumorGrade', 'tumorGradeTier',
+        'gradingSystemUsed', 'gradingSystemUsedTier',
+        'sitesOfMetastases', 'sitesOfMetastasesTier',
+        'stagingSystem', 'stagingSystemTier',
+        'versionOrEditionOfTheStagingSystem',
+        'versionOrEditionOfTheStagingSystemTier',
+        'specificTumorStageAtDiagnosis', 'specificTumorStageAtDiagnosisTier',
+        'prognosticBiomarkers', 'prognosticBiomarkersTier',
+        'biomarkerQuantification', 'biomarkerQuantificationTier',
+        'additionalMolecularTesting', 'additionalMolecularTestingTier',
+        'additionalTestType', 'additionalTestTypeTier',
+        'laboratoryName', 'laboratoryNameTier',
+        'laboratoryAddress', 'laboratoryAddressTier',
+        'siteOfMetastases', 'siteOfMetastasesTier',
+        'stagingSystemVersion', 'stagingSystemVersionTier',
+        'specificStage', 'specificStageTier',
+        'cancerSpecificBiomarkers', 'cancerSpecificBiomarkersTier',
+        'additionalMolecularDiagnosticTestingPerformed',
+        'additionalMolecularDiagnosticTestingPerformedTier',
+        'additionalTest', 'additionalTestTier',
+    ),
+    models.Sample: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'sampleId', 'sampleIdTier',
+        'diagnosisId', 'diagnosisIdTier',
+        'localBiobankId', 'localBiobankIdTier',
+        'collectionDate', 'collectionDateTier',
+        'collectionHospital', 'collectionHospitalTier',
+        'sampleType', 'sampleTypeTier',
+        'tissueDiseaseState', 'tissueDiseaseStateTier',
+        'anatomicSiteTheSampleObtainedFrom',
+        'anatomicSiteTheSampleObtainedFromTier',
+        'cancerType', 'cancerTypeTier',
+        'cancerSubtype', 'cancerSubtypeTier',
+        'pathologyReportId', 'pathologyReportIdTier',
+        'morphologicalCode', 'morphologicalCodeTier',
+        'topologicalCode', 'topologicalCodeTier',
+        'shippingDate', 'shippingDateTier',
+        'receivedDate', 'receivedDateTier',
+        'qualityControlPerformed', 'qualityControlPerformedTier',
+        'estimatedTumorContent', 'estimatedTumorContentTier',
+        'quantity', 'quantityTier',
+        'units', 'unitsTier',
+        'associatedBiobank', 'associatedBiobankTier',
+        'otherBiobank', 'otherBiobankTier',
+        'sopFollowed', 'sopFollowedTier',
+        'ifNotExplainAnyDeviation', 'ifNotExplainAnyDeviationTier',
+    ),
+    models.Treatment: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'courseNumber', 'courseNumberTier',
+        'therapeuticModality', 'therapeuticModalityTier',
+        'treatmentPlanType', 'treatmentPlanTypeTier',
+        'treatmentIntent', 'treatmentIntentTier',
+        'startDate', 'startDateTier',
+        'stopDate', 'stopDateTier',
+        'reasonForEndingTheTreatment', 'reasonForEndingTheTreatmentTier',
+        'responseToTreatment', 'responseToTreatmentTier',
+        'responseCriteriaUsed', 'responseCriteriaUsedTier',
+        'dateOfRecurrenceOrProgressionAfterThisTreatment',
+        'dateOfRecurrenceOrProgressionAfterThisTreatmentTier',
+        'unexpectedOrUnusualToxicityDuringTreatment',
+        'unexpectedOrUnusualToxicityDuringTreatmentTier',
+    ),
+    models.Outcome: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'physicalExamId', 'physicalExamIdTier',
+        'dateOfAssessment', 'dateOfAssessmentTier',
+        'diseaseResponseOrStatus', 'diseaseResponseOrStatusTier',
+        'otherResponseClassification', 'otherResponseClassificationTier',
+        'minimalResidualDiseaseAssessment',
+        'minimalResidualDiseaseAssessmentTier',
+        'methodOfResponseEvaluation', 'methodOfResponseEvaluationTier',
+        'responseCriteriaUsed', 'responseCriteriaUsedTier',
+        'summaryStage', 'summaryStageTier',
+        'sitesOfAnyProgressionOrRecurrence',
+        'sitesOfAnyProgressionOrRecurrenceTier',
+        'vitalStatus', 'vitalStatusTier',
+        'height', 'heightTier',
+        'weight', 'weightTier',
+        'heightUnits', 'heightUnitsTier',
+        'weightUnits', 'weightUnitsTier',
+        'performanceStatus', 'performanceStatusTier',
+    ),
+    models.Complication: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'date', 'dateTier',
+        'lateComplicationOfTherapyDeveloped',
+        'lateComplicationOfTherapyDevelopedTier',
+        'lateToxicityDetail', 'lateToxicityDetailTier',
+        'suspectedTreatmentInducedNeoplasmDeveloped',
+        'suspectedTreatmentInducedNeoplasmDevelopedTier',
+        'treatmentInducedNeoplasmDetails',
+        'treatmentInducedNeoplasmDetailsTier',
+    ),
+    models.Tumourboard: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'dateOfMolecularTumorBoard', 'dateOfMolecularTumorBoardTier',
+        'typeOfSampleAnalyzed', 'typeOfSampleAnalyzedTier',
+        'typeOfTumourSampleAnalyzed', 'typeOfTumourSampleAnalyzedTier',
+        'analysesDiscussed', 'analysesDiscussedTier',
+        'somaticSampleType', 'somaticSampleTypeTier',
+        'normalExpressionComparator', 'normalExpressionComparatorTier',
+        'diseaseExpressionComparator', 'diseaseExpressionComparatorTier',
+        'hasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancer',
+        'hasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancerTier',
+        'actionableTargetFound', 'actionableTargetFoundTier',
+        'molecularTumorBoardRecommendation',
+        'molecularTumorBoardRecommendationTier',
+        'germlineDnaSampleId', 'germlineDnaSampleIdTier',
+        'tumorDnaSampleId', 'tumorDnaSampleIdTier',
+        'tumorRnaSampleId', 'tumorRnaSampleIdTier',
+        'germlineSnvDiscussed', 'germlineSnvDiscussedTier',
+        'somaticSnvDiscussed', 'somaticSnvDiscussedTier',
+        'cnvsDiscussed', 'cnvsDiscussedTier',
+        'structuralVariantDiscussed', 'structuralVariantDiscussedTier',
+        'classificationOfVariants', 'classificationOfVariantsTier',
+        'clinicalValidationProgress', 'clinicalValidationProgressTier',
+        'typeOfValidation', 'typeOfValidationTier',
+        'agentOrDrugClass', 'agentOrDrugClassTier',
+        'levelOfEvidenceForExpressionTargetAgentMatch',
+        'levelOfEvidenceForExpressionTargetAgentMatchTier',
+        'didTreatmentPlanChangeBasedOnProfilingResult',
+        'didTreatmentPlanChangeBasedOnProfilingResultTier',
+        'howTreatmentHasAlteredBasedOnProfiling',
+        'howTreatmentHasAlteredBasedOnProfilingTier',
+        'reasonTreatmentPlanDidNotChangeBasedOnProfiling',
+        'reasonTreatmentPlanDidNotChangeBasedOnProfilingTier',
+        'detailsOfTreatmentPlanImpact', 'detailsOfTreatmentPlanImpactTier',
+        'patientOrFamilyInformedOfGermlineVariant',
+        'patientOrFamilyInformedOfGermlineVariantTier',
+        'patientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfiling',
+        'patientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfilingTier',
+        'summaryReport', 'summaryReportTier',
+    ),
+    models.Chemotherapy: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'courseNumber', 'courseNumberTier',
+        'startDate', 'startDateTier',
+        'stopDate', 'stopDateTier',
+        'systematicTherapyAgentName', 'systematicTherapyAgentNameTier',
+        'route', 'routeTier',
+        'dose', 'doseTier',
+        'doseFrequency', 'doseFrequencyTier',
+        'doseUnit', 'doseUnitTier',
+        'daysPerCycle', 'daysPerCycleTier',
+        'numberOfCycle', 'numberOfCycleTier',
+        'treatmentIntent', 'treatmentIntentTier',
+        'treatingCentreName', 'treatingCentreNameTier',
+        'type', 'typeTier',
+        'protocolCode', 'protocolCodeTier',
+        'recordingDate', 'recordingDateTier',
+        'treatmentPlanId', 'treatmentPlanIdTier',
+    ),
+    models.Radiotherapy: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'courseNumber', 'courseNumberTier',
+        'startDate', 'startDateTier',
+        'stopDate', 'stopDateTier',
+        'therapeuticModality', 'therapeuticModalityTier',
+        'baseline', 'baselineTier',
+        'testResult', 'testResultTier',
+        'testResultStd', 'testResultStdTier',
+        'treatingCentreName', 'treatingCentreNameTier',
+        'startIntervalRad', 'startIntervalRadTier',
+        'startIntervalRadRaw', 'startIntervalRadRawTier',
+        'recordingDate', 'recordingDateTier',
+        'adjacentFields', 'adjacentFieldsTier',
+        'adjacentFractions', 'adjacentFractionsTier',
+        'complete', 'completeTier',
+        'brachytherapyDose', 'brachytherapyDoseTier',
+        'radiotherapyDose', 'radiotherapyDoseTier',
+        'siteNumber', 'siteNumberTier',
+        'technique', 'techniqueTier',
+        'treatedRegion', 'treatedRegionTier',
+        'treatmentPlanId', 'treatmentPlanIdTier',
+        'radiationType', 'radiationTypeTier',
+        'radiationSite', 'radiationSiteTier',
+        'totalDose', 'totalDoseTier',
+        'boostSite', 'boostSiteTier',
+        'boostDose', 'boostDoseTier',
+    ),
+    models.Surgery: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'startDate', 'startDateTier',
+        'stopDate', 'stopDateTier',
+        'sampleId', 'sampleIdTier',
+        'collectionTimePoint', 'collectionTimePointTier',
+        'diagnosisDate', 'diagnosisDateTier',
+        'site', 'siteTier',
+        'type', 'typeTier',
+        'recordingDate', 'recordingDateTier',
+        'treatmentPlanId', 'treatmentPlanIdTier',
+        'courseNumber', 'courseNumberTier',
+    ),
+    models.Immunotherapy: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'startDate', 'startDateTier',
+        'immunotherapyType', 'immunotherapyTypeTier',
+        'immunotherapyTarget', 'immunotherapyTargetTier',
+        'immunotherapyDetail', 'immunotherapyDetailTier',
+        'treatmentPlanId', 'treatmentPlanIdTier',
+        'courseNumber', 'courseNumberTier',
+    ),
+    models.Celltransplant: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'startDate', 'startDateTier',
+        'cellSource', 'cellSourceTier',
+        'donorType', 'donorTypeTier',
+        'treatmentPlanId', 'treatmentPlanIdTier',
+        'courseNumber', 'courseNumberTier',
+    ),
+    models.Slide: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'sampleId', 'sampleIdTier',
+        'slideId', 'slideIdTier',
+        'slideOtherId', 'slideOtherIdTier',
+        'lymphocyteInfiltrationPercent', 'lymphocyteInfiltrationPercentTier',
+        'tumorNucleiPercent', 'tumorNucleiPercentTier',
+        'monocyteInfiltrationPercent', 'monocyteInfiltrationPercentTier',
+        'normalCellsPercent', 'normalCellsPercentTier',
+        'tumorCellsPercent', 'tumorCellsPercentTier',
+        'stromalCellsPercent', 'stromalCellsPercentTier',
+        'eosinophilInfiltrationPercent', 'eosinophilInfiltrationPercentTier',
+        'neutrophilInfiltrationPercent', 'neutrophilInfiltrationPercentTier',
+        'granulocyteInfiltrationPercent', 'granulocyteInfiltrationPercentTier',
+        'necrosisPercent', 'necrosisPercentTier',
+        'inflammatoryInfiltrationPercent',
+        'inflammatoryInfiltrationPercentTier',
+        'proliferatingCellsNumber', 'proliferatingCellsNumberTier',
+        'sectionLocation', 'sectionLocationTier',
+    ),
+    models.Study: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'startDate', 'startDateTier',
+        'endDate', 'endDateTier',
+        'status', 'statusTier',
+        'recordingDate', 'recordingDateTier',
+    ),
+    models.Labtest: _COMMON_FIELDS + _getters(
+        'patientId', 'patientIdTier',
+        'startDate', 'startDateTier',
+        'collectionDate', 'collectionDateTier',
+        'endDate', 'endDateTier',
+        'eventType', 'eventTypeTier',
+        'testResults', 'testResultsTier',
+        'timePoint', 'timePointTier',
+        'recordingDate', 'recordingDateTier',
+    ),
+    models.Extraction: _COMMON_FIELDS + _getters(
+        'extractionId', 'extractionIdTier',
+        'sampleId', 'sampleIdTier',
+        'rnaBlood', 'rnaBloodTier',
+        'dnaBlood', 'dnaBloodTier',
+        'rnaTissue', 'rnaTissueTier',
+        'dnaTissue', 'dnaTissueTier',
+        'site', 'siteTier',
+    ),
+    models.Sequencing: _COMMON_FIELDS + _getters(
+        'sequencingId', 'sequencingIdTier',
+        'sampleId', 'sampleIdTier',
+        'dnaLibraryKit', 'dnaLibraryKitTier',
+        'dnaSeqPlatform', 'dnaSeqPlatformTier',
+        'dnaReadLength', 'dnaReadLengthTier',
+        'rnaLibraryKit', 'rnaLibraryKitTier',
+        'rnaSeqPlatform', 'rnaSeqPlatformTier',
+        'rnaReadLength', 'rnaReadLengthTier',
+        'pcrCycles', 'pcrCyclesTier',
+        'extractionId', 'extractionIdTier',
+        'site', 'siteTier',
+    ),
+    models.Alignment: _COMMON_FIELDS + _getters(
+        'alignmentId', 'alignmentIdTier',
+        'sampleId', 'sampleIdTier',
+        'alignmentTool', 'alignmentToolTier',
+        'mergeTool', 'mergeToolTier',
+        'inHousePipeline', 'inHousePipelineTier',
+        'markDuplicates', 'markDuplicatesTier',
+        'realignerTarget', 'realignerTargetTier',
+        'indelRealigner', 'indelRealignerTier',
+        'coverage', 'coverageTier',
+        'baseRecalibrator', 'baseRecalibratorTier',
+        'printReads', 'printReadsTier',
+        'idxStats', 'idxStatsTier',
+        'flagStat', 'flagStatTier',
+        'insertSizeMetrics', 'insertSizeMetricsTier',
+        'fastqc', 'fastqcTier',
+        'reference', 'referenceTier',
+        'sequencingId', 'sequencingIdTier',
+        'site', 'siteTier',
+    ),
+    models.VariantCalling: _COMMON_FIELDS + _getters(
+        'variantCallingId', 'variantCallingIdTier',
+        'sampleId', 'sampleIdTier',
+        'variantCaller', 'variantCallerTier',
+        'tabulate', 'tabulateTier',
+        'inHousePipeline', 'inHousePipelineTier',
+        'annotation', 'annotationTier',
+        'mergeTool', 'mergeToolTier',
+        'rdaToTab', 'rdaToTabTier',
+        'delly', 'dellyTier',
+        'postFilter', 'postFilterTier',
+        'clipFilter', 'clipFilterTier',
+        'cosmic', 'cosmicTier',
+        'dbSnp', 'dbSnpTier',
+        'alignmentId', 'alignmentIdTier',
+        'site', 'siteTier',
+    ),
+    models.FusionDetection: _COMMON_FIELDS + _getters(
+        'fusionDetectionId', 'fusionDetectionIdTier',
+        'sampleId', 'sampleIdTier',
+        'inHousePipeline', 'inHousePipelineTier',
+        'svDetection', 'svDetectionTier',
+        'fusionDetection', 'fusionDetectionTier',
+        'realignment', 'realignmentTier',
+        'annotation', 'annotationTier',
+        'genomeReference', 'genomeReferenceTier',
+        'geneModels', 'geneModelsTier',
+        'alignmentId', 'alignmentIdTier',
+        'site', 'siteTier',
+    ),
+    models.ExpressionAnalysis: _COMMON_FIELDS + _getters(
+        'expressionAnalysisId', 'expressionAnalysisIdTier',
+        'sampleId', 'sampleIdTier',
+        'readLength', 'readLengthTier',
+        'reference', 'referenceTier',
+        'alignmentTool', 'alignmentToolTier',
+        'bamHandling', 'bamHandlingTier',
+        'expressionEstimation', 'expressionEstimationTier',
+        'sequencingId', 'sequencingIdTier',
+        'site', 'siteTier',
+    ),
+}
+
+
+# The clinical and pipeline tables in load order, with the datamodel class
+# each row is read into and the dataset method that adds those objects.
+_CLIN_PIPE_TABLES = (
+    (models.Patient, clinical_metadata.Patient, 'addPatientMany'),
+    (models.Enrollment, clinical_metadata.Enrollment, 'addEnrollmentMany'),
+    (models.Consent, clinical_metadata.Consent, 'addConsentMany'),
+    (models.Diagnosis, clinical_metadata.Diagnosis, 'addDiagnosisMany'),
+    (models.Sample, clinical_metadata.Sample, 'addSampleMany'),
+    (models.Treatment, clinical_metadata.Treatment, 'addTreatmentMany'),
+    (models.Outcome, clinical_metadata.Outcome, 'addOutcomeMany'),
+    (models.Complication, clinical_metadata.Complication, 'addComplicationMany'),
+    (models.Tumourboard, clinical_metadata.Tumourboard, 'addTumourboardMany'),
+    (models.Chemotherapy, clinical_metadata.Chemotherapy, 'addChemotherapyMany'),
+    (models.Radiotherapy, clinical_metadata.Radiotherapy, 'addRadiotherapyMany'),
+    (models.Surgery, clinical_metadata.Surgery, 'addSurgeryMany'),
+    (models.Immunotherapy, clinical_metadata.Immunotherapy, 'addImmunotherapyMany'),
+    (models.Celltransplant, clinical_metadata.Celltransplant, 'addCelltransplantMany'),
+    (models.Slide, clinical_metadata.Slide, 'addSlideMany'),
+    (models.Study, clinical_metadata.Study, 'addStudyMany'),
+    (models.Labtest, clinical_metadata.Labtest, 'addLabtestMany'),
+    (models.Extraction, pipeline_metadata.Extraction, 'addExtractionMany'),
+    (models.Sequencing, pipeline_metadata.Sequencing, 'addSequencingMany'),
+    (models.Alignment, pipeline_metadata.Alignment, 'addAlignmentMany'),
+    (models.VariantCalling, pipeline_metadata.VariantCalling, 'addVariantCallingMany'),
+    (models.FusionDetection, pipeline_metadata.FusionDetection, 'addFusionDetectionMany'),
+    (models.ExpressionAnalysis, pipeline_metadata.ExpressionAnalysis, 'addExpressionAnalysisMany'),
+)
+
+
+class _ParentIds(dict):
+    """
+    Maps the parent containers of a batch of records to their ids, so
+    that each id is computed once rather than once per record.
+    """
+    def __missing__(self, parentContainer):
+        parentId = self[parentContainer] = parentContainer.getId()
+        return parentId
+
+
+@functools.lru_cache(maxsize=None)
+def _rowBuilder(pw_model):
+    """
+    Returns a function mapping a datamodel object, and the _ParentIds of
+    its batch, to the tuple of values written for it to the specified
+    table, in _CLIN_PIPE_FIELDS order.
+    The function is generated from the field expressions once per table,
+    so each row costs a single call with no per-column dispatch.
+    """
+    source = 'def row(obj, parentIds):\n    return (\n{})\n'.format(''.join(
+        '        {},\n'.format(expression)
+        for _, expression in _CLIN_PIPE_FIELDS[pw_model]))
+    namespace = {'_encodeAttributes': _encodeAttributes}
+    exec(compile(
+        source, '<{} row builder>'.format(pw_model.__name__), 'exec'),
+        namespace)
+    return namespace['row']
+
+
+@functools.lru_cache(maxsize=None)
+def _insertSql(pw_model, columns):
+    """
+    Returns the parameterised INSERT statement writing the specified
+    columns (model field or column names) of the table, built once per
+    table rather than compiled by peewee for every row.
+    """
+    names = [pw_model._meta.combined[column].column_name
+             for column in columns]
+    return 'INSERT INTO "{}" ({}) VALUES ({})'.format(
+        pw_model._meta.table_name,
+        ', '.join('"{}"'.format(name) for name in names),
+        ', '.join('?' * len(names)))
+
+
+@functools.lru_cache(maxsize=None)
+def _recordType(pw_model):
+    """
+    Returns a lightweight record type with one attribute per column of
+    the specified model. The field map is resolved once per schema and
+    shared across every dataset read from that table.
+    """
+    return collections.namedtuple(
+        '{}Record'.format(pw_model.__name__),
+        [field.name for field in pw_model._meta.sorted_fields])
+
 
 class AbstractDataRepository(object):
     """
@@ -278,7 +857,9 @@ class SqlDataRepository(AbstractDataRepository):
         # we have called load()
         self._schemaVersion = None
         # Connection to the DB.
-        self.database = models.SqliteDatabase(self._dbFilename, **{})
+        self.database = models.PooledSqliteDatabase(
+            self._dbFilename, max_connections=8, stale_timeout=300,
+            pragmas=_SQLITE_PRAGMAS)
         models.databaseProxy.initialize(self.database)
 
     def _checkWriteMode(self):
@@ -411,7 +992,7 @@ class SqlDataRepository(AbstractDataRepository):
                 id=dataset.getId(),
                 name=dataset.getLocalId(),
                 description=dataset.getDescription(),
-                attributes=json.dumps(dataset.getAttributes()))
+                attributes=_encodeAttributes(dataset))
         except Exception:
             raise exceptions.DuplicateNameException(
                 dataset.getLocalId())
@@ -642,7 +1223,7 @@ class SqlDataRepository(AbstractDataRepository):
                 id=dataset.getId(),
                 name=dataset.getLocalId(),
                 description=dataset.getDescription(),
-                attributes=json.dumps(dataset.getAttributes()))
+                attributes=_encodeAttributes(dataset))
         except Exception:
             raise exceptions.DuplicateNameException(
                 dataset.getLocalId())
@@ -668,1430 +1249,374 @@ class SqlDataRepository(AbstractDataRepository):
                 models.Dataset.id == dataset.getId()):
                     datasetRecord.delete_instance(recursive=True)
 
-    def _createPatientTable(self):
-        self.database.create_tables([models.Patient])
+    def _createClinPipeTables(self):
+        """
+        Create all the clin/pipe tables, and their indexes
+        """
+        self.database.create_tables(
+            [pw_model for pw_model, _, _ in _CLIN_PIPE_TABLES])
 
     def insertPatient(self, patient):
         """
         Inserts the specified patient into this repository.
         """
-        try:
-            models.Patient.create(
-                # Common fields
-                id=patient.getId(),
-                datasetId=patient.getParentContainer().getId(),
-                created=patient.getCreated(),
-                updated=patient.getUpdated(),
-                name=patient.getLocalId(),
-                description=patient.getDescription(),
-                attributes=json.dumps(patient.getAttributes()),
-                # Unique fields
-                patientId = patient.getPatientId(),
-                patientIdTier = patient.getPatientIdTier(),
-                otherIds = patient.getOtherIds(),
-                otherIdsTier = patient.getOtherIdsTier(),
-                dateOfBirth = patient.getDateOfBirth(),
-                dateOfBirthTier = patient.getDateOfBirthTier(),
-                gender = patient.getGender(),
-                genderTier = patient.getGenderTier(),
-                ethnicity = patient.getEthnicity(),
-                ethnicityTier = patient.getEthnicityTier(),
-                race = patient.getRace(),
-                raceTier = patient.getRaceTier(),
-                provinceOfResidence = patient.getProvinceOfResidence(),
-                provinceOfResidenceTier = patient.getProvinceOfResidenceTier(),
-                dateOfDeath = patient.getDateOfDeath(),
-                dateOfDeathTier = patient.getDateOfDeathTier(),
-                causeOfDeath = patient.getCauseOfDeath(),
-                causeOfDeathTier = patient.getCauseOfDeathTier(),
-                autopsyTissueForResearch = patient.getAutopsyTissueForResearch(),
-                autopsyTissueForResearchTier = patient.getAutopsyTissueForResearchTier(),
-                priorMalignancy = patient.getPriorMalignancy(),
-                priorMalignancyTier = patient.getPriorMalignancyTier(),
-                dateOfPriorMalignancy = patient.getDateOfPriorMalignancy(),
-                dateOfPriorMalignancyTier = patient.getDateOfPriorMalignancyTier(),
-                familyHistoryAndRiskFactors = patient.getFamilyHistoryAndRiskFactors(),
-                familyHistoryAndRiskFactorsTier = patient.getFamilyHistoryAndRiskFactorsTier(),
-                familyHistoryOfPredispositionSyndrome = patient.getFamilyHistoryOfPredispositionSyndrome(),
-                familyHistoryOfPredispositionSyndromeTier = patient.getFamilyHistoryOfPredispositionSyndromeTier(),
-                detailsOfPredispositionSyndrome = patient.getDetailsOfPredispositionSyndrome(),
-                detailsOfPredispositionSyndromeTier = patient.getDetailsOfPredispositionSyndromeTier(),
-                geneticCancerSyndrome = patient.getGeneticCancerSyndrome(),
-                geneticCancerSyndromeTier = patient.getGeneticCancerSyndromeTier(),
-                otherGeneticConditionOrSignificantComorbidity = patient.getOtherGeneticConditionOrSignificantComorbidity(),
-                otherGeneticConditionOrSignificantComorbidityTier = patient.getOtherGeneticConditionOrSignificantComorbidityTier(),
-                occupationalOrEnvironmentalExposure = patient.getOccupationalOrEnvironmentalExposure(),
-                occupationalOrEnvironmentalExposureTier = patient.getOccupationalOrEnvironmentalExposureTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                patient.getLocalId(),
-                patient.getParentContainer().getLocalId())
+        self.insertPatientMany([patient])
 
-    def _readClinPipeTable(self, dataset, pw_model, datamodel, addMethod):
+    def insertPatientMany(self, patients):
         """
-        A helper that reads clin/pipe table into memory
+        Inserts the specified patients into this repository.
         """
-        for record in pw_model.select().where(pw_model.datasetId == dataset.getId()):
-            result = datamodel(dataset, record.name)
-            result.populateFromRow(record)
-            assert result.getId() == record.id
-            addMethod(result)
+        self._insertClinPipeRows(models.Patient, patients)
 
-    def _readPatientTable(self):
+    def _insertClinPipeRows(self, pw_model, objects):
+        """
+        A helper that inserts the specified objects into the clin/pipe
+        table in a single transaction, _INSERT_BATCH_SIZE at a time,
+        raising DuplicateNameException if any of them is already there.
         """
-        Read the Patient table upon load
+        columns = tuple(column for column, _ in _CLIN_PIPE_FIELDS[pw_model])
+        sql = _insertSql(pw_model, columns)
+        rowBuilder = _rowBuilder(pw_model)
+        batch, ids = [], []
+        try:
+            with self.database.atomic():
+                parentIds = _ParentIds()
+                for batch in peewee.chunked(objects, _INSERT_BATCH_SIZE):
+                    params = [rowBuilder(obj, parentIds) for obj in batch]
+                    # The id is the first of the common fields.
+                    ids = [row[0] for row in params]
+                    duplicate = self._findDuplicate(pw_model, batch, ids)
+                    if duplicate is not None:
+                        raise _duplicateNameException(duplicate)
+                    self.database.cursor().executemany(sql, params)
+        except sqlite3.IntegrityError:
+            # executemany goes straight to the sqlite3 cursor, so this is
+            # not wrapped as peewee.IntegrityError. The transaction has
+            # been rolled back, so look again for the row that clashed.
+            duplicate = self._findDuplicate(pw_model, batch, ids)
+            if duplicate is None:
+                duplicate = batch[0]
+            raise _duplicateNameException(duplicate) from None
+
+    def _findDuplicate(self, pw_model, objects, ids):
+        """
+        Returns the first of objects whose id is already taken, either in
+        the clin/pipe table or by an earlier object in the list, or None
+        if all of them are new.
+        """
+        existing = self.getExistingIds(pw_model, ids)
+        seen = set()
+        for obj, objId in zip(objects, ids):
+            if objId in existing or objId in seen:
+                return obj
+            seen.add(objId)
+        return None
+
+    def getExistingIds(self, pw_model, ids):
+        """
+        Returns the set of the specified ids that are already in the
+        clin/pipe table, querying them _INSERT_BATCH_SIZE at a time.
+        """
+        existing = set()
+        for batch in peewee.chunked(ids, _INSERT_BATCH_SIZE):
+            query = pw_model.select(pw_model.id).where(pw_model.id.in_(batch))
+            existing.update(objId for objId, in query.tuples())
+        return existing
+
+    def _readClinPipeTable(self, dataset, pw_model, datamodel, addManyMethod):
+        """
+        A helper that reads clin/pipe table into memory, handing the
+        objects to the dataset in batches of _READ_BATCH_SIZE rows.
+        """
+        recordType = _recordType(pw_model)
+        query = pw_model.select().where(pw_model.datasetId == dataset.getId())
+        cursor = self.database.execute(query)
+        rows = cursor.fetchmany(_READ_BATCH_SIZE)
+        while rows:
+            results = []
+            ids = []
+            for record in map(recordType._make, rows):
+                result = datamodel(dataset, record.name)
+                result.populateFromRow(record)
+                assert result.getId() == record.id
+                results.append(result)
+                ids.append(record.id)
+            addManyMethod(results, ids)
+            rows = cursor.fetchmany(_READ_BATCH_SIZE)
+
+    def _readClinPipeTables(self):
+        """
+        Read all the clin/pipe tables upon load, a dataset at a time
         """
         for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Patient, clinical_metadata.Patient, dataset.addPatient)
-
-    def _createEnrollmentTable(self):
-        self.database.create_tables([models.Enrollment])
+            for pw_model, datamodel, addManyMethod in _CLIN_PIPE_TABLES:
+                self._readClinPipeTable(
+                    dataset, pw_model, datamodel,
+                    getattr(dataset, addManyMethod))
 
     def insertEnrollment(self, enrollment):
         """
         Inserts the specified enrollment into this repository.
         """
-        try:
-            models.Enrollment.create(
-                # Common fields
-                id=enrollment.getId(),
-                datasetId=enrollment.getParentContainer().getId(),
-                created=enrollment.getCreated(),
-                updated=enrollment.getUpdated(),
-                name=enrollment.getLocalId(),
-                description=enrollment.getDescription(),
-                attributes=json.dumps(enrollment.getAttributes()),
-
-                # Unique fields
-                patientId=enrollment.getPatientId(),
-                patientIdTier = enrollment.getPatientIdTier(),
-                enrollmentInstitution = enrollment.getEnrollmentInstitution(),
-                enrollmentInstitutionTier = enrollment.getEnrollmentInstitutionTier(),
-                enrollmentApprovalDate = enrollment.getEnrollmentApprovalDate(),
-                enrollmentApprovalDateTier = enrollment.getEnrollmentApprovalDateTier(),
-                crossEnrollment = enrollment.getCrossEnrollment(),
-                crossEnrollmentTier = enrollment.getCrossEnrollmentTier(),
-                otherPersonalizedMedicineStudyName = enrollment.getOtherPersonalizedMedicineStudyName(),
-                otherPersonalizedMedicineStudyNameTier = enrollment.getOtherPersonalizedMedicineStudyNameTier(),
-                otherPersonalizedMedicineStudyId = enrollment.getOtherPersonalizedMedicineStudyId(),
-                otherPersonalizedMedicineStudyIdTier = enrollment.getOtherPersonalizedMedicineStudyIdTier(),
-                ageAtEnrollment = enrollment.getAgeAtEnrollment(),
-                ageAtEnrollmentTier = enrollment.getAgeAtEnrollmentTier(),
-                eligibilityCategory = enrollment.getEligibilityCategory(),
-                eligibilityCategoryTier = enrollment.getEligibilityCategoryTier(),
-                statusAtEnrollment = enrollment.getStatusAtEnrollment(),
-                statusAtEnrollmentTier = enrollment.getStatusAtEnrollmentTier(),
-                primaryOncologistName = enrollment.getPrimaryOncologistName(),
-                primaryOncologistNameTier = enrollment.getPrimaryOncologistNameTier(),
-                primaryOncologistContact = enrollment.getPrimaryOncologistContact(),
-                primaryOncologistContactTier = enrollment.getPrimaryOncologistContactTier(),
-                referringPhysicianName = enrollment.getReferringPhysicianName(),
-                referringPhysicianNameTier = enrollment.getReferringPhysicianNameTier(),
-                referringPhysicianContact = enrollment.getReferringPhysicianContact(),
-                referringPhysicianContactTier = enrollment.getReferringPhysicianContactTier(),
-                summaryOfIdRequest = enrollment.getSummaryOfIdRequest(),
-                summaryOfIdRequestTier = enrollment.getSummaryOfIdRequestTier(),
-                treatingCentreName = enrollment.getTreatingCentreName(),
-                treatingCentreNameTier = enrollment.getTreatingCentreNameTier(),
-                treatingCentreProvince = enrollment.getTreatingCentreProvince(),
-                treatingCentreProvinceTier = enrollment.getTreatingCentreProvinceTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                enrollment.getLocalId(),
-                enrollment.getParentContainer().getLocalId())
+        self.insertEnrollmentMany([enrollment])
 
-    def _readEnrollmentTable(self):
+    def insertEnrollmentMany(self, enrollments):
         """
-        Read the Enrollment table upon load
+        Inserts the specified enrollments into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Enrollment, clinical_metadata.Enrollment, dataset.addEnrollment)
-
-    def _createConsentTable(self):
-        self.database.create_tables([models.Consent])
+        self._insertClinPipeRows(models.Enrollment, enrollments)
 
     def insertConsent(self, consent):
         """
         Inserts the specified consent into this repository.
         """
-        try:
-            models.Consent.create(
-                # Common fields
-                id=consent.getId(),
-                datasetId=consent.getParentContainer().getId(),
-                created=consent.getCreated(),
-                updated=consent.getUpdated(),
-                name=consent.getLocalId(),
-                description=consent.getDescription(),
-                attributes=json.dumps(consent.getAttributes()),
-
-                # Unique fields
-                patientId = consent.getPatientId(),
-                patientIdTier = consent.getPatientIdTier(),
-                consentId = consent.getConsentId(),
-                consentIdTier = consent.getConsentIdTier(),
-                consentDate = consent.getConsentDate(),
-                consentDateTier = consent.getConsentDateTier(),
-                consentVersion = consent.getConsentVersion(),
-                consentVersionTier = consent.getConsentVersionTier(),
-                patientConsentedTo = consent.getPatientConsentedTo(),
-                patientConsentedToTier = consent.getPatientConsentedToTier(),
-                reasonForRejection = consent.getReasonForRejection(),
-                reasonForRejectionTier = consent.getReasonForRejectionTier(),
-                wasAssentObtained = consent.getWasAssentObtained(),
-                wasAssentObtainedTier = consent.getWasAssentObtainedTier(),
-                dateOfAssent = consent.getDateOfAssent(),
-                dateOfAssentTier = consent.getDateOfAssentTier(),
-                assentFormVersion = consent.getAssentFormVersion(),
-                assentFormVersionTier = consent.getAssentFormVersionTier(),
-                ifAssentNotObtainedWhyNot = consent.getIfAssentNotObtainedWhyNot(),
-                ifAssentNotObtainedWhyNotTier = consent.getIfAssentNotObtainedWhyNotTier(),
-                reconsentDate = consent.getReconsentDate(),
-                reconsentDateTier = consent.getReconsentDateTier(),
-                reconsentVersion = consent.getReconsentVersion(),
-                reconsentVersionTier = consent.getReconsentVersionTier(),
-                consentingCoordinatorName = consent.getConsentingCoordinatorName(),
-                consentingCoordinatorNameTier = consent.getConsentingCoordinatorNameTier(),
-                previouslyConsented = consent.getPreviouslyConsented(),
-                previouslyConsentedTier = consent.getPreviouslyConsentedTier(),
-                nameOfOtherBiobank = consent.getNameOfOtherBiobank(),
-                nameOfOtherBiobankTier = consent.getNameOfOtherBiobankTier(),
-                hasConsentBeenWithdrawn = consent.getHasConsentBeenWithdrawn(),
-                hasConsentBeenWithdrawnTier = consent.getHasConsentBeenWithdrawnTier(),
-                dateOfConsentWithdrawal = consent.getDateOfConsentWithdrawal(),
-                dateOfConsentWithdrawalTier = consent.getDateOfConsentWithdrawalTier(),
-                typeOfConsentWithdrawal = consent.getTypeOfConsentWithdrawal(),
-                typeOfConsentWithdrawalTier = consent.getTypeOfConsentWithdrawalTier(),
-                reasonForConsentWithdrawal = consent.getReasonForConsentWithdrawal(),
-                reasonForConsentWithdrawalTier = consent.getReasonForConsentWithdrawalTier(),
-                consentFormComplete = consent.getConsentFormComplete(),
-                consentFormCompleteTier = consent.getConsentFormCompleteTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                consent.getLocalId(),
-                consent.getParentContainer().getLocalId())
+        self.insertConsentMany([consent])
 
-    def _readConsentTable(self):
+    def insertConsentMany(self, consents):
         """
-        Read the Consent table upon load
+        Inserts the specified consents into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Consent, clinical_metadata.Consent, dataset.addConsent)
-
-    def _createDiagnosisTable(self):
-        self.database.create_tables([models.Diagnosis])
+        self._insertClinPipeRows(models.Consent, consents)
 
     def insertDiagnosis(self, diagnosis):
         """
         Inserts the specified diagnosis into this repository.
         """
-        try:
-            models.Diagnosis.create(
-                # Common fields
-                id=diagnosis.getId(),
-                datasetId=diagnosis.getParentContainer().getId(),
-                created=diagnosis.getCreated(),
-                updated=diagnosis.getUpdated(),
-                name=diagnosis.getLocalId(),
-                description=diagnosis.getDescription(),
-                attributes=json.dumps(diagnosis.getAttributes()),
-
-                # Unique fields
-                patientId = diagnosis.getPatientId(),
-                patientIdTier = diagnosis.getPatientIdTier(),
-                diagnosisId = diagnosis.getDiagnosisId(),
-                diagnosisIdTier = diagnosis.getDiagnosisIdTier(),
-                diagnosisDate = diagnosis.getDiagnosisDate(),
-                diagnosisDateTier = diagnosis.getDiagnosisDateTier(),
-                ageAtDiagnosis = diagnosis.getAgeAtDiagnosis(),
-                ageAtDiagnosisTier = diagnosis.getAgeAtDiagnosisTier(),
-                cancerType = diagnosis.getCancerType(),
-                cancerTypeTier = diagnosis.getCancerTypeTier(),
-                classification = diagnosis.getClassification(),
-                classificationTier = diagnosis.getClassificationTier(),
-                cancerSite = diagnosis.getCancerSite(),
-                cancerSiteTier = diagnosis.getCancerSiteTier(),
-                histology = diagnosis.getHistology(),
-                histologyTier = diagnosis.getHistologyTier(),
-                methodOfDefinitiveDiagnosis = diagnosis.getMethodOfDefinitiveDiagnosis(),
-                methodOfDefinitiveDiagnosisTier = diagnosis.getMethodOfDefinitiveDiagnosisTier(),
-                sampleType = diagnosis.getSampleType(),
-                sampleTypeTier = diagnosis.getSampleTypeTier(),
-                sampleSite = diagnosis.getSampleSite(),
-                sampleSiteTier = diagnosis.getSampleSiteTier(),
-                tumorGrade = diagnosis.getTumorGrade(),
-                tumorGradeTier = diagnosis.getTumorGradeTier(),
-                gradingSystemUsed = diagnosis.getGradingSystemUsed(),
-                gradingSystemUsedTier = diagnosis.getGradingSystemUsedTier(),
-                sitesOfMetastases = diagnosis.getSitesOfMetastases(),
-                sitesOfMetastasesTier = diagnosis.getSitesOfMetastasesTier(),
-                stagingSystem = diagnosis.getStagingSystem(),
-                stagingSystemTier = diagnosis.getStagingSystemTier(),
-                versionOrEditionOfTheStagingSystem = diagnosis.getVersionOrEditionOfTheStagingSystem(),
-                versionOrEditionOfTheStagingSystemTier = diagnosis.getVersionOrEditionOfTheStagingSystemTier(),
-                specificTumorStageAtDiagnosis = diagnosis.getSpecificTumorStageAtDiagnosis(),
-                specificTumorStageAtDiagnosisTier = diagnosis.getSpecificTumorStageAtDiagnosisTier(),
-                prognosticBiomarkers = diagnosis.getPrognosticBiomarkers(),
-                prognosticBiomarkersTier = diagnosis.getPrognosticBiomarkersTier(),
-                biomarkerQuantification = diagnosis.getBiomarkerQuantification(),
-                biomarkerQuantificationTier = diagnosis.getBiomarkerQuantificationTier(),
-                additionalMolecularTesting = diagnosis.getAdditionalMolecularTesting(),
-                additionalMolecularTestingTier = diagnosis.getAdditionalMolecularTestingTier(),
-                additionalTestType = diagnosis.getAdditionalTestType(),
-                additionalTestTypeTier = diagnosis.getAdditionalTestTypeTier(),
-                laboratoryName = diagnosis.getLaboratoryName(),
-                laboratoryNameTier = diagnosis.getLaboratoryNameTier(),
-                laboratoryAddress = diagnosis.getLaboratoryAddress(),
-                laboratoryAddressTier = diagnosis.getLaboratoryAddressTier(),
-                siteOfMetastases = diagnosis.getSiteOfMetastases(),
-                siteOfMetastasesTier = diagnosis.getSiteOfMetastasesTier(),
-                stagingSystemVersion = diagnosis.getStagingSystemVersion(),
-                stagingSystemVersionTier = diagnosis.getStagingSystemVersionTier(),
-                specificStage = diagnosis.getSpecificStage(),
-                specificStageTier = diagnosis.getSpecificStageTier(),
-                cancerSpecificBiomarkers = diagnosis.getCancerSpecificBiomarkers(),
-                cancerSpecificBiomarkersTier = diagnosis.getCancerSpecificBiomarkersTier(),
-                additionalMolecularDiagnosticTestingPerformed = diagnosis.getAdditionalMolecularDiagnosticTestingPerformed(),
-                additionalMolecularDiagnosticTestingPerformedTier = diagnosis.getAdditionalMolecularDiagnosticTestingPerformedTier(),
-                additionalTest = diagnosis.getAdditionalTest(),
-                additionalTestTier = diagnosis.getAdditionalTestTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                diagnosis.getLocalId(),
-                diagnosis.getParentContainer().getLocalId())
+        self.insertDiagnosisMany([diagnosis])
 
-    def _readDiagnosisTable(self):
+    def insertDiagnosisMany(self, diagnoses):
         """
-        Read the Diagnosis table upon load
+        Inserts the specified diagnoses into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Diagnosis, clinical_metadata.Diagnosis, dataset.addDiagnosis)
-
-    def _createSampleTable(self):
-        self.database.create_tables([models.Sample])
+        self._insertClinPipeRows(models.Diagnosis, diagnoses)
 
     def insertSample(self, sample):
         """
         Inserts the specified sample into this repository.
         """
-        try:
-            models.Sample.create(
-                # Common fields
-                id=sample.getId(),
-                datasetId=sample.getParentContainer().getId(),
-                created=sample.getCreated(),
-                updated=sample.getUpdated(),
-                name=sample.getLocalId(),
-                description=sample.getDescription(),
-                attributes=json.dumps(sample.getAttributes()),
-
-                # Unique fields
-                patientId = sample.getPatientId(),
-                patientIdTier = sample.getPatientIdTier(),
-                sampleId = sample.getSampleId(),
-                sampleIdTier = sample.getSampleIdTier(),
-                diagnosisId = sample.getDiagnosisId(),
-                diagnosisIdTier = sample.getDiagnosisIdTier(),
-                localBiobankId = sample.getLocalBiobankId(),
-                localBiobankIdTier = sample.getLocalBiobankIdTier(),
-                collectionDate = sample.getCollectionDate(),
-                collectionDateTier = sample.getCollectionDateTier(),
-                collectionHospital = sample.getCollectionHospital(),
-                collectionHospitalTier = sample.getCollectionHospitalTier(),
-                sampleType = sample.getSampleType(),
-                sampleTypeTier = sample.getSampleTypeTier(),
-                tissueDiseaseState = sample.getTissueDiseaseState(),
-                tissueDiseaseStateTier = sample.getTissueDiseaseStateTier(),
-                anatomicSiteTheSampleObtainedFrom = sample.getAnatomicSiteTheSampleObtainedFrom(),
-                anatomicSiteTheSampleObtainedFromTier = sample.getAnatomicSiteTheSampleObtainedFromTier(),
-                cancerType = sample.getCancerType(),
-                cancerTypeTier = sample.getCancerTypeTier(),
-                cancerSubtype = sample.getCancerSubtype(),
-                cancerSubtypeTier = sample.getCancerSubtypeTier(),
-                pathologyReportId = sample.getPathologyReportId(),
-                pathologyReportIdTier = sample.getPathologyReportIdTier(),
-                morphologicalCode = sample.getMorphologicalCode(),
-                morphologicalCodeTier = sample.getMorphologicalCodeTier(),
-                topologicalCode = sample.getTopologicalCode(),
-                topologicalCodeTier = sample.getTopologicalCodeTier(),
-                shippingDate = sample.getShippingDate(),
-                shippingDateTier = sample.getShippingDateTier(),
-                receivedDate = sample.getReceivedDate(),
-                receivedDateTier = sample.getReceivedDateTier(),
-                qualityControlPerformed = sample.getQualityControlPerformed(),
-                qualityControlPerformedTier = sample.getQualityControlPerformedTier(),
-                estimatedTumorContent = sample.getEstimatedTumorContent(),
-                estimatedTumorContentTier = sample.getEstimatedTumorContentTier(),
-                quantity = sample.getQuantity(),
-                quantityTier = sample.getQuantityTier(),
-                units = sample.getUnits(),
-                unitsTier = sample.getUnitsTier(),
-                associatedBiobank = sample.getAssociatedBiobank(),
-                associatedBiobankTier = sample.getAssociatedBiobankTier(),
-                otherBiobank = sample.getOtherBiobank(),
-                otherBiobankTier = sample.getOtherBiobankTier(),
-                sopFollowed = sample.getSopFollowed(),
-                sopFollowedTier = sample.getSopFollowedTier(),
-                ifNotExplainAnyDeviation = sample.getIfNotExplainAnyDeviation(),
-                ifNotExplainAnyDeviationTier = sample.getIfNotExplainAnyDeviationTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                sample.getLocalId(),
-                sample.getParentContainer().getLocalId())
+        self.insertSampleMany([sample])
 
-    def _readSampleTable(self):
+    def insertSampleMany(self, samples):
         """
-        Read the Sample table upon load
+        Inserts the specified samples into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Sample, clinical_metadata.Sample, dataset.addSample)
-
-    def _createTreatmentTable(self):
-        self.database.create_tables([models.Treatment])
+        self._insertClinPipeRows(models.Sample, samples)
 
     def insertTreatment(self, treatment):
         """
         Inserts the specified treatment into this repository.
         """
-        try:
-            models.Treatment.create(
-                # Common fields
-                id=treatment.getId(),
-                datasetId=treatment.getParentContainer().getId(),
-                created=treatment.getCreated(),
-                updated=treatment.getUpdated(),
-                name=treatment.getLocalId(),
-                description=treatment.getDescription(),
-                attributes=json.dumps(treatment.getAttributes()),
-
-                # Unique fields
-                patientId = treatment.getPatientId(),
-                patientIdTier = treatment.getPatientIdTier(),
-                courseNumber = treatment.getCourseNumber(),
-                courseNumberTier = treatment.getCourseNumberTier(),
-                therapeuticModality = treatment.getTherapeuticModality(),
-                therapeuticModalityTier = treatment.getTherapeuticModalityTier(),
-                treatmentPlanType = treatment.getTreatmentPlanType(),
-                treatmentPlanTypeTier = treatment.getTreatmentPlanTypeTier(),
-                treatmentIntent = treatment.getTreatmentIntent(),
-                treatmentIntentTier = treatment.getTreatmentIntentTier(),
-                startDate = treatment.getStartDate(),
-                startDateTier = treatment.getStartDateTier(),
-                stopDate = treatment.getStopDate(),
-                stopDateTier = treatment.getStopDateTier(),
-                reasonForEndingTheTreatment = treatment.getReasonForEndingTheTreatment(),
-                reasonForEndingTheTreatmentTier = treatment.getReasonForEndingTheTreatmentTier(),
-                responseToTreatment = treatment.getResponseToTreatment(),
-                responseToTreatmentTier = treatment.getResponseToTreatmentTier(),
-                responseCriteriaUsed = treatment.getResponseCriteriaUsed(),
-                responseCriteriaUsedTier = treatment.getResponseCriteriaUsedTier(),
-                dateOfRecurrenceOrProgressionAfterThisTreatment = treatment.getDateOfRecurrenceOrProgressionAfterThisTreatment(),
-                dateOfRecurrenceOrProgressionAfterThisTreatmentTier = treatment.getDateOfRecurrenceOrProgressionAfterThisTreatmentTier(),
-                unexpectedOrUnusualToxicityDuringTreatment = treatment.getUnexpectedOrUnusualToxicityDuringTreatment(),
-                unexpectedOrUnusualToxicityDuringTreatmentTier = treatment.getUnexpectedOrUnusualToxicityDuringTreatmentTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                treatment.getLocalId(),
-                treatment.getParentContainer().getLocalId())
+        self.insertTreatmentMany([treatment])
 
-    def _readTreatmentTable(self):
+    def insertTreatmentMany(self, treatments):
         """
-        Read the Treatment table upon load
+        Inserts the specified treatments into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Treatment, clinical_metadata.Treatment, dataset.addTreatment)
-
-    def _createOutcomeTable(self):
-        self.database.create_tables([models.Outcome])
+        self._insertClinPipeRows(models.Treatment, treatments)
 
     def insertOutcome(self, outcome):
         """
         Inserts the specified outcome into this repository.
         """
-        try:
-            models.Outcome.create(
-                # Common fields
-                id=outcome.getId(),
-                datasetId=outcome.getParentContainer().getId(),
-                created=outcome.getCreated(),
-                updated=outcome.getUpdated(),
-                name=outcome.getLocalId(),
-                description=outcome.getDescription(),
-                attributes=json.dumps(outcome.getAttributes()),
-
-                # Unique fields
-                patientId = outcome.getPatientId(),
-                patientIdTier = outcome.getPatientIdTier(),
-                physicalExamId = outcome.getPhysicalExamId(),
-                physicalExamIdTier = outcome.getPhysicalExamIdTier(),
-                dateOfAssessment = outcome.getDateOfAssessment(),
-                dateOfAssessmentTier = outcome.getDateOfAssessmentTier(),
-                diseaseResponseOrStatus = outcome.getDiseaseResponseOrStatus(),
-                diseaseResponseOrStatusTier = outcome.getDiseaseResponseOrStatusTier(),
-                otherResponseClassification = outcome.getOtherResponseClassification(),
-                otherResponseClassificationTier = outcome.getOtherResponseClassificationTier(),
-                minimalResidualDiseaseAssessment = outcome.getMinimalResidualDiseaseAssessment(),
-                minimalResidualDiseaseAssessmentTier = outcome.getMinimalResidualDiseaseAssessmentTier(),
-                methodOfResponseEvaluation = outcome.getMethodOfResponseEvaluation(),
-                methodOfResponseEvaluationTier = outcome.getMethodOfResponseEvaluationTier(),
-                responseCriteriaUsed = outcome.getResponseCriteriaUsed(),
-                responseCriteriaUsedTier = outcome.getResponseCriteriaUsedTier(),
-                summaryStage = outcome.getSummaryStage(),
-                summaryStageTier = outcome.getSummaryStageTier(),
-                sitesOfAnyProgressionOrRecurrence = outcome.getSitesOfAnyProgressionOrRecurrence(),
-                sitesOfAnyProgressionOrRecurrenceTier = outcome.getSitesOfAnyProgressionOrRecurrenceTier(),
-                vitalStatus = outcome.getVitalStatus(),
-                vitalStatusTier = outcome.getVitalStatusTier(),
-                height = outcome.getHeight(),
-                heightTier = outcome.getHeightTier(),
-                weight = outcome.getWeight(),
-                weightTier = outcome.getWeightTier(),
-                heightUnits = outcome.getHeightUnits(),
-                heightUnitsTier = outcome.getHeightUnitsTier(),
-                weightUnits = outcome.getWeightUnits(),
-                weightUnitsTier = outcome.getWeightUnitsTier(),
-                performanceStatus = outcome.getPerformanceStatus(),
-                performanceStatusTier = outcome.getPerformanceStatusTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                outcome.getLocalId(),
-                outcome.getParentContainer().getLocalId())
+        self.insertOutcomeMany([outcome])
 
-    def _readOutcomeTable(self):
+    def insertOutcomeMany(self, outcomes):
         """
-        Read the Outcome table upon load
+        Inserts the specified outcomes into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Outcome, clinical_metadata.Outcome, dataset.addOutcome)
-
-    def _createComplicationTable(self):
-        self.database.create_tables([models.Complication])
+        self._insertClinPipeRows(models.Outcome, outcomes)
 
     def insertComplication(self, complication):
         """
         Inserts the specified complication into this repository.
         """
-        try:
-            models.Complication.create(
-                # Common fields
-                id=complication.getId(),
-                datasetId=complication.getParentContainer().getId(),
-                created=complication.getCreated(),
-                updated=complication.getUpdated(),
-                name=complication.getLocalId(),
-                description=complication.getDescription(),
-                attributes=json.dumps(complication.getAttributes()),
-
-                # Unique fields
-                patientId = complication.getPatientId(),
-                patientIdTier = complication.getPatientIdTier(),
-                date = complication.getDate(),
-                dateTier = complication.getDateTier(),
-                lateComplicationOfTherapyDeveloped = complication.getLateComplicationOfTherapyDeveloped(),
-                lateComplicationOfTherapyDevelopedTier = complication.getLateComplicationOfTherapyDevelopedTier(),
-                lateToxicityDetail = complication.getLateToxicityDetail(),
-                lateToxicityDetailTier = complication.getLateToxicityDetailTier(),
-                suspectedTreatmentInducedNeoplasmDeveloped = complication.getSuspectedTreatmentInducedNeoplasmDeveloped(),
-                suspectedTreatmentInducedNeoplasmDevelopedTier = complication.getSuspectedTreatmentInducedNeoplasmDevelopedTier(),
-                treatmentInducedNeoplasmDetails = complication.getTreatmentInducedNeoplasmDetails(),
-                treatmentInducedNeoplasmDetailsTier = complication.getTreatmentInducedNeoplasmDetailsTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                complication.getLocalId(),
-                complication.getParentContainer().getLocalId())
+        self.insertComplicationMany([complication])
 
-    def _readComplicationTable(self):
+    def insertComplicationMany(self, complications):
         """
-        Read the Complication table upon load
+        Inserts the specified complications into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Complication, clinical_metadata.Complication, dataset.addComplication)
-
-    def _createTumourboardTable(self):
-        self.database.create_tables([models.Tumourboard])
+        self._insertClinPipeRows(models.Complication, complications)
 
     def insertTumourboard(self, tumourboard):
         """
         Inserts the specified tumourboard into this repository.
         """
-        try:
-            models.Tumourboard.create(
-                # Common fields
-                id=tumourboard.getId(),
-                datasetId=tumourboard.getParentContainer().getId(),
-                created=tumourboard.getCreated(),
-                updated=tumourboard.getUpdated(),
-                name=tumourboard.getLocalId(),
-                description=tumourboard.getDescription(),
-                attributes=json.dumps(tumourboard.getAttributes()),
-
-                # Unique fields
-                patientId = tumourboard.getPatientId(),
-                patientIdTier = tumourboard.getPatientIdTier(),
-                dateOfMolecularTumorBoard = tumourboard.getDateOfMolecularTumorBoard(),
-                dateOfMolecularTumorBoardTier = tumourboard.getDateOfMolecularTumorBoardTier(),
-                typeOfSampleAnalyzed = tumourboard.getTypeOfSampleAnalyzed(),
-                typeOfSampleAnalyzedTier = tumourboard.getTypeOfSampleAnalyzedTier(),
-                typeOfTumourSampleAnalyzed = tumourboard.getTypeOfTumourSampleAnalyzed(),
-                typeOfTumourSampleAnalyzedTier = tumourboard.getTypeOfTumourSampleAnalyzedTier(),
-                analysesDiscussed = tumourboard.getAnalysesDiscussed(),
-                analysesDiscussedTier = tumourboard.getAnalysesDiscussedTier(),
-                somaticSampleType = tumourboard.getSomaticSampleType(),
-                somaticSampleTypeTier = tumourboard.getSomaticSampleTypeTier(),
-                normalExpressionComparator = tumourboard.getNormalExpressionComparator(),
-                normalExpressionComparatorTier = tumourboard.getNormalExpressionComparatorTier(),
-                diseaseExpressionComparator = tumourboard.getDiseaseExpressionComparator(),
-                diseaseExpressionComparatorTier = tumourboard.getDiseaseExpressionComparatorTier(),
-                hasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancer = tumourboard.getHasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancer(),
-                hasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancerTier = tumourboard.getHasAGermlineVariantBeenIdentifiedByProfilingThatMayPredisposeToCancerTier(),
-                actionableTargetFound = tumourboard.getActionableTargetFound(),
-                actionableTargetFoundTier = tumourboard.getActionableTargetFoundTier(),
-                molecularTumorBoardRecommendation = tumourboard.getMolecularTumorBoardRecommendation(),
-                molecularTumorBoardRecommendationTier = tumourboard.getMolecularTumorBoardRecommendationTier(),
-                germlineDnaSampleId = tumourboard.getGermlineDnaSampleId(),
-                germlineDnaSampleIdTier = tumourboard.getGermlineDnaSampleIdTier(),
-                tumorDnaSampleId = tumourboard.getTumorDnaSampleId(),
-                tumorDnaSampleIdTier = tumourboard.getTumorDnaSampleIdTier(),
-                tumorRnaSampleId = tumourboard.getTumorRnaSampleId(),
-                tumorRnaSampleIdTier = tumourboard.getTumorRnaSampleIdTier(),
-                germlineSnvDiscussed = tumourboard.getGermlineSnvDiscussed(),
-                germlineSnvDiscussedTier = tumourboard.getGermlineSnvDiscussedTier(),
-                somaticSnvDiscussed = tumourboard.getSomaticSnvDiscussed(),
-                somaticSnvDiscussedTier = tumourboard.getSomaticSnvDiscussedTier(),
-                cnvsDiscussed = tumourboard.getCnvsDiscussed(),
-                cnvsDiscussedTier = tumourboard.getCnvsDiscussedTier(),
-                structuralVariantDiscussed = tumourboard.getStructuralVariantDiscussed(),
-                structuralVariantDiscussedTier = tumourboard.getStructuralVariantDiscussedTier(),
-                classificationOfVariants = tumourboard.getClassificationOfVariants(),
-                classificationOfVariantsTier = tumourboard.getClassificationOfVariantsTier(),
-                clinicalValidationProgress = tumourboard.getClinicalValidationProgress(),
-                clinicalValidationProgressTier = tumourboard.getClinicalValidationProgressTier(),
-                typeOfValidation = tumourboard.getTypeOfValidation(),
-                typeOfValidationTier = tumourboard.getTypeOfValidationTier(),
-                agentOrDrugClass = tumourboard.getAgentOrDrugClass(),
-                agentOrDrugClassTier = tumourboard.getAgentOrDrugClassTier(),
-                levelOfEvidenceForExpressionTargetAgentMatch = tumourboard.getLevelOfEvidenceForExpressionTargetAgentMatch(),
-                levelOfEvidenceForExpressionTargetAgentMatchTier = tumourboard.getLevelOfEvidenceForExpressionTargetAgentMatchTier(),
-                didTreatmentPlanChangeBasedOnProfilingResult = tumourboard.getDidTreatmentPlanChangeBasedOnProfilingResult(),
-                didTreatmentPlanChangeBasedOnProfilingResultTier = tumourboard.getDidTreatmentPlanChangeBasedOnProfilingResultTier(),
-                howTreatmentHasAlteredBasedOnProfiling = tumourboard.getHowTreatmentHasAlteredBasedOnProfiling(),
-                howTreatmentHasAlteredBasedOnProfilingTier = tumourboard.getHowTreatmentHasAlteredBasedOnProfilingTier(),
-                reasonTreatmentPlanDidNotChangeBasedOnProfiling = tumourboard.getReasonTreatmentPlanDidNotChangeBasedOnProfiling(),
-                reasonTreatmentPlanDidNotChangeBasedOnProfilingTier = tumourboard.getReasonTreatmentPlanDidNotChangeBasedOnProfilingTier(),
-                detailsOfTreatmentPlanImpact = tumourboard.getDetailsOfTreatmentPlanImpact(),
-                detailsOfTreatmentPlanImpactTier = tumourboard.getDetailsOfTreatmentPlanImpactTier(),
-                patientOrFamilyInformedOfGermlineVariant = tumourboard.getPatientOrFamilyInformedOfGermlineVariant(),
-                patientOrFamilyInformedOfGermlineVariantTier = tumourboard.getPatientOrFamilyInformedOfGermlineVariantTier(),
-                patientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfiling = tumourboard.getPatientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfiling(),
-                patientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfilingTier = tumourboard.getPatientHasBeenReferredToAHereditaryCancerProgramBasedOnThisMolecularProfilingTier(),
-                summaryReport = tumourboard.getSummaryReport(),
-                summaryReportTier = tumourboard.getSummaryReportTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                tumourboard.getLocalId(),
-                tumourboard.getParentContainer().getLocalId())
+        self.insertTumourboardMany([tumourboard])
 
-    def _readTumourboardTable(self):
+    def insertTumourboardMany(self, tumourboards):
         """
-        Read the Tumourboard table upon load
+        Inserts the specified tumourboards into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Tumourboard, clinical_metadata.Tumourboard, dataset.addTumourboard)
-
-    def _createChemotherapyTable(self):
-        self.database.create_tables([models.Chemotherapy])
+        self._insertClinPipeRows(models.Tumourboard, tumourboards)
 
     def insertChemotherapy(self, chemotherapy):
         """
         Inserts the specified chemotherapy into this repository.
         """
-        try:
-            models.Chemotherapy.create(
-                # Common fields
-                id=chemotherapy.getId(),
-                datasetId=chemotherapy.getParentContainer().getId(),
-                created=chemotherapy.getCreated(),
-                updated=chemotherapy.getUpdated(),
-                name=chemotherapy.getLocalId(),
-                description=chemotherapy.getDescription(),
-                attributes=json.dumps(chemotherapy.getAttributes()),
-
-                # Unique fields
-                patientId=chemotherapy.getPatientId(),
-                patientIdTier=chemotherapy.getPatientIdTier(),
-                courseNumber=chemotherapy.getCourseNumber(),
-                courseNumberTier=chemotherapy.getCourseNumberTier(),
-                startDate=chemotherapy.getStartDate(),
-                startDateTier=chemotherapy.getStartDateTier(),
-                stopDate=chemotherapy.getStopDate(),
-                stopDateTier=chemotherapy.getStopDateTier(),
-                systematicTherapyAgentName=chemotherapy.getSystematicTherapyAgentName(),
-                systematicTherapyAgentNameTier=chemotherapy.getSystematicTherapyAgentNameTier(),
-                route=chemotherapy.getRoute(),
-                routeTier=chemotherapy.getRouteTier(),
-                dose=chemotherapy.getDose(),
-                doseTier=chemotherapy.getDoseTier(),
-                doseFrequency=chemotherapy.getDoseFrequency(),
-                doseFrequencyTier=chemotherapy.getDoseFrequencyTier(),
-                doseUnit=chemotherapy.getDoseUnit(),
-                doseUnitTier=chemotherapy.getDoseUnitTier(),
-                daysPerCycle=chemotherapy.getDaysPerCycle(),
-                daysPerCycleTier=chemotherapy.getDaysPerCycleTier(),
-                numberOfCycle=chemotherapy.getNumberOfCycle(),
-                numberOfCycleTier=chemotherapy.getNumberOfCycleTier(),
-                treatmentIntent=chemotherapy.getTreatmentIntent(),
-                treatmentIntentTier=chemotherapy.getTreatmentIntentTier(),
-                treatingCentreName=chemotherapy.getTreatingCentreName(),
-                treatingCentreNameTier=chemotherapy.getTreatingCentreNameTier(),
-                type=chemotherapy.getType(),
-                typeTier=chemotherapy.getTypeTier(),
-                protocolCode=chemotherapy.getProtocolCode(),
-                protocolCodeTier=chemotherapy.getProtocolCodeTier(),
-                recordingDate=chemotherapy.getRecordingDate(),
-                recordingDateTier=chemotherapy.getRecordingDateTier(),
-                treatmentPlanId=chemotherapy.getTreatmentPlanId(),
-                treatmentPlanIdTier=chemotherapy.getTreatmentPlanIdTier(),
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                chemotherapy.getLocalId(),
-                chemotherapy.getParentContainer().getLocalId())
+        self.insertChemotherapyMany([chemotherapy])
 
-    def _readChemotherapyTable(self):
+    def insertChemotherapyMany(self, chemotherapies):
         """
-        Read the Chemotherapy table upon load
+        Inserts the specified chemotherapies into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Chemotherapy, clinical_metadata.Chemotherapy, dataset.addChemotherapy)
-
-    def _createRadiotherapyTable(self):
-        self.database.create_tables([models.Radiotherapy])
+        self._insertClinPipeRows(models.Chemotherapy, chemotherapies)
 
     def insertRadiotherapy(self, radiotherapy):
         """
         Inserts the specified radiotherapy into this repository.
         """
-        try:
-            models.Radiotherapy.create(
-                # Common fields
-                id=radiotherapy.getId(),
-                datasetId=radiotherapy.getParentContainer().getId(),
-                created=radiotherapy.getCreated(),
-                updated=radiotherapy.getUpdated(),
-                name=radiotherapy.getLocalId(),
-                description=radiotherapy.getDescription(),
-                attributes=json.dumps(radiotherapy.getAttributes()),
-
-                # Unique fields
-                patientId=radiotherapy.getPatientId(),
-                patientIdTier=radiotherapy.getPatientIdTier(),
-                courseNumber=radiotherapy.getCourseNumber(),
-                courseNumberTier=radiotherapy.getCourseNumberTier(),
-                startDate=radiotherapy.getStartDate(),
-                startDateTier=radiotherapy.getStartDateTier(),
-                stopDate=radiotherapy.getStopDate(),
-                stopDateTier=radiotherapy.getStopDateTier(),
-                therapeuticModality=radiotherapy.getTherapeuticModality(),
-                therapeuticModalityTier=radiotherapy.getTherapeuticModalityTier(),
-                baseline=radiotherapy.getBaseline(),
-                baselineTier=radiotherapy.getBaselineTier(),
-                testResult=radiotherapy.getTestResult(),
-                testResultTier=radiotherapy.getTestResultTier(),
-                testResultStd=radiotherapy.getTestResultStd(),
-                testResultStdTier=radiotherapy.getTestResultStdTier(),
-                treatingCentreName=radiotherapy.getTreatingCentreName(),
-                treatingCentreNameTier=radiotherapy.getTreatingCentreNameTier(),
-                startIntervalRad=radiotherapy.getStartIntervalRad(),
-                startIntervalRadTier=radiotherapy.getStartIntervalRadTier(),
-                startIntervalRadRaw=radiotherapy.getStartIntervalRadRaw(),
-                startIntervalRadRawTier=radiotherapy.getStartIntervalRadRawTier(),
-                recordingDate=radiotherapy.getRecordingDate(),
-                recordingDateTier=radiotherapy.getRecordingDateTier(),
-                adjacentFields=radiotherapy.getAdjacentFields(),
-                adjacentFieldsTier=radiotherapy.getAdjacentFieldsTier(),
-                adjacentFractions=radiotherapy.getAdjacentFractions(),
-                adjacentFractionsTier=radiotherapy.getAdjacentFractionsTier(),
-                complete=radiotherapy.getComplete(),
-                completeTier=radiotherapy.getCompleteTier(),
-                brachytherapyDose=radiotherapy.getBrachytherapyDose(),
-                brachytherapyDoseTier=radiotherapy.getBrachytherapyDoseTier(),
-                radiotherapyDose=radiotherapy.getRadiotherapyDose(),
-                radiotherapyDoseTier=radiotherapy.getRadiotherapyDoseTier(),
-                siteNumber=radiotherapy.getSiteNumber(),
-                siteNumberTier=radiotherapy.getSiteNumberTier(),
-                technique=radiotherapy.getTechnique(),
-                techniqueTier=radiotherapy.getTechniqueTier(),
-                treatedRegion=radiotherapy.getTreatedRegion(),
-                treatedRegionTier=radiotherapy.getTreatedRegionTier(),
-                treatmentPlanId=radiotherapy.getTreatmentPlanId(),
-                treatmentPlanIdTier=radiotherapy.getTreatmentPlanIdTier(),
-                radiationType=radiotherapy.getRadiationType(),
-                radiationTypeTier=radiotherapy.getRadiationTypeTier(),
-                radiationSite=radiotherapy.getRadiationSite(),
-                radiationSiteTier=radiotherapy.getRadiationSiteTier(),
-                totalDose=radiotherapy.getTotalDose(),
-                totalDoseTier=radiotherapy.getTotalDoseTier(),
-                boostSite=radiotherapy.getBoostSite(),
-                boostSiteTier=radiotherapy.getBoostSiteTier(),
-                boostDose=radiotherapy.getBoostDose(),
-                boostDoseTier=radiotherapy.getBoostDoseTier()
+        self.insertRadiotherapyMany([radiotherapy])
 
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                radiotherapy.getLocalId(),
-                radiotherapy.getParentContainer().getLocalId())
-
-    def _readRadiotherapyTable(self):
+    def insertRadiotherapyMany(self, radiotherapies):
         """
-        Read the Radiotherapy table upon load
+        Inserts the specified radiotherapies into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Radiotherapy, clinical_metadata.Radiotherapy, dataset.addRadiotherapy)
-
-    def _createSurgeryTable(self):
-        self.database.create_tables([models.Surgery])
+        self._insertClinPipeRows(models.Radiotherapy, radiotherapies)
 
     def insertSurgery(self, surgery):
         """
         Inserts the specified surgery into this repository.
         """
-        try:
-            models.Surgery.create(
-                # Common fields
-                id=surgery.getId(),
-                datasetId=surgery.getParentContainer().getId(),
-                created=surgery.getCreated(),
-                updated=surgery.getUpdated(),
-                name=surgery.getLocalId(),
-                description=surgery.getDescription(),
-                attributes=json.dumps(surgery.getAttributes()),
-
-                # Unique fields
-                patientId=surgery.getPatientId(),
-                patientIdTier=surgery.getPatientIdTier(),
-                startDate=surgery.getStartDate(),
-                startDateTier=surgery.getStartDateTier(),
-                stopDate=surgery.getStopDate(),
-                stopDateTier=surgery.getStopDateTier(),
-                sampleId=surgery.getSampleId(),
-                sampleIdTier=surgery.getSampleIdTier(),
-                collectionTimePoint=surgery.getCollectionTimePoint(),
-                collectionTimePointTier=surgery.getCollectionTimePointTier(),
-                diagnosisDate=surgery.getDiagnosisDate(),
-                diagnosisDateTier=surgery.getDiagnosisDateTier(),
-                site=surgery.getSite(),
-                siteTier=surgery.getSiteTier(),
-                type=surgery.getType(),
-                typeTier=surgery.getTypeTier(),
-                recordingDate=surgery.getRecordingDate(),
-                recordingDateTier=surgery.getRecordingDateTier(),
-                treatmentPlanId=surgery.getTreatmentPlanId(),
-                treatmentPlanIdTier=surgery.getTreatmentPlanIdTier(),
-                courseNumber=surgery.getCourseNumber(),
-                courseNumberTier=surgery.getCourseNumberTier()
+        self.insertSurgeryMany([surgery])
 
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                surgery.getLocalId(),
-                surgery.getParentContainer().getLocalId())
-
-    def _readSurgeryTable(self):
+    def insertSurgeryMany(self, surgeries):
         """
-        Read the Surgery table upon load
+        Inserts the specified surgeries into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Surgery, clinical_metadata.Surgery, dataset.addSurgery)
-
-    def _createImmunotherapyTable(self):
-        self.database.create_tables([models.Immunotherapy])
+        self._insertClinPipeRows(models.Surgery, surgeries)
 
     def insertImmunotherapy(self, immunotherapy):
         """
         Inserts the specified immunotherapy into this repository.
         """
-        try:
-            models.Immunotherapy.create(
-                # Common fields
-                id=immunotherapy.getId(),
-                datasetId=immunotherapy.getParentContainer().getId(),
-                created=immunotherapy.getCreated(),
-                updated=immunotherapy.getUpdated(),
-                name=immunotherapy.getLocalId(),
-                description=immunotherapy.getDescription(),
-                attributes=json.dumps(immunotherapy.getAttributes()),
-
-                # Unique fields
-                patientId=immunotherapy.getPatientId(),
-                patientIdTier=immunotherapy.getPatientIdTier(),
-                startDate=immunotherapy.getStartDate(),
-                startDateTier=immunotherapy.getStartDateTier(),
-                immunotherapyType=immunotherapy.getImmunotherapyType(),
-                immunotherapyTypeTier=immunotherapy.getImmunotherapyTypeTier(),
-                immunotherapyTarget=immunotherapy.getImmunotherapyTarget(),
-                immunotherapyTargetTier=immunotherapy.getImmunotherapyTargetTier(),
-                immunotherapyDetail=immunotherapy.getImmunotherapyDetail(),
-                immunotherapyDetailTier=immunotherapy.getImmunotherapyDetailTier(),
-                treatmentPlanId=immunotherapy.getTreatmentPlanId(),
-                treatmentPlanIdTier=immunotherapy.getTreatmentPlanIdTier(),
-                courseNumber=immunotherapy.getCourseNumber(),
-                courseNumberTier=immunotherapy.getCourseNumberTier()
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                immunotherapy.getLocalId(),
-                immunotherapy.getParentContainer().getLocalId())
+        self.insertImmunotherapyMany([immunotherapy])
 
-    def _readImmunotherapyTable(self):
+    def insertImmunotherapyMany(self, immunotherapies):
         """
-        Read the Immunotherapy table upon load
+        Inserts the specified immunotherapies into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Immunotherapy, clinical_metadata.Immunotherapy, dataset.addImmunotherapy)
-
-    def _createCelltransplantTable(self):
-        self.database.create_tables([models.Celltransplant])
+        self._insertClinPipeRows(models.Immunotherapy, immunotherapies)
 
     def insertCelltransplant(self, celltransplant):
         """
         Inserts the specified celltransplant into this repository.
         """
-        try:
-            models.Celltransplant.create(
-                # Common fields
-                id=celltransplant.getId(),
-                datasetId=celltransplant.getParentContainer().getId(),
-                created=celltransplant.getCreated(),
-                updated=celltransplant.getUpdated(),
-                name=celltransplant.getLocalId(),
-                description=celltransplant.getDescription(),
-                attributes=json.dumps(celltransplant.getAttributes()),
-
-                # Unique fields
-                patientId=celltransplant.getPatientId(),
-                patientIdTier=celltransplant.getPatientIdTier(),
-                startDate=celltransplant.getStartDate(),
-                startDateTier=celltransplant.getStartDateTier(),
-                cellSource=celltransplant.getCellSource(),
-                cellSourceTier=celltransplant.getCellSourceTier(),
-                donorType=celltransplant.getDonorType(),
-                donorTypeTier=celltransplant.getDonorTypeTier(),
-                treatmentPlanId=celltransplant.getTreatmentPlanId(),
-                treatmentPlanIdTier=celltransplant.getTreatmentPlanIdTier(),
-                courseNumber=celltransplant.getCourseNumber(),
-                courseNumberTier=celltransplant.getCourseNumberTier()
+        self.insertCelltransplantMany([celltransplant])
 
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                celltransplant.getLocalId(),
-                celltransplant.getParentContainer().getLocalId())
-
-    def _readCelltransplantTable(self):
+    def insertCelltransplantMany(self, celltransplants):
         """
-        Read the Celltransplant table upon load
+        Inserts the specified celltransplants into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Celltransplant, clinical_metadata.Celltransplant, dataset.addCelltransplant)
-
-    def _createSlideTable(self):
-        self.database.create_tables([models.Slide])
+        self._insertClinPipeRows(models.Celltransplant, celltransplants)
 
     def insertSlide(self, slide):
         """
         Inserts the specified slide into this repository.
         """
-        try:
-            models.Slide.create(
-                # Common fields
-                id=slide.getId(),
-                datasetId=slide.getParentContainer().getId(),
-                created=slide.getCreated(),
-                updated=slide.getUpdated(),
-                name=slide.getLocalId(),
-                description=slide.getDescription(),
-                attributes=json.dumps(slide.getAttributes()),
-
-                # Unique fields
-                patientId=slide.getPatientId(),
-                patientIdTier=slide.getPatientIdTier(),
-                sampleId=slide.getSampleId(),
-                sampleIdTier=slide.getSampleIdTier(),
-                slideId=slide.getSlideId(),
-                slideIdTier=slide.getSlideIdTier(),
-                slideOtherId=slide.getSlideOtherId(),
-                slideOtherIdTier=slide.getSlideOtherIdTier(),
-                lymphocyteInfiltrationPercent=slide.getLymphocyteInfiltrationPercent(),
-                lymphocyteInfiltrationPercentTier=slide.getLymphocyteInfiltrationPercentTier(),
-                tumorNucleiPercent=slide.getTumorNucleiPercent(),
-                tumorNucleiPercentTier=slide.getTumorNucleiPercentTier(),
-                monocyteInfiltrationPercent=slide.getMonocyteInfiltrationPercent(),
-                monocyteInfiltrationPercentTier=slide.getMonocyteInfiltrationPercentTier(),
-                normalCellsPercent=slide.getNormalCellsPercent(),
-                normalCellsPercentTier=slide.getNormalCellsPercentTier(),
-                tumorCellsPercent=slide.getTumorCellsPercent(),
-                tumorCellsPercentTier=slide.getTumorCellsPercentTier(),
-                stromalCellsPercent=slide.getStromalCellsPercent(),
-                stromalCellsPercentTier=slide.getStromalCellsPercentTier(),
-                eosinophilInfiltrationPercent=slide.getEosinophilInfiltrationPercent(),
-                eosinophilInfiltrationPercentTier=slide.getEosinophilInfiltrationPercentTier(),
-                neutrophilInfiltrationPercent=slide.getNeutrophilInfiltrationPercent(),
-                neutrophilInfiltrationPercentTier=slide.getNeutrophilInfiltrationPercentTier(),
-                granulocyteInfiltrationPercent=slide.getGranulocyteInfiltrationPercent(),
-                granulocyteInfiltrationPercentTier=slide.getGranulocyteInfiltrationPercentTier(),
-                necrosisPercent=slide.getNecrosisPercent(),
-                necrosisPercentTier=slide.getNecrosisPercentTier(),
-                inflammatoryInfiltrationPercent=slide.getInflammatoryInfiltrationPercent(),
-                inflammatoryInfiltrationPercentTier=slide.getInflammatoryInfiltrationPercentTier(),
-                proliferatingCellsNumber=slide.getProliferatingCellsNumber(),
-                proliferatingCellsNumberTier=slide.getProliferatingCellsNumberTier(),
-                sectionLocation=slide.getSectionLocation(),
-                sectionLocationTier=slide.getSectionLocationTier(),
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                slide.getLocalId(),
-                slide.getParentContainer().getLocalId())
+        self.insertSlideMany([slide])
 
-    def _readSlideTable(self):
+    def insertSlideMany(self, slides):
         """
-        Read the Slide table upon load
+        Inserts the specified slides into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Slide, clinical_metadata.Slide, dataset.addSlide)
-
-    def _createStudyTable(self):
-        self.database.create_tables([models.Study])
+        self._insertClinPipeRows(models.Slide, slides)
 
     def insertStudy(self, study):
         """
         Inserts the specified study into this repository.
         """
-        try:
-            models.Study.create(
-                # Common fields
-                id=study.getId(),
-                datasetId=study.getParentContainer().getId(),
-                created=study.getCreated(),
-                updated=study.getUpdated(),
-                name=study.getLocalId(),
-                description=study.getDescription(),
-                attributes=json.dumps(study.getAttributes()),
-
-                # Unique fields
-                patientId=study.getPatientId(),
-                patientIdTier=study.getPatientIdTier(),
-                startDate=study.getStartDate(),
-                startDateTier=study.getStartDateTier(),
-                endDate=study.getEndDate(),
-                endDateTier=study.getEndDateTier(),
-                status=study.getStatus(),
-                statusTier=study.getStatusTier(),
-                recordingDate=study.getRecordingDate(),
-                recordingDateTier=study.getRecordingDateTier(),
+        self.insertStudyMany([study])
 
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                study.getLocalId(),
-                study.getParentContainer().getLocalId())
-
-    def _readStudyTable(self):
+    def insertStudyMany(self, studies):
         """
-        Read the Study table upon load
+        Inserts the specified studies into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Study, clinical_metadata.Study, dataset.addStudy)
-
-    def _createLabtestTable(self):
-        self.database.create_tables([models.Labtest])
+        self._insertClinPipeRows(models.Study, studies)
 
     def insertLabtest(self, labtest):
         """
         Inserts the specified labtest into this repository.
         """
-        try:
-            models.Labtest.create(
-                # Common fields
-                id=labtest.getId(),
-                datasetId=labtest.getParentContainer().getId(),
-                created=labtest.getCreated(),
-                updated=labtest.getUpdated(),
-                name=labtest.getLocalId(),
-                description=labtest.getDescription(),
-                attributes=json.dumps(labtest.getAttributes()),
-
-                # Unique fields
-                patientId=labtest.getPatientId(),
-                patientIdTier=labtest.getPatientIdTier(),
-                startDate=labtest.getStartDate(),
-                startDateTier=labtest.getStartDateTier(),
-                collectionDate=labtest.getCollectionDate(),
-                collectionDateTier=labtest.getCollectionDateTier(),
-                endDate=labtest.getEndDate(),
-                endDateTier=labtest.getEndDateTier(),
-                eventType=labtest.getEventType(),
-                eventTypeTier=labtest.getEventTypeTier(),
-                testResults=labtest.getTestResults(),
-                testResultsTier=labtest.getTestResultsTier(),
-                timePoint=labtest.getTimePoint(),
-                timePointTier=labtest.getTimePointTier(),
-                recordingDate=labtest.getRecordingDate(),
-                recordingDateTier=labtest.getRecordingDateTier(),
-
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                labtest.getLocalId(),
-                labtest.getParentContainer().getLocalId())
+        self.insertLabtestMany([labtest])
 
-    def _readLabtestTable(self):
+    def insertLabtestMany(self, labtests):
         """
-        Read the Labtest table upon load
+        Inserts the specified labtests into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Labtest, clinical_metadata.Labtest, dataset.addLabtest)
-
-    def _createExtractionTable(self):
-        self.database.create_tables([models.Extraction])
+        self._insertClinPipeRows(models.Labtest, labtests)
 
     def insertExtraction(self, extraction):
         """
         Inserts the specified patient into this repository.
         """
-        try:
-            models.Extraction.create(
-                # Common fields
-                id=extraction.getId(),
-                datasetId=extraction.getParentContainer().getId(),
-                created=extraction.getCreated(),
-                updated=extraction.getUpdated(),
-                name=extraction.getLocalId(),
-                description=extraction.getDescription(),
-                attributes=json.dumps(extraction.getAttributes()),
-                # Unique fields
-                extractionId=extraction.getExtractionId(),
-                extractionIdTier=extraction.getExtractionIdTier(),
-                sampleId=extraction.getSampleId(),
-                sampleIdTier=extraction.getSampleIdTier(),
-                rnaBlood=extraction.getRnaBlood(),
-                rnaBloodTier=extraction.getRnaBloodTier(),
-                dnaBlood=extraction.getDnaBlood(),
-                dnaBloodTier=extraction.getDnaBloodTier(),
-                rnaTissue=extraction.getRnaTissue(),
-                rnaTissueTier=extraction.getRnaTissueTier(),
-                dnaTissue=extraction.getDnaTissue(),
-                dnaTissueTier=extraction.getDnaTissueTier(),
-                site=extraction.getSite(),
-                siteTier=extraction.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                extraction.getLocalId(),
-                extraction.getParentContainer().getLocalId())
+        self.insertExtractionMany([extraction])
 
-    def _readExtractionTable(self):
+    def insertExtractionMany(self, extractions):
         """
-        Read the Extraction table upon load
+        Inserts the specified extractions into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Extraction, pipeline_metadata.Extraction, dataset.addExtraction)
-
-    def _createSequencingTable(self):
-        self.database.create_tables([models.Sequencing])
+        self._insertClinPipeRows(models.Extraction, extractions)
 
     def insertSequencing(self, sequencing):
         """
         Inserts the specified patient into this repository.
         """
-        try:
-            models.Sequencing.create(
-                # Common fields
-                id=sequencing.getId(),
-                datasetId=sequencing.getParentContainer().getId(),
-                created=sequencing.getCreated(),
-                updated=sequencing.getUpdated(),
-                name=sequencing.getLocalId(),
-                description=sequencing.getDescription(),
-                attributes=json.dumps(sequencing.getAttributes()),
-                # Unique fields
-                sequencingId=sequencing.getSequencingId(),
-                sequencingIdTier=sequencing.getSequencingIdTier(),
-                sampleId=sequencing.getSampleId(),
-                sampleIdTier=sequencing.getSampleIdTier(),
-                dnaLibraryKit=sequencing.getDnaLibraryKit(),
-                dnaLibraryKitTier=sequencing.getDnaLibraryKitTier(),
-                dnaSeqPlatform=sequencing.getDnaSeqPlatform(),
-                dnaSeqPlatformTier=sequencing.getDnaSeqPlatformTier(),
-                dnaReadLength=sequencing.getDnaReadLength(),
-                dnaReadLengthTier=sequencing.getDnaReadLengthTier(),
-                rnaLibraryKit=sequencing.getRnaLibraryKit(),
-                rnaLibraryKitTier=sequencing.getRnaLibraryKitTier(),
-                rnaSeqPlatform=sequencing.getRnaSeqPlatform(),
-                rnaSeqPlatformTier=sequencing.getRnaSeqPlatformTier(),
-                rnaReadLength=sequencing.getRnaReadLength(),
-                rnaReadLengthTier=sequencing.getRnaReadLengthTier(),
-                pcrCycles=sequencing.getPcrCycles(),
-                pcrCyclesTier=sequencing.getPcrCyclesTier(),
-                extractionId=sequencing.getExtractionId(),
-                extractionIdTier=sequencing.getExtractionIdTier(),
-                site=sequencing.getSite(),
-                siteTier=sequencing.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                sequencing.getLocalId(),
-                sequencing.getParentContainer().getLocalId())
+        self.insertSequencingMany([sequencing])
 
-    def _readSequencingTable(self):
+    def insertSequencingMany(self, sequencings):
         """
-        Read the Sequencing table upon load
+        Inserts the specified sequencings into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Sequencing, pipeline_metadata.Sequencing, dataset.addSequencing)
-
-    def _createAlignmentTable(self):
-        self.database.create_tables([models.Alignment])
+        self._insertClinPipeRows(models.Sequencing, sequencings)
 
     def insertAlignment(self, alignment):
         """
         Inserts the specified patient into this repository.
         """
-        try:
-            models.Alignment.create(
-                # Common fields
-                id=alignment.getId(),
-                datasetId=alignment.getParentContainer().getId(),
-                created=alignment.getCreated(),
-                updated=alignment.getUpdated(),
-                name=alignment.getLocalId(),
-                description=alignment.getDescription(),
-                attributes=json.dumps(alignment.getAttributes()),
-                # Unique fields
-                alignmentId=alignment.getAlignmentId(),
-                alignmentIdTier=alignment.getAlignmentIdTier(),
-                sampleId=alignment.getSampleId(),
-                sampleIdTier=alignment.getSampleIdTier(),
-                alignmentTool=alignment.getAlignmentTool(),
-                alignmentToolTier=alignment.getAlignmentToolTier(),
-                mergeTool=alignment.getMergeTool(),
-                mergeToolTier=alignment.getMergeToolTier(),
-                inHousePipeline=alignment.getInHousePipeline(),
-                inHousePipelineTier=alignment.getInHousePipelineTier(),
-                markDuplicates=alignment.getMarkDuplicates(),
-                markDuplicatesTier=alignment.getMarkDuplicatesTier(),
-                realignerTarget=alignment.getRealignerTarget(),
-                realignerTargetTier=alignment.getRealignerTargetTier(),
-                indelRealigner=alignment.getIndelRealigner(),
-                indelRealignerTier=alignment.getIndelRealignerTier(),
-                coverage=alignment.getCoverage(),
-                coverageTier=alignment.getCoverageTier(),
-                baseRecalibrator=alignment.getBaseRecalibrator(),
-                baseRecalibratorTier=alignment.getBaseRecalibratorTier(),
-                printReads=alignment.getPrintReads(),
-                printReadsTier=alignment.getPrintReadsTier(),
-                idxStats=alignment.getIdxStats(),
-                idxStatsTier=alignment.getIdxStatsTier(),
-                flagStat=alignment.getFlagStat(),
-                flagStatTier=alignment.getFlagStatTier(),
-                insertSizeMetrics=alignment.getInsertSizeMetrics(),
-                insertSizeMetricsTier=alignment.getInsertSizeMetricsTier(),
-                fastqc=alignment.getFastqc(),
-                fastqcTier=alignment.getFastqcTier(),
-                reference=alignment.getReference(),
-                referenceTier=alignment.getReferenceTier(),
-                sequencingId=alignment.getSequencingId(),
-                sequencingIdTier=alignment.getSequencingIdTier(),
-                site=alignment.getSite(),
-                siteTier=alignment.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                alignment.getLocalId(),
-                alignment.getParentContainer().getLocalId())
+        self.insertAlignmentMany([alignment])
 
-    def _readAlignmentTable(self):
+    def insertAlignmentMany(self, alignments):
         """
-        Read the Alignment table upon load
+        Inserts the specified alignments into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.Alignment, pipeline_metadata.Alignment, dataset.addAlignment)
-
-    def _createVariantCallingTable(self):
-        self.database.create_tables([models.VariantCalling])
+        self._insertClinPipeRows(models.Alignment, alignments)
 
     def insertVariantCalling(self, variantCalling):
         """
         Inserts the specified patient into this repository.
         """
-        try:
-            models.VariantCalling.create(
-                # Common fields
-                id=variantCalling.getId(),
-                datasetId=variantCalling.getParentContainer().getId(),
-                created=variantCalling.getCreated(),
-                updated=variantCalling.getUpdated(),
-                name=variantCalling.getLocalId(),
-                description=variantCalling.getDescription(),
-                attributes=json.dumps(variantCalling.getAttributes()),
-                # Unique fields
-                variantCallingId=variantCalling.getVariantCallingId(),
-                variantCallingIdTier=variantCalling.getVariantCallingIdTier(),
-                sampleId=variantCalling.getSampleId(),
-                sampleIdTier=variantCalling.getSampleIdTier(),
-                variantCaller=variantCalling.getVariantCaller(),
-                variantCallerTier=variantCalling.getVariantCallerTier(),
-                tabulate=variantCalling.getTabulate(),
-                tabulateTier=variantCalling.getTabulateTier(),
-                inHousePipeline=variantCalling.getInHousePipeline(),
-                inHousePipelineTier=variantCalling.getInHousePipelineTier(),
-                annotation=variantCalling.getAnnotation(),
-                annotationTier=variantCalling.getAnnotationTier(),
-                mergeTool=variantCalling.getMergeTool(),
-                mergeToolTier=variantCalling.getMergeToolTier(),
-                rdaToTab=variantCalling.getRdaToTab(),
-                rdaToTabTier=variantCalling.getRdaToTabTier(),
-                delly=variantCalling.getDelly(),
-                dellyTier=variantCalling.getDellyTier(),
-                postFilter=variantCalling.getPostFilter(),
-                postFilterTier=variantCalling.getPostFilterTier(),
-                clipFilter=variantCalling.getClipFilter(),
-                clipFilterTier=variantCalling.getClipFilterTier(),
-                cosmic=variantCalling.getCosmic(),
-                cosmicTier=variantCalling.getCosmicTier(),
-                dbSnp=variantCalling.getDbSnp(),
-                dbSnpTier=variantCalling.getDbSnpTier(),
-                alignmentId=variantCalling.getAlignmentId(),
-                alignmentIdTier=variantCalling.getAlignmentIdTier(),
-                site=variantCalling.getSite(),
-                siteTier=variantCalling.getSiteTier()
+        self.insertVariantCallingMany([variantCalling])
 
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                variantCalling.getLocalId(),
-                variantCalling.getParentContainer().getLocalId())
-
-    def _readVariantCallingTable(self):
+    def insertVariantCallingMany(self, variantCallings):
         """
-        Read the VariantCalling table upon load
+        Inserts the specified variantCallings into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.VariantCalling, pipeline_metadata.VariantCalling, dataset.addVariantCalling)
-
-    def _createFusionDetectionTable(self):
-        self.database.create_tables([models.FusionDetection])
+        self._insertClinPipeRows(models.VariantCalling, variantCallings)
 
     def insertFusionDetection(self, fusionDetection):
         """
         Inserts the specified patient into this repository.
         """
-        try:
-            models.FusionDetection.create(
-                # Common fields
-                id=fusionDetection.getId(),
-                datasetId=fusionDetection.getParentContainer().getId(),
-                created=fusionDetection.getCreated(),
-                updated=fusionDetection.getUpdated(),
-                name=fusionDetection.getLocalId(),
-                description=fusionDetection.getDescription(),
-                attributes=json.dumps(fusionDetection.getAttributes()),
-                # Unique fields
-                fusionDetectionId=fusionDetection.getFusionDetectionId(),
-                fusionDetectionIdTier=fusionDetection.getFusionDetectionIdTier(),
-                sampleId=fusionDetection.getSampleId(),
-                sampleIdTier=fusionDetection.getSampleIdTier(),
-                inHousePipeline=fusionDetection.getInHousePipeline(),
-                inHousePipelineTier=fusionDetection.getInHousePipelineTier(),
-                svDetection=fusionDetection.getSvDetection(),
-                svDetectionTier=fusionDetection.getSvDetectionTier(),
-                fusionDetection=fusionDetection.getFusionDetection(),
-                fusionDetectionTier=fusionDetection.getFusionDetectionTier(),
-                realignment=fusionDetection.getRealignment(),
-                realignmentTier=fusionDetection.getRealignmentTier(),
-                annotation=fusionDetection.getAnnotation(),
-                annotationTier=fusionDetection.getAnnotationTier(),
-                genomeReference=fusionDetection.getGenomeReference(),
-                genomeReferenceTier=fusionDetection.getGenomeReferenceTier(),
-                geneModels=fusionDetection.getGeneModels(),
-                geneModelsTier=fusionDetection.getGeneModelsTier(),
-                alignmentId=fusionDetection.getAlignmentId(),
-                alignmentIdTier=fusionDetection.getAlignmentIdTier(),
-                site=fusionDetection.getSite(),
-                siteTier=fusionDetection.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                fusionDetection.getLocalId(),
-                fusionDetection.getParentContainer().getLocalId())
+        self.insertFusionDetectionMany([fusionDetection])
 
-    def _readFusionDetectionTable(self):
+    def insertFusionDetectionMany(self, fusionDetections):
         """
-        Read the FusionDetection table upon load
+        Inserts the specified fusionDetections into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.FusionDetection, pipeline_metadata.FusionDetection, dataset.addFusionDetection)
-
-    def _createExpressionAnalysisTable(self):
-        self.database.create_tables([models.ExpressionAnalysis])
+        self._insertClinPipeRows(models.FusionDetection, fusionDetections)
 
     def insertExpressionAnalysis(self, expressionAnalysis):
         """
         Inserts the specified patient into this repository.
         """
-        try:
-            models.ExpressionAnalysis.create(
-                # Common fields
-                id=expressionAnalysis.getId(),
-                datasetId=expressionAnalysis.getParentContainer().getId(),
-                created=expressionAnalysis.getCreated(),
-                updated=expressionAnalysis.getUpdated(),
-                name=expressionAnalysis.getLocalId(),
-                description=expressionAnalysis.getDescription(),
-                attributes=json.dumps(expressionAnalysis.getAttributes()),
-                # Unique fields
-                expressionAnalysisId=expressionAnalysis.getExpressionAnalysisId(),
-                expressionAnalysisIdTier=expressionAnalysis.getExpressionAnalysisIdTier(),
-                sampleId=expressionAnalysis.getSampleId(),
-                sampleIdTier=expressionAnalysis.getSampleIdTier(),
-                readLength=expressionAnalysis.getReadLength(),
-                readLengthTier=expressionAnalysis.getReadLengthTier(),
-                reference=expressionAnalysis.getReference(),
-                referenceTier=expressionAnalysis.getReferenceTier(),
-                alignmentTool=expressionAnalysis.getAlignmentTool(),
-                alignmentToolTier=expressionAnalysis.getAlignmentToolTier(),
-                bamHandling=expressionAnalysis.getBamHandling(),
-                bamHandlingTier=expressionAnalysis.getBamHandlingTier(),
-                expressionEstimation=expressionAnalysis.getExpressionEstimation(),
-                expressionEstimationTier=expressionAnalysis.getExpressionEstimationTier(),
-                sequencingId=expressionAnalysis.getSequencingId(),
-                sequencingIdTier=expressionAnalysis.getSequencingIdTier(),
-                site=expressionAnalysis.getSite(),
-                siteTier=expressionAnalysis.getSiteTier()
-            )
-        except Exception:
-            raise exceptions.DuplicateNameException(
-                expressionAnalysis.getLocalId(),
-                expressionAnalysis.getParentContainer().getLocalId())
+        self.insertExpressionAnalysisMany([expressionAnalysis])
 
-    def _readExpressionAnalysisTable(self):
+    def insertExpressionAnalysisMany(self, expressionAnalyses):
         """
-        Read the ExpressionAnalysis table upon load
+        Inserts the specified expressionAnalyses into this repository.
         """
-        for dataset in self.getDatasets():
-            self._readClinPipeTable(dataset, models.ExpressionAnalysis, pipeline_metadata.ExpressionAnalysis, dataset.addExpressionAnalysis)
+        self._insertClinPipeRows(models.ExpressionAnalysis, expressionAnalyses)
 
 
     def initialise(self):
@@ -2100,31 +1625,10 @@ class SqlDataRepository(AbstractDataRepository):
         and file paths.
         """
         self._checkWriteMode()
-        self._createSystemTable()
-        self._createDatasetTable()
-        self._createPatientTable()
-        self._createEnrollmentTable()
-        self._createConsentTable()
-        self._createDiagnosisTable()
-        self._createSampleTable()
-        self._createTreatmentTable()
-        self._createOutcomeTable()
-        self._createComplicationTable()
-        self._createTumourboardTable()
-        self._createChemotherapyTable()
-        self._createRadiotherapyTable()
-        self._createSurgeryTable()
-        self._createImmunotherapyTable()
-        self._createCelltransplantTable()
-        self._createSlideTable()
-        self._createStudyTable()
-        self._createLabtestTable()
-        self._createExtractionTable()
-        self._createSequencingTable()
-        self._createAlignmentTable()
-        self._createVariantCallingTable()
-        self._createFusionDetectionTable()
-        self._createExpressionAnalysisTable()
+        with self.database.atomic():
+            self._createSystemTable()
+            self._createDatasetTable()
+            self._createClinPipeTables()
 
     def exists(self):
         """
@@ -2151,27 +1655,9 @@ class SqlDataRepository(AbstractDataRepository):
         Loads this data repository into memory.
         """
         self._readSystemTable()
-        self._readDatasetTable()
-        self._readPatientTable()
-        self._readEnrollmentTable()
-        self._readConsentTable()
-        self._readDiagnosisTable()
-        self._readSampleTable()
-        self._readTreatmentTable()
-        self._readOutcomeTable()
-        self._readComplicationTable()
-        self._readTumourboardTable()
-        self._readChemotherapyTable()
-        self._readRadiotherapyTable()
-        self._readSurgeryTable()
-        self._readImmunotherapyTable()
-        self._readCelltransplantTable()
-        self._readSlideTable()
-        self._readStudyTable()
-        self._readLabtestTable()
-        self._readExtractionTable()
-        self._readSequencingTable()
-        self._readAlignmentTable()
-        self._readVariantCallingTable()
-        self._readFusionDetectionTable()
-        self._readExpressionAnalysisTable()
+        # Hold a single connection, and a single read transaction, for the
+        # rest of the load rather than acquiring them per table.
+        with self.database.connection_context():
+            with self.database.atomic():
+                self._readDatasetTable()
+                self._readClinPipeTables()
@@ -17,6 +17,7 @@ Options:
 
 """
 
+import collections
 import json
 import os
 from docopt import docopt
@@ -25,6 +26,7 @@ from candig.metadata.ingest import _version as version
 
 import candig.metadata.datarepo as repo
 import candig.metadata.exceptions as exceptions
+import candig.metadata.repo.models as models
 
 from candig.metadata.datamodel.datasets import Dataset
 from candig.metadata.datamodel.clinical_metadata import Patient
@@ -72,119 +74,165 @@ class CandigRepo(object):
             'Patient': {
                 'table': Patient,
                 'local_id': ['patientId'],
-                'repo_add': self.add_patient
+                'repo_add': self.add_patient,
+                'repo_add_many': self.add_patient_many,
+                'model': models.Patient
             },
             'Enrollment': {
                 'table': Enrollment,
                 'local_id': ["patientId", "enrollmentApprovalDate"],
-                'repo_add': self.add_enrollment
+                'repo_add': self.add_enrollment,
+                'repo_add_many': self.add_enrollment_many,
+                'model': models.Enrollment
             },
             'Consent': {
                 'table': Consent,
                 'local_id': ["patientId", "consentDate"],
-                'repo_add': self.add_consent
+                'repo_add': self.add_consent,
+                'repo_add_many': self.add_consent_many,
+                'model': models.Consent
             },
             'Diagnosis': {
                 'table': Diagnosis,
                 'local_id': ["patientId", "diagnosisDate"],
-                'repo_add': self.add_diagnosis
+                'repo_add': self.add_diagnosis,
+                'repo_add_many': self.add_diagnosis_many,
+                'model': models.Diagnosis
             },
             'Sample': {
                 'table': Sample,
                 'local_id': ["patientId", "sampleId"],
-                'repo_add': self.add_sample
+                'repo_add': self.add_sample,
+                'repo_add_many': self.add_sample_many,
+                'model': models.Sample
             },
             'Treatment': {
                 'table': Treatment,
                 'local_id': ["patientId", "startDate"],
-                'repo_add': self.add_treatment
+                'repo_add': self.add_treatment,
+                'repo_add_many': self.add_treatment_many,
+                'model': models.Treatment
             },
             'Outcome': {
                 'table': Outcome,
                 'local_id': ["patientId", "dateOfAssessment"],
-                'repo_add': self.add_outcome
+                'repo_add': self.add_outcome,
+                'repo_add_many': self.add_outcome_many,
+                'model': models.Outcome
             },
             'Complication': {
                 'table': Complication,
                 'local_id': ["patientId", "date"],
-                'repo_add': self.add_complication
+                'repo_add': self.add_complication,
+                'repo_add_many': self.add_complication_many,
+                'model': models.Complication
             },
             'Tumourboard': {
                 'table': Tumourboard,
                 'local_id': ["patientId", "dateOfMolecularTumorBoard"],
-                'repo_add': self.add_tumourboard
+                'repo_add': self.add_tumourboard,
+                'repo_add_many': self.add_tumourboard_many,
+                'model': models.Tumourboard
             },
             'Chemotherapy': {
                 'table': Chemotherapy,
                 'local_id': ["patientId", "treatmentPlanId", "systematicTherapyAgentName"],
-                'repo_add': self.add_chemotherapy
+                'repo_add': self.add_chemotherapy,
+                'repo_add_many': self.add_chemotherapy_many,
+                'model': models.Chemotherapy
             },
             'Radiotherapy': {
                 'table': Radiotherapy,
                 'local_id': ["patientId", "courseNumber", "treatmentPlanId", "startDate"],
-                'repo_add': self.add_radiotherapy
+                'repo_add': self.add_radiotherapy,
+                'repo_add_many': self.add_radiotherapy_many,
+                'model': models.Radiotherapy
             },
             'Immunotherapy': {
                 'table': Immunotherapy,
                 'local_id': ["patientId", "treatmentPlanId", "startDate"],
-                'repo_add': self.add_immunotherapy
+                'repo_add': self.add_immunotherapy,
+                'repo_add_many': self.add_immunotherapy_many,
+                'model': models.Immunotherapy
             },
             'Surgery': {
                 'table': Surgery,
                 'local_id': ["patientId", "treatmentPlanId", "startDate", "sampleId"],
-                'repo_add': self.add_surgery
+                'repo_add': self.add_surgery,
+                'repo_add_many': self.add_surgery_many,
+                'model': models.Surgery
             },
             'Celltransplant': {
                 'table': Celltransplant,
                 'local_id': ["patientId", "treatmentPlanId", "startDate"],
-                'repo_add': self.add_celltransplant
+                'repo_add': self.add_celltransplant,
+                'repo_add_many': self.add_celltransplant_many,
+                'model': models.Celltransplant
             },
             'Slide': {
                 'table': Slide,
                 'local_id': ["patientId", "slideId"],
-                'repo_add': self.add_slide
+                'repo_add': self.add_slide,
+                'repo_add_many': self.add_slide_many,
+                'model': models.Slide
             },
             'Study': {
                 'table': Study,
                 'local_id': ["patientId", "startDate"],
-                'repo_add': self.add_study
+                'repo_add': self.add_study,
+                'repo_add_many': self.add_study_many,
+                'model': models.Study
             },
             'Labtest': {
                 'table': Labtest,
                 'local_id': ["patientId", "startDate"],
-                'repo_add': self.add_labtest
+                'repo_add': self.add_labtest,
+                'repo_add_many': self.add_labtest_many,
+                'model': models.Labtest
             }
         }
         self.pipeline_metadata_map = {
             'Extraction': {
                 'table': Extraction,
                 'local_id': ["sampleId", "extractionId"],
-                'repo_add': self.add_extraction
+                'repo_add': self.add_extraction,
+                'repo_add_many': self.add_extraction_many,
+                'model': models.Extraction
             },
             'Sequencing': {
                 'table': Sequencing,
                 'local_id': ["sampleId", "sequencingId"],
-                'repo_add': self.add_sequencing
+                'repo_add': self.add_sequencing,
+                'repo_add_many': self.add_sequencing_many,
+                'model': models.Sequencing
             },
             'Alignment': {
                 'table': Alignment,
                 'local_id': ["sampleId", "alignmentId"],
-                'repo_add': self.add_alignment
+                'repo_add': self.add_alignment,
+                'repo_add_many': self.add_alignment_many,
+                'model': models.Alignment
             },
             'VariantCalling': {
                 'table': VariantCalling,
                 'local_id': ["sampleId", "variantCallingId"],
-                'repo_add': self.add_variant_calling
+                'repo_add': self.add_variant_calling,
+                'repo_add_many': self.add_variant_calling_many,
+                'model': models.VariantCalling
             },
             'FusionDetection': {
                 'table': FusionDetection,
                 'local_id': ["sampleId", "fusionDetectionId"],
-                'repo_add': self.add_fusion_detection
+                'repo_add': self.add_fusion_detection,
+                'repo_add_many': self.add_fusion_detection_many,
+                'model': models.FusionDetection
             },
             'ExpressionAnalysis': {
                 'table': ExpressionAnalysis,
                 'local_id': ["sampleId", "expressionAnalysisId"],
-                'repo_add': self.add_expression_analysis
+                'repo_add': self.add_expression_analysis,
+                'repo_add_many': self.add_expression_analysis_many,
+                'model': models.ExpressionAnalysis
             }
         }
 
@@ -212,116 +260,238 @@ class CandigRepo(object):
         self._repo.commit()
         self._repo.verify()
 
+    def add_patient_many(self, patients):
+        self._repo.insertPatientMany(patients)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_enrollment(self, enrollment):
         self._repo.insertEnrollment(enrollment)
         self._repo.commit()
         self._repo.verify()
 
+    def add_enrollment_many(self, enrollments):
+        self._repo.insertEnrollmentMany(enrollments)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_consent(self, consent):
         self._repo.insertConsent(consent)
         self._repo.commit()
         self._repo.verify()
 
+    def add_consent_many(self, consents):
+        self._repo.insertConsentMany(consents)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_diagnosis(self, diagnosis):
         self._repo.insertDiagnosis(diagnosis)
         self._repo.commit()
         self._repo.verify()
 
+    def add_diagnosis_many(self, diagnoses):
+        self._repo.insertDiagnosisMany(diagnoses)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_sample(self, sample):
         self._repo.insertSample(sample)
         self._repo.commit()
         self._repo.verify()
 
+    def add_sample_many(self, samples):
+        self._repo.insertSampleMany(samples)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_treatment(self, treatment):
         self._repo.insertTreatment(treatment)
         self._repo.commit()
         self._repo.verify()
 
+    def add_treatment_many(self, treatments):
+        self._repo.insertTreatmentMany(treatments)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_outcome(self, outcome):
         self._repo.insertOutcome(outcome)
         self._repo.commit()
         self._repo.verify()
 
+    def add_outcome_many(self, outcomes):
+        self._repo.insertOutcomeMany(outcomes)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_complication(self, complication):
         self._repo.insertComplication(complication)
         self._repo.commit()
         self._repo.verify()
 
+    def add_complication_many(self, complications):
+        self._repo.insertComplicationMany(complications)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_tumourboard(self, tumourboard):
         self._repo.insertTumourboard(tumourboard)
         self._repo.commit()
         self._repo.verify()
 
+    def add_tumourboard_many(self, tumourboards):
+        self._repo.insertTumourboardMany(tumourboards)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_chemotherapy(self, chemotherapy):
         self._repo.insertChemotherapy(chemotherapy)
         self._repo.commit()
         self._repo.verify()
 
+    def add_chemotherapy_many(self, chemotherapies):
+        self._repo.insertChemotherapyMany(chemotherapies)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_radiotherapy(self, radiotherapy):
         self._repo.insertRadiotherapy(radiotherapy)
         self._repo.commit()
         self._repo.verify()
 
+    def add_radiotherapy_many(self, radiotherapies):
+        self._repo.insertRadiotherapyMany(radiotherapies)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_immunotherapy(self, immunotherapy):
         self._repo.insertImmunotherapy(immunotherapy)
         self._repo.commit()
         self._repo.verify()
 
+    def add_immunotherapy_many(self, immunotherapies):
+        self._repo.insertImmunotherapyMany(immunotherapies)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_surgery(self, surgery):
         self._repo.insertSurgery(surgery)
         self._repo.commit()
         self._repo.verify()
 
+    def add_surgery_many(self, surgeries):
+        self._repo.insertSurgeryMany(surgeries)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_celltransplant(self, celltransplant):
         self._repo.insertCelltransplant(celltransplant)
         self._repo.commit()
         self._repo.verify()
 
+    def add_celltransplant_many(self, celltransplants):
+        self._repo.insertCelltransplantMany(celltransplants)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_slide(self, slide):
         self._repo.insertSlide(slide)
         self._repo.commit()
         self._repo.verify()
 
+    def add_slide_many(self, slides):
+        self._repo.insertSlideMany(slides)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_study(self, study):
         self._repo.insertStudy(study)
         self._repo.commit()
         self._repo.verify()
 
+    def add_study_many(self, studies):
+        self._repo.insertStudyMany(studies)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_labtest(self, labtest):
         self._repo.insertLabtest(labtest)
         self._repo.commit()
         self._repo.verify()
 
+    def add_labtest_many(self, labtests):
+        self._repo.insertLabtestMany(labtests)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_extraction(self, extraction):
         self._repo.insertExtraction(extraction)
         self._repo.commit()
         self._repo.verify()
 
+    def add_extraction_many(self, extractions):
+        self._repo.insertExtractionMany(extractions)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_sequencing(self, sequencing):
         self._repo.insertSequencing(sequencing)
         self._repo.commit()
         self._repo.verify()
 
+    def add_sequencing_many(self, sequencings):
+        self._repo.insertSequencingMany(sequencings)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_alignment(self, alignment):
         self._repo.insertAlignment(alignment)
         self._repo.commit()
         self._repo.verify()
 
+    def add_alignment_many(self, alignments):
+        self._repo.insertAlignmentMany(alignments)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_variant_calling(self, variant_calling):
         self._repo.insertVariantCalling(variant_calling)
         self._repo.commit()
         self._repo.verify()
 
+    def add_variant_calling_many(self, variant_callings):
+        self._repo.insertVariantCallingMany(variant_callings)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_fusion_detection(self, fusion_detection):
         self._repo.insertFusionDetection(fusion_detection)
         self._repo.commit()
         self._repo.verify()
 
+    def add_fusion_detection_many(self, fusion_detections):
+        self._repo.insertFusionDetectionMany(fusion_detections)
+        self._repo.commit()
+        self._repo.verify()
+
     def add_expression_analysis(self, expression_analysis):
         self._repo.insertExpressionAnalysis(expression_analysis)
         self._repo.commit()
         self._repo.verify()
 
+    def add_expression_analysis_many(self, expression_analyses):
+        self._repo.insertExpressionAnalysisMany(expression_analyses)
+        self._repo.commit()
+        self._repo.verify()
+
+    def existing_ids(self, model, objs):
+        """
+        Return the ids of the objects that are already in the model's
+        table of the repo.
+        """
+        return self._repo.getExistingIds(model, [obj.getId() for obj in objs])
+
 
 def main():
     """
@@ -358,11 +528,17 @@ def main():
                 'pipeline_metadata': repo.pipeline_metadata_map
             }
             metadata_key = list(metadata.keys())[0]
+            pending = collections.OrderedDict()
+            # (position in the file, message) for each skipped record, so
+            # that they are reported in input order once all are added
+            skipped = []
 
             # Iterate through metadata file type based on key and update the dataset
+            position = 0
             for individual in metadata[metadata_key]:
 
                 for table in individual:
+                    position += 1
                     if table in metadata_map[metadata_key]:
 
                         record = individual[table]
@@ -371,11 +547,11 @@ def main():
                             if record.get(x):
                                 local_id_list.append(record[x])
                             else:
-                                print("Skipped: Missing 1 or more primary identifiers for record in: {0} needs {1}, received {2}".format(
+                                skipped.append((position, "Skipped: Missing 1 or more primary identifiers for record in: {0} needs {1}, received {2}".format(
                                     table,
                                     metadata_map[metadata_key][table]['local_id'],
                                     local_id_list,
-                                    ))
+                                    )))
                                 local_id_list = None
                                 break
                         if not local_id_list:
@@ -386,12 +562,42 @@ def main():
                         obj = metadata_map[metadata_key][table]['table'](dataset, localId=local_id)
                         repo_obj = obj.populateFromJson(json.dumps(record))
 
-                        # Add object into the repo file
+                        pending.setdefault(table, []).append(
+                            (position, repo_obj, local_id))
+
+            # Add the objects into the repo file a table at a time
+            for table, entries in pending.items():
+                table_map = metadata_map[metadata_key][table]
+                duplicate_message = "Skipped: Duplicate {0} detected for local name: {1} {2}"
+                # Skip the records that are already in the repo, or earlier
+                # in this file, up front rather than by catching the
+                # exception raised by the insert
+                existing = repo.existing_ids(
+                    table_map['model'], [repo_obj for _, repo_obj, _ in entries])
+                new_entries = []
+                for position, repo_obj, local_id in entries:
+                    if repo_obj.getId() in existing:
+                        skipped.append((position, duplicate_message.format(
+                            table, local_id, table_map['local_id'])))
+                    else:
+                        existing.add(repo_obj.getId())
+                        new_entries.append((position, repo_obj, local_id))
+                try:
+                    table_map['repo_add_many'](
+                        [repo_obj for _, repo_obj, _ in new_entries])
+                except exceptions.DuplicateNameException:
+                    # The repo changed underneath us and the batch was
+                    # rolled back; add the records one at a time to skip
+                    # and report each duplicate
+                    for position, repo_obj, local_id in new_entries:
                         try:
-                            metadata_map[metadata_key][table]['repo_add'](repo_obj)
+                            table_map['repo_add'](repo_obj)
                         except exceptions.DuplicateNameException:
-                            print("Skipped: Duplicate {0} detected for local name: {1} {2}".format(
-                                table, local_id, metadata_map[metadata_key][table]['local_id']))
+                            skipped.append((position, duplicate_message.format(
+                                table, local_id, table_map['local_id'])))
+
+            for _, message in sorted(skipped, key=lambda skip: skip[0]):
+                print(message)
 
     return None
 
@@ -14,6 +14,7 @@ https://peewee.readthedocs.io/en/latest/peewee/models.html
 """
 
 import peewee as pw
+import playhouse.pool
 import datetime
 # The databaseProxy is used to dynamically changed the
 # backing database and needs to be set to an actual
@@ -26,6 +27,13 @@ class SqliteDatabase(pw.SqliteDatabase):
         super(SqliteDatabase, self).__init__(*_, **__)
 
 
+class PooledSqliteDatabase(playhouse.pool.PooledSqliteDatabase):
+    # Hands out already-open connections instead of reconnecting to the
+    # file for every unit of work.
+    def __init__(self, *_, **__):
+        super(PooledSqliteDatabase, self).__init__(*_, **__)
+
+
 class BaseModel(pw.Model):
     attributes = pw.TextField(null=True)
 
@@ -20,14 +20,19 @@ Options:
 
 import os
 import re
-import glob
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from docopt import docopt
 
+# Trailing ".0" components, which don't affect version comparison
+_TRAILING_ZEROS = re.compile(r'(\.0+)*$')
+
 
 class ProtoBufGenerator():
     """Run protoc to process schema files."""
 
+    __slots__ = ('version',)
+
     def __init__(self, version: str):
         """
         Set version information.
@@ -44,7 +49,7 @@ class ProtoBufGenerator():
         """
         self.version = version
 
-    def _find_in_path(self, cmd: str = 'protoc') -> str:
+    def _find_in_path(self, cmd: str = 'protoc'):
         """
         Find a command in environment PATH.
 
@@ -53,21 +58,19 @@ class ProtoBufGenerator():
         cmd : str
             Command to look for, like "protoc".
 
-        Returns
-        -------
-        hits : list of str
-            Potential protoc pathes
+        Yields
+        ------
+        hit : str
+            Potential protoc pathes, in PATH order. They are found lazily,
+            so the search stops once the caller has a usable one.
 
         """
-        hits = []
-        for folder in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        for folder in os.get_exec_path():
 
             possible = os.path.join(folder, cmd)
 
             if os.path.exists(possible):
-                hits.append(possible)
-
-        return hits
+                yield possible
 
     # https://stackoverflow.com/questions/22490366/how-to-use-cmp-in-python-3
     def _cmp(self, a, b):
@@ -76,7 +79,7 @@ class ProtoBufGenerator():
     # From http://stackoverflow.com/a/1714190/320546
     def _version_compare(self, version1, version2):
         def normalize(v):
-            return [int(x) for x in re.sub(r'(\.0+)*$', '', v).split(".")]
+            return [int(x) for x in _TRAILING_ZEROS.sub('', v).split(".")]
         return self._cmp(normalize(version1), normalize(version2))
 
     def _getProtoc(self) -> str:
@@ -113,11 +116,11 @@ class ProtoBufGenerator():
                 break
 
             except Exception:
-                print(
+                print((
                     "Not using {path} because it returned " +
                     "'{version}' rather than \"libprotoc <version>\", where " +
                     "<version> >= 3.0.0").format(
-                        path=protoc_program, version=output)
+                        path=protoc_program, version=output))
 
         if protoc is None:
             raise Exception("Can't find a good protoc.")
@@ -150,6 +153,33 @@ class ProtoBufGenerator():
         except IOError:
             print('Error while writting version information')
 
+    def _find_proto_files(self, folder: str):
+        """
+        Find the proto schema files under a folder.
+
+        Walks the tree with os.scandir, whose entries already know whether
+        they are directories, skipping hidden entries as glob does.
+
+        Parameters
+        ----------
+        folder : str
+            Path information of the folder to search.
+
+        Yields
+        ------
+        filename : str
+            Path of each .proto file found.
+
+        """
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    yield from self._find_proto_files(entry.path)
+                elif entry.name.endswith('.proto'):
+                    yield entry.path
+
     def remove_file_descriptors(self, pb2_filename: str):
         """
         Remove "file=DESCRIPTOR" from the fielddescriptions.
@@ -169,23 +199,67 @@ class ProtoBufGenerator():
         """
         print(pb2_filename)
         # Read pb2 file content
-        content = ''
         try:
             with open(pb2_filename, 'r') as filehandler:
-                for line in filehandler.readlines():
-                    # Remove the "file=DESCRIPTOR" terms
-                    content = ''.join(
-                        (content, line.replace(', file=DESCRIPTOR', ''))
-                    )
-        except IOError():
+                # Remove the "file=DESCRIPTOR" terms in a single pass
+                content = filehandler.read().replace(', file=DESCRIPTOR', '')
+        except IOError:
             print('Error accessing {0} file'.format(pb2_filename))
+            # Leave the file alone rather than overwrite it with nothing
+            return
         # Overwrite the original file
         try:
             with open(pb2_filename, 'w') as filehandler:
                 filehandler.write(content)
-        except IOError():
+        except IOError:
             print('Error could not overwrite {0} file'.format(pb2_filename))
 
+    def _compile(self, protoc: str, schema_path: str, pb2_path: str,
+                 filename: str):
+        """
+        Run protoc on a single proto schema file.
+
+        Parameters
+        ----------
+        protoc : str
+            Protoc path to use.
+        schema_path : str
+            Path information of the folder contains the proto files.
+        pb2_path : str
+            Path information where the processed files will be placed.
+        filename : str
+            Path of the proto file to process.
+
+        Returns
+        -------
+        None.
+
+        """
+        # Run protoc directly rather than through a shell
+        command = [
+            protoc,
+            '-I={}'.format(schema_path),
+            '--python_out={}'.format(pb2_path),
+            filename,
+        ]
+        print(' '.join(command))
+
+        # Run protoc to process the files
+        try:
+            subprocess.run(command, check=True)
+        except subprocess.CalledProcessError:
+            print('ERROR running: {}'.format(' '.join(command)))
+            # There is no output to clean up; fail the run through run()
+            raise
+
+        self.remove_file_descriptors(
+            pb2_filename='{pb2_path}{proto_filename}_pb2.py'.format(
+                pb2_path=pb2_path,
+                proto_filename=filename.replace(
+                    schema_path, '').replace('.proto', '')
+            ),
+        )
+
     def run(self, schema_path: str, pb2_path: str):
         """
         Execute schema processing.
@@ -215,33 +289,17 @@ class ProtoBufGenerator():
         with open('{0}/__init__.py'.format(pb2_path), 'w'):
             pass
 
-        # Find all proto schema files
-        pattern = '{}/**/*.proto'.format(schema_path)
-        for filename in glob.glob(pattern, recursive=True):
-
-            # Run protoc to process the files
-            command = '{protoc} -I={schema} --python_out={pb2} {filename}'
-            command = command.format(
-                protoc=protoc,
-                schema=schema_path,
-                pb2=pb2_path,
-                filename=filename,#.replace(schema_path, ''),
-            )
-            print(command)
-
-            # Run protoc to process the files
-            try:
-                subprocess.run(command, shell=True, check=True)
-            except subprocess.CalledProcessError:
-                print('ERROR running: {}'.format(command))
-
-            self.remove_file_descriptors(
-                pb2_filename='{pb2_path}{proto_filename}_pb2.py'.format(
-                    pb2_path=pb2_path,
-                    proto_filename=filename.replace(
-                        schema_path, '').replace('.proto', '')
-                ),
-            )
+        # Find all proto schema files and compile them concurrently; the
+        # work happens in the protoc subprocesses, so threads are enough
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(
+                    self._compile, protoc, schema_path, pb2_path, filename)
+                for filename in self._find_proto_files(schema_path)
+            ]
+            # Re-raise anything that went wrong in a worker
+            for future in futures:
+                future.result()
 
         self._writeVersionFile(pb2_path)
 
@@ -9,34 +9,44 @@ except ImportError:
     use_setuptools()
     from setuptools import setup
 
-with open("README.rst") as readmeFile:
-    long_description = readmeFile.read()
 
-install_requires = []
-with open("requirements.txt") as requirementsFile:
-    for line in requirementsFile:
-        line = line.strip()
-        if line and not line.startswith('#'):
-            if line.find('-c constraints.txt') == -1:
-                pinnedVersion = line.split()[0]
-                install_requires.append(pinnedVersion)
+def readLongDescription():
+    with open("README.rst") as readmeFile:
+        return readmeFile.read()
 
-dependency_links = []
-try:
-    with open("constraints.txt") as constraintsFile:
-        for line in constraintsFile:
+
+def readInstallRequires():
+    install_requires = []
+    with open("requirements.txt") as requirementsFile:
+        for line in requirementsFile:
             line = line.strip()
             if line and not line.startswith('#'):
-                dependency_links.append(line)
-except EnvironmentError:
-    print('No constraints file found, proceeding without '
-          'creating dependency links.')
+                if line.find('-c constraints.txt') == -1:
+                    pinnedVersion = line.split()[0]
+                    install_requires.append(pinnedVersion)
+    return install_requires
+
+
+def readDependencyLinks():
+    dependency_links = []
+    try:
+        with open("constraints.txt") as constraintsFile:
+            for line in constraintsFile:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    dependency_links.append(line)
+    except EnvironmentError:
+        print('No constraints file found, proceeding without '
+              'creating dependency links.')
+    return dependency_links
+
 
 setup(
     name="metadata_service",
     description="Metadata service implementation of the CanDIG APIs",
+    # candig is a PEP 420 implicit namespace package, shared with the
+    # other CanDIG services, so it has no __init__.py of its own
     packages=[
-        "candig",
         "candig.metadata",
         "candig.metadata.datamodel",
         "candig.metadata.cli",
@@ -48,10 +58,6 @@ setup(
         "candig.metadata.static",
         "candig.metadata.static.dist",
     ],
-    namespace_packages=[
-        "candig",
-        # "candig.metadata",
-    ],
     zip_safe=False,
     url="https://github.com/CanDIG/metadata_service",
     use_scm_version=True,
@@ -68,9 +74,9 @@ setup(
             'metadata_load_tier=candig.metadata.ingest.load_tiers:main',
         ]
     },
-    long_description=long_description,
-    install_requires=install_requires,
-    dependency_links=dependency_links,
+    long_description=readLongDescription(),
+    install_requires=readInstallRequires(),
+    dependency_links=readDependencyLinks(),
     license='Apache License 2.0',
     include_package_data=True,
     author="CanDIG Team",
@@ -1,29 +1,39 @@
 """Centralizes hardcoded paths, names, etc. used in tests."""
 
+import functools
 import os
+from pathlib import PurePath
 
 
 packageName = 'candig'
 
 
+@functools.lru_cache(maxsize=None)
 def getProjectRootFilePath():
     # assumes we're in a directory one level below the project root
     return os.path.dirname(os.path.dirname(__file__))
 
 
+@functools.lru_cache(maxsize=None)
 def getGa4ghFilePath():
     return os.path.join(getProjectRootFilePath(), packageName)
 
 
-testDir = 'tests'
-testDataDir = os.path.join(testDir, 'data')
-testDataRepo = os.path.join(testDataDir, 'registry.db')
-testAccessList = os.path.join(testDataDir, 'acl.tsv')
+# Pure paths never touch the filesystem; the constants are joined once
+# and exposed as plain strings.
+_testDir = PurePath('tests')
+_testDataDir = _testDir / 'data'
+_datasetsDir = _testDataDir / 'datasets'
+
+testDir = str(_testDir)
+testDataDir = str(_testDataDir)
+testDataRepo = str(_testDataDir / 'registry.db')
+testAccessList = str(_testDataDir / 'acl.tsv')
 
 # datasets
 datasetName = "dataset1"
-datasetsDir = os.path.join(testDataDir, "datasets")
-datasetDir = os.path.join(datasetsDir, "dataset1")
+datasetsDir = str(_datasetsDir)
+datasetDir = str(_datasetsDir / datasetName)
 
 # misc.
-landingMessageHtml = os.path.join(testDataDir, "test.html")
+landingMessageHtml = str(_testDataDir / "test.html")
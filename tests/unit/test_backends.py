@@ -61,24 +61,26 @@ class TestAbstractBackend(unittest.TestCase):
 
     def testGetDatasetBadId(self):
         for badId in ["", None, "NO SUCH ID"]:
-            self.assertRaises(
-                exceptions.DatasetNotFoundException,
-                self._dataRepo.getDataset, badId)
+            with self.subTest(badId=badId), self.assertRaises(
+                    exceptions.DatasetNotFoundException):
+                self._dataRepo.getDataset(badId)
 
     def testGetDatasetBadName(self):
         for badName in ["", None, "NO SUCH NAME"]:
-            self.assertRaises(
-                exceptions.DatasetNameNotFoundException,
-                self._dataRepo.getDatasetByName, badName)
+            with self.subTest(badName=badName), self.assertRaises(
+                    exceptions.DatasetNameNotFoundException):
+                self._dataRepo.getDatasetByName(badName)
 
     def testGetDatasetByIndexBadIndex(self):
-        self.assertRaises(IndexError, self._dataRepo.getDatasetByIndex, 0)
-        self.assertRaises(TypeError, self._dataRepo.getDatasetByIndex, None)
-        self.assertRaises(TypeError, self._dataRepo.getDatasetByIndex, "")
+        badIndexes = [(0, IndexError), (None, TypeError), ("", TypeError)]
+        for badIndex, exception in badIndexes:
+            with self.subTest(badIndex=badIndex), self.assertRaises(exception):
+                self._dataRepo.getDatasetByIndex(badIndex)
         datasetName = "ds"
         dataset = datasets.Dataset(datasetName)
         self._dataRepo.addDataset(dataset)
-        self.assertRaises(IndexError, self._dataRepo.getDatasetByIndex, 1)
+        with self.assertRaises(IndexError):
+            self._dataRepo.getDatasetByIndex(1)
 
 
 class TestSqlRepoTestData(unittest.TestCase):
@@ -87,9 +89,15 @@ class TestSqlRepoTestData(unittest.TestCase):
     files in the tests/data directory.
     """
 
-    def setUp(self):
-        self._dataRepo = datarepo.SqlDataRepository(paths.testDataRepo)
-        self._dataRepo.open(datarepo.MODE_READ)
+    @classmethod
+    def setUpClass(cls):
+        # The repo is only read, so it is opened once for all the tests
+        cls._dataRepo = datarepo.SqlDataRepository(paths.testDataRepo)
+        cls._dataRepo.open(datarepo.MODE_READ)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._dataRepo.close()
 
     def testDatasets(self):
         self.assertEqual(self._dataRepo.getNumDatasets(), 1)
@@ -98,6 +106,17 @@ class TestSqlRepoTestData(unittest.TestCase):
         self.assertEqual(self._dataRepo.getDatasetByName("dataset1"), dataset)
 
 
+class FakeTopLevelObject(object):
+    __slots__ = ()
+
+    def toProtocolElement(self, tier=0):
+        return self
+
+
+# These are never modified, so the tests can share them
+_fakeTopLevelObjects = tuple(FakeTopLevelObject() for _ in range(3))
+
+
 class TestTopLevelObjectGenerator(unittest.TestCase):
     """
     Tests the generator used for top level objects
@@ -107,14 +126,10 @@ class TestTopLevelObjectGenerator(unittest.TestCase):
         class FakeRequest(object):
             pass
 
-        class FakeTopLevelObject(object):
-            def toProtocolElement(self, tier=0):
-                return self
-
         self.request = FakeRequest()
         self.request.page_token = ""
-        self.num_objects = 3
-        self.objects = [FakeTopLevelObject() for j in range(self.num_objects)]
+        self.num_objects = len(_fakeTopLevelObjects)
+        self.objects = _fakeTopLevelObjects
         self.backend = backend.Backend(datarepo.AbstractDataRepository())
 
     def getObjectByIndex(self, index):
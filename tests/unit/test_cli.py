@@ -2,14 +2,14 @@
 Tests the cli
 """
 
+import contextlib
+import io
 import unittest
 import shlex
 
 import candig.metadata.cli.server as cli_server
 import candig.metadata.cli.repomanager as cli_repomanager
 
-import candig.metadata.protocol as protocol
-
 
 class TestServerArguments(unittest.TestCase):
     """
@@ -30,47 +30,60 @@ class TestServerArguments(unittest.TestCase):
 
 class TestRepoManagerCli(unittest.TestCase):
 
-    def setUp(self):
-        self.parser = cli_repomanager.RepoManager.getParser()
-        self.registryPath = 'a/repo/path'
-        self.datasetName = "datasetName"
-        self.filePath = 'a/file/path'
-        self.dirPath = 'a/dir/path/'
-        self.individualName = "test"
-        self.biosampleName = "test"
-        self.individual = protocol.toJson(
-            protocol.Individual(
-                name="test",
-                created="2016-05-19T21:00:19Z",
-                updated="2016-05-19T21:00:19Z"))
-        self.biosample = protocol.toJson(
-            protocol.Biosample(
-                name="test",
-                created="2016-05-19T21:00:19Z",
-                updated="2016-05-19T21:00:19Z"))
+    registryPath = 'a/repo/path'
+    datasetName = "datasetName"
+
+    @classmethod
+    def setUpClass(cls):
+        # The parser is only read, so one full parser serves all the tests
+        cls.parser = cli_repomanager.RepoManager.getParser()
+
+    def parseArgs(self, cliInput):
+        return self.parser.parse_args(cliInput.split())
+
+    def testParserForSubcommand(self):
+        # No subcommand takes more than four positional arguments; any
+        # left over are returned unparsed
+        positionals = [self.registryPath, "a", "b", "c"]
+        for name, _, runner, _ in cli_repomanager.RepoManager._subcommands:
+            args = [name] + positionals
+            with self.subTest(subcommand=name):
+                parser = cli_repomanager.RepoManager.getParser(args)
+                parsedArgs, _ = parser.parse_known_args(args)
+                self.assertEqual(parsedArgs.runner, runner)
+                self.assertEqual(parsedArgs.registryPath, self.registryPath)
+                parsedArgs, _ = self.parser.parse_known_args(args)
+                self.assertEqual(parsedArgs.runner, runner)
+
+    def testParserOnlyForNamedSubcommand(self):
+        parser = cli_repomanager.RepoManager.getParser(
+            ["verify", self.registryPath])
+        with contextlib.redirect_stderr(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            parser.parse_args(["init", self.registryPath])
 
     def testInit(self):
         cliInput = "init {}".format(self.registryPath)
-        args = self.parser.parse_args(cliInput.split())
+        args = self.parseArgs(cliInput)
         self.assertEqual(args.registryPath, self.registryPath)
         self.assertEqual(args.runner, "init")
 
     def testVerify(self):
         cliInput = "verify {}".format(self.registryPath)
-        args = self.parser.parse_args(cliInput.split())
+        args = self.parseArgs(cliInput)
         self.assertEqual(args.registryPath, self.registryPath)
         self.assertEqual(args.runner, "verify")
 
     def testList(self):
         cliInput = "list {}".format(self.registryPath)
-        args = self.parser.parse_args(cliInput.split())
+        args = self.parseArgs(cliInput)
         self.assertEqual(args.registryPath, self.registryPath)
         self.assertEqual(args.runner, "list")
 
     def testAddDataset(self):
         cliInput = "add-dataset {} {}".format(
             self.registryPath, self.datasetName)
-        args = self.parser.parse_args(cliInput.split())
+        args = self.parseArgs(cliInput)
         self.assertEqual(args.registryPath, self.registryPath)
         self.assertEqual(args.datasetName, self.datasetName)
         self.assertEqual(args.runner, "addDataset")
@@ -78,7 +91,7 @@ class TestRepoManagerCli(unittest.TestCase):
     def testRemoveDataset(self):
         cliInput = "remove-dataset {} {} -f".format(
             self.registryPath, self.datasetName)
-        args = self.parser.parse_args(cliInput.split())
+        args = self.parseArgs(cliInput)
         self.assertEqual(args.registryPath, self.registryPath)
         self.assertEqual(args.datasetName, self.datasetName)
         self.assertEqual(args.runner, "removeDataset")
@@ -6,7 +6,11 @@ import os
 import tempfile
 import unittest
 
+import mock
+
 import candig.metadata.datarepo as datarepo
+import candig.metadata.datamodel.clinical_metadata as clinMetadata
+import candig.metadata.datamodel.datasets as datasets
 import candig.metadata.exceptions as exceptions
 
 
@@ -89,3 +93,53 @@ class TestBadDatabaseNoSetup(unittest.TestCase):
         repo = datarepo.SqlDataRepository("aFilePathThatDoesNotExist")
         with self.assertRaises(exceptions.RepoNotFoundException):
             repo.open(datarepo.MODE_READ)
+
+
+class TestInsertMany(AbstractDataRepoTest):
+    """
+    Tests that batches of clinical records are written together and that
+    a duplicate in a batch rejects the whole batch.
+    """
+    def setUp(self):
+        super(TestInsertMany, self).setUp()
+        self._repo = datarepo.SqlDataRepository(self._repoPath)
+        self._repo.open(datarepo.MODE_WRITE)
+        self._repo.initialise()
+        self._dataset = datasets.Dataset('ds1')
+        self._repo.insertDataset(self._dataset)
+
+    def _readPatientNames(self):
+        anotherRepo = datarepo.SqlDataRepository(self._repoPath)
+        anotherRepo.open(datarepo.MODE_READ)
+        dataset = anotherRepo.getDatasetByName('ds1')
+        return sorted(patient.getName() for patient in dataset.getPatients())
+
+    def testInsertPatientMany(self):
+        names = ['p{}'.format(i) for i in range(1200)]
+        self._repo.insertPatientMany(
+            [clinMetadata.Patient(self._dataset, name) for name in names])
+        self.assertEqual(self._readPatientNames(), sorted(names))
+
+    def testDuplicateRejectsBatch(self):
+        self._repo.insertPatient(clinMetadata.Patient(self._dataset, 'p1'))
+        patients = [
+            clinMetadata.Patient(self._dataset, name)
+            for name in ('p0', 'p1', 'p2')]
+        with self.assertRaises(exceptions.DuplicateNameException):
+            self._repo.insertPatientMany(patients)
+        self.assertEqual(self._readPatientNames(), ['p1'])
+
+    def testIntegrityErrorNamesDuplicate(self):
+        self._repo.insertPatient(clinMetadata.Patient(self._dataset, 'p1'))
+        patients = (
+            clinMetadata.Patient(self._dataset, name)
+            for name in ('p0', 'p1', 'p2'))
+        # Let the batch past the pre-check, so the insert itself fails
+        findDuplicate = self._repo._findDuplicate
+        with mock.patch.object(
+                self._repo, '_findDuplicate',
+                side_effect=[None, mock.DEFAULT], wraps=findDuplicate):
+            with self.assertRaises(exceptions.DuplicateNameException) as cm:
+                self._repo.insertPatientMany(patients)
+        self.assertIn("'p1'", str(cm.exception))
+        self.assertEqual(self._readPatientNames(), ['p1'])
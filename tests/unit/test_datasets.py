@@ -5,6 +5,7 @@ Tests the datasets module
 import unittest
 
 import candig.metadata.datamodel.datasets as datasets
+import candig.metadata.datamodel.clinical_metadata as clinMetadata
 
 
 class TestDatasets(unittest.TestCase):
@@ -20,3 +21,21 @@ class TestDatasets(unittest.TestCase):
         self.assertEqual(
             gaDataset.attributes.attr['test'].values[0].string_value, "test")
         self.assertEqual(dataset.getId(), gaDataset.id)
+
+    def testAddPatientMany(self):
+        dataset = datasets.Dataset('ds1')
+        patients = [
+            clinMetadata.Patient(dataset, name) for name in ('p1', 'p2')]
+        dataset.addPatientMany(patients)
+        self.assertEqual(dataset.getPatients(), patients)
+        for patient in patients:
+            self.assertIs(dataset.getPatient(patient.getId()), patient)
+            self.assertIs(
+                dataset.getPatientByName(patient.getName()), patient)
+
+    def testGetIdIsCached(self):
+        dataset = datasets.Dataset('ds1')
+        patient = clinMetadata.Patient(dataset, 'p1')
+        patientId = patient.getId()
+        self.assertEqual(patientId, str(patient.getCompoundId()))
+        self.assertIs(patient.getId(), patientId)
@@ -0,0 +1,98 @@
+"""
+Tests the metadata ingest tool
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+import candig.metadata.datarepo as datarepo
+import candig.metadata.exceptions as exceptions
+import candig.metadata.ingest.ingest as ingest
+
+
+class TestIngest(unittest.TestCase):
+    """
+    Tests that ingest adds each table's records in bulk, skipping and
+    reporting the duplicates
+    """
+    def setUp(self):
+        self._dir = tempfile.mkdtemp(prefix="candig_ingest_test")
+        self._repoPath = os.path.join(self._dir, "repo.db")
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def runIngest(self, records):
+        """
+        Ingests the specified clinical records, returning the lines
+        printed.
+        """
+        metadataPath = os.path.join(self._dir, "metadata.json")
+        with open(metadataPath, "w") as metadataFile:
+            json.dump({"clinical_metadata": records}, metadataFile)
+        argv = ["metadata_ingest", self._repoPath, "ds1", metadataPath]
+        output = io.StringIO()
+        with mock.patch("sys.argv", argv), \
+                contextlib.redirect_stdout(output):
+            ingest.main()
+        return output.getvalue().splitlines()
+
+    def runIngestPatients(self, patientIds):
+        return self.runIngest([
+            {"Patient": {"patientId": patientId}} for patientId in patientIds])
+
+    def readPatientNames(self):
+        repo = datarepo.SqlDataRepository(self._repoPath)
+        repo.open(datarepo.MODE_READ)
+        dataset = repo.getDatasetByName("ds1")
+        return sorted(patient.getName() for patient in dataset.getPatients())
+
+    def testSkipsExistingRecords(self):
+        self.runIngestPatients(["p1", "p2"])
+        with mock.patch.object(
+                ingest.CandigRepo, "add_patient",
+                side_effect=AssertionError("per-record fallback used")):
+            output = self.runIngestPatients(["p1", "p3", "p3"])
+        self.assertEqual(output, [
+            "Skipped: Duplicate Patient detected for local name: "
+            "p1 ['patientId']",
+            "Skipped: Duplicate Patient detected for local name: "
+            "p3 ['patientId']",
+        ])
+        self.assertEqual(self.readPatientNames(), ["p1", "p2", "p3"])
+
+    def testFallsBackToRecordAtATime(self):
+        self.runIngestPatients(["p1"])
+        # Miss the duplicate up front, as if another writer had added it
+        # after the check, so that the bulk insert is rejected
+        with mock.patch.object(
+                ingest.CandigRepo, "existing_ids", return_value=set()), \
+                mock.patch.object(
+                    ingest.CandigRepo, "add_patient_many",
+                    side_effect=exceptions.DuplicateNameException("p1")):
+            output = self.runIngestPatients(["p0", "p1", "p2"])
+        self.assertEqual(output, [
+            "Skipped: Duplicate Patient detected for local name: "
+            "p1 ['patientId']",
+        ])
+        self.assertEqual(self.readPatientNames(), ["p0", "p1", "p2"])
+
+    def testSkippedInInputOrder(self):
+        self.runIngestPatients(["p1"])
+        # The enrollments lack their approval dates, so are skipped too
+        messages = self.runIngest([
+            {"Enrollment": {"patientId": "p1"}},
+            {"Patient": {"patientId": "p1"}},
+            {"Enrollment": {"patientId": "p2"}},
+        ])
+        self.assertEqual(len(messages), 3)
+        self.assertTrue(messages[0].startswith("Skipped: Missing"))
+        self.assertTrue(messages[1].startswith("Skipped: Duplicate Patient"))
+        self.assertTrue(messages[2].startswith("Skipped: Missing"))
@@ -0,0 +1,71 @@
+"""
+Tests the proto schema processing script
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+import tests.paths as paths
+
+
+def _loadScript():
+    scriptPath = os.path.join(
+        paths.getProjectRootFilePath(), 'scripts', 'process_proto_schemas.py')
+    spec = importlib.util.spec_from_file_location(
+        'process_proto_schemas', scriptPath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+process_proto_schemas = _loadScript()
+
+
+class TestRemoveFileDescriptors(unittest.TestCase):
+    """
+    Tests the clean-up of protoc's generated pb2 files
+    """
+    def setUp(self):
+        self._dir = tempfile.mkdtemp(prefix="candig_proto_test")
+        self._generator = process_proto_schemas.ProtoBufGenerator('1.0')
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def testRemovesDescriptors(self):
+        pb2Path = os.path.join(self._dir, 'x_pb2.py')
+        with open(pb2Path, 'w') as pb2File:
+            pb2File.write("field(name='a', file=DESCRIPTOR)\n")
+        self._generator.remove_file_descriptors(pb2Path)
+        with open(pb2Path) as pb2File:
+            self.assertEqual(pb2File.read(), "field(name='a')\n")
+
+    def testMissingFile(self):
+        pb2Path = os.path.join(self._dir, 'missing_pb2.py')
+        self._generator.remove_file_descriptors(pb2Path)
+        self.assertFalse(os.path.exists(pb2Path))
+
+
+class TestCompile(unittest.TestCase):
+    """
+    Tests running protoc on a single schema file
+    """
+    def setUp(self):
+        self._dir = tempfile.mkdtemp(prefix="candig_proto_test")
+        self._generator = process_proto_schemas.ProtoBufGenerator('1.0')
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def testProtocFailure(self):
+        schemaPath = self._dir + '/'
+        protoPath = os.path.join(self._dir, 'x.proto')
+        # "false" stands in for a protoc that fails on every file
+        with self.assertRaises(subprocess.CalledProcessError):
+            self._generator._compile(
+                shutil.which('false'), schemaPath, schemaPath, protoPath)
+        self.assertFalse(os.path.exists(os.path.join(self._dir, 'x_pb2.py')))
@@ -20,35 +20,42 @@ class TestGetNameFromPath(unittest.TestCase):
     def testError(self):
         self.assertRaises(ValueError, cli_repomanager.getNameFromPath, "")
 
+    def assertNamesFromPaths(self, expectedNames):
+        for path, name in expectedNames:
+            with self.subTest(path=path):
+                self.assertEqual(cli_repomanager.getNameFromPath(path), name)
+
     def testLocalDirectory(self):
-        self.assertEqual(
-            cli_repomanager.getNameFromPath("no_extension"), "no_extension")
-        self.assertEqual(cli_repomanager.getNameFromPath("x.y"), "x")
-        self.assertEqual(cli_repomanager.getNameFromPath("x.y.z"), "x")
+        self.assertNamesFromPaths([
+            ("no_extension", "no_extension"),
+            ("x.y", "x"),
+            ("x.y.z", "x"),
+        ])
 
     def testFullPaths(self):
-        self.assertEqual(
-            cli_repomanager.getNameFromPath("/no_ext"), "no_ext")
-        self.assertEqual(cli_repomanager.getNameFromPath("/x.y"), "x")
-        self.assertEqual(cli_repomanager.getNameFromPath("/x.y.z"), "x")
-        self.assertEqual(
-            cli_repomanager.getNameFromPath("/a/no_ext"), "no_ext")
-        self.assertEqual(cli_repomanager.getNameFromPath("/a/x.y"), "x")
-        self.assertEqual(cli_repomanager.getNameFromPath("/a/x.y.z"), "x")
+        self.assertNamesFromPaths([
+            ("/no_ext", "no_ext"),
+            ("/x.y", "x"),
+            ("/x.y.z", "x"),
+            ("/a/no_ext", "no_ext"),
+            ("/a/x.y", "x"),
+            ("/a/x.y.z", "x"),
+        ])
 
     def testUrls(self):
-        self.assertEqual(
-            cli_repomanager.getNameFromPath("file:///no_ext"), "no_ext")
-        self.assertEqual(
-            cli_repomanager.getNameFromPath("http://example.com/x.y"), "x")
-        self.assertEqual(
-            cli_repomanager.getNameFromPath("ftp://x.y.z"), "x")
+        self.assertNamesFromPaths([
+            ("file:///no_ext", "no_ext"),
+            ("http://example.com/x.y", "x"),
+            ("ftp://x.y.z", "x"),
+        ])
 
     def testDirectoryName(self):
-        self.assertEqual(cli_repomanager.getNameFromPath("/a/xy"), "xy")
-        self.assertEqual(cli_repomanager.getNameFromPath("/a/xy/"), "xy")
-        self.assertEqual(cli_repomanager.getNameFromPath("xy/"), "xy")
-        self.assertEqual(cli_repomanager.getNameFromPath("xy"), "xy")
+        self.assertNamesFromPaths([
+            ("/a/xy", "xy"),
+            ("/a/xy/", "xy"),
+            ("xy/", "xy"),
+            ("xy", "xy"),
+        ])
 
 
 class AbstractRepoManagerTest(unittest.TestCase):
@@ -56,12 +63,42 @@ class AbstractRepoManagerTest(unittest.TestCase):
     Base class for repo manager tests.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        # Running init is the bulk of each test's setup, so it is done
+        # once and the tests start from a copy of the resulting file
+        cls._initSnapshot = cls.snapshotRepo(["init"])
+
+    @classmethod
+    def snapshotRepo(cls, *cmds):
+        """
+        Returns the contents of a new repo file after running the
+        specified commands, each a list of a subcommand and the arguments
+        that follow the repo's path.
+        """
+        fd, repoPath = tempfile.mkstemp(prefix="candig_repoman_test")
+        os.close(fd)
+        os.unlink(repoPath)
+        try:
+            for subcommand, *args in cmds:
+                cli_repomanager.RepoManager.runCommand(
+                    [subcommand, repoPath] + args)
+            with open(repoPath, "rb") as repoFile:
+                return repoFile.read()
+        finally:
+            os.unlink(repoPath)
+
     def setUp(self):
         fd, self._repoPath = tempfile.mkstemp(prefix="candig_repoman_test")
+        os.close(fd)
         os.unlink(self._repoPath)
 
-    def runCommand(self, cmd):
-        cli_repomanager.RepoManager.runCommand(cmd.split())
+    def runCommand(self, *args):
+        cli_repomanager.RepoManager.runCommand(list(args))
+
+    def restoreRepo(self, snapshot):
+        with open(self._repoPath, "wb") as repoFile:
+            repoFile.write(snapshot)
 
     def tearDown(self):
         os.unlink(self._repoPath)
@@ -72,14 +109,13 @@ class AbstractRepoManagerTest(unittest.TestCase):
         return repo
 
     def init(self):
-        self.runCommand("init {}".format(self._repoPath))
+        self.restoreRepo(self._initSnapshot)
 
     def addDataset(self, datasetName=None):
         if datasetName is None:
             datasetName = "test_dataset"
             self._datasetName = datasetName
-        cmd = "add-dataset {} {}".format(self._repoPath, datasetName)
-        self.runCommand(cmd)
+        self.runCommand("add-dataset", self._repoPath, datasetName)
 
 
 class TestAddDataset(AbstractRepoManagerTest):
@@ -90,17 +126,17 @@ class TestAddDataset(AbstractRepoManagerTest):
 
     def testDefaults(self):
         name = "test_dataset"
-        self.runCommand("add-dataset {} {}".format(self._repoPath, name))
+        self.runCommand("add-dataset", self._repoPath, name)
         repo = self.readRepo()
         dataset = repo.getDatasetByName(name)
         self.assertEqual(dataset.getLocalId(), name)
 
     def testSameName(self):
         name = "test_dataset"
-        cmd = "add-dataset {} {}".format(self._repoPath, name)
-        self.runCommand(cmd)
+        cmd = ["add-dataset", self._repoPath, name]
+        self.runCommand(*cmd)
         self.assertRaises(
-            exceptions.RepoManagerException, self.runCommand, cmd)
+            exceptions.RepoManagerException, self.runCommand, *cmd)
 
 
 class TestRemoveDataset(AbstractRepoManagerTest):
@@ -118,14 +154,14 @@ class TestRemoveDataset(AbstractRepoManagerTest):
             repo.getDatasetByName, self._datasetName)
 
     def testEmptyDatasetForce(self):
-        self.runCommand("remove-dataset {} {} -f".format(
-            self._repoPath, self._datasetName))
+        self.runCommand(
+            "remove-dataset", self._repoPath, self._datasetName, "-f")
         self.assertDatasetRemoved()
 
     def testContainsReadGroupSet(self):
         self.addReadGroupSet()
-        self.runCommand("remove-dataset {} {} -f".format(
-            self._repoPath, self._datasetName))
+        self.runCommand(
+            "remove-dataset", self._repoPath, self._datasetName, "-f")
         self.assertDatasetRemoved()
 
 
@@ -137,8 +173,7 @@ class TestVerify(AbstractRepoManagerTest):
     def testVerify(self):
         self.init()
         self.addDataset()
-        cmd = "verify {}".format(self._repoPath)
-        self.runCommand(cmd)
+        self.runCommand("verify", self._repoPath)
 
 
 class TestDuplicateNameDelete(AbstractRepoManagerTest):
@@ -147,13 +182,17 @@ class TestDuplicateNameDelete(AbstractRepoManagerTest):
     ensure that only one is deleted on a delete call
     """
 
+    @classmethod
+    def setUpClass(cls):
+        super(TestDuplicateNameDelete, cls).setUpClass()
+        cls._twoDatasetSnapshot = cls.snapshotRepo(
+            ["init"], ["add-dataset", "dataset1"], ["add-dataset", "dataset2"])
+
     def setUp(self):
         super(TestDuplicateNameDelete, self).setUp()
-        self.init()
         self.dataset1Name = "dataset1"
         self.dataset2Name = "dataset2"
-        self.addDataset(self.dataset1Name)
-        self.addDataset(self.dataset2Name)
+        self.restoreRepo(self._twoDatasetSnapshot)
 
     def readDatasets(self):
         repo = self.readRepo()